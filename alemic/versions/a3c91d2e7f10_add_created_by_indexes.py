@@ -0,0 +1,31 @@
+"""Add created_by indexes to places and routes
+
+Revision ID: a3c91d2e7f10
+Revises: 5ee6b9778050
+Create Date: 2025-11-02 14:10:05.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c91d2e7f10'
+down_revision: Union[str, Sequence[str], None] = '5ee6b9778050'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 사용자별 '담아요' 합계 서브쿼리가 인덱스를 타도록 created_by 인덱스를 추가
+    op.create_index('ix_places_created_by', 'places', ['created_by'], unique=False)
+    op.create_index('ix_routes_created_by', 'routes', ['created_by'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_routes_created_by', table_name='routes')
+    op.drop_index('ix_places_created_by', table_name='places')
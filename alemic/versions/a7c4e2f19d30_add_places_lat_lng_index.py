@@ -0,0 +1,28 @@
+"""Add latitude/longitude index to places for nearby lookups
+
+Revision ID: a7c4e2f19d30
+Revises: f3b8d2a61c94
+Create Date: 2025-11-12 11:08:36.540127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c4e2f19d30'
+down_revision: Union[str, Sequence[str], None] = 'f3b8d2a61c94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_places_latitude_longitude', 'places', ['latitude', 'longitude'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_places_latitude_longitude', table_name='places')
@@ -0,0 +1,29 @@
+"""Add index on users.ranking
+
+Revision ID: b7e4f0a19c32
+Revises: a3c91d2e7f10
+Create Date: 2025-11-03 10:42:51.730915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e4f0a19c32'
+down_revision: Union[str, Sequence[str], None] = 'a3c91d2e7f10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 베스트 유저 조회(ranking ASC LIMIT n)와 랭킹 대상 수 집계용 인덱스
+    op.create_index('ix_users_ranking', 'users', ['ranking'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_ranking', table_name='users')
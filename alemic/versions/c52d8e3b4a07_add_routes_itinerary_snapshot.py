@@ -0,0 +1,60 @@
+"""Add itinerary snapshot column to routes
+
+Revision ID: c52d8e3b4a07
+Revises: b7e4f0a19c32
+Create Date: 2025-11-04 16:05:12.904417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c52d8e3b4a07'
+down_revision: Union[str, Sequence[str], None] = 'b7e4f0a19c32'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('routes', sa.Column('itinerary', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+
+    # 기존 루트의 스냅샷 채우기 (app.services.itinerary.itinerary_from_place_maps 와 동일한 규칙)
+    op.execute("""
+        UPDATE routes r
+        SET itinerary = jsonb_build_object(
+            'places', COALESCE((
+                SELECT jsonb_agg(
+                    jsonb_build_object('id', p.place_id, 'name', p.name, 'category', p.type, 'day', m.day, 'order', m."order")
+                    ORDER BY m.day, m."order", m.id
+                )
+                FROM route_place_maps m
+                JOIN places p ON p.place_id = m.place_id
+                WHERE m.route_id = r.route_id
+            ), '[]'::jsonb),
+            'transportations', COALESCE((
+                SELECT jsonb_agg(
+                    jsonb_build_object('id', t.rn, 'name', t.transportation, 'day', t.day, 'order', t."order")
+                    ORDER BY t.rn
+                )
+                FROM (
+                    SELECT d.*, row_number() OVER (ORDER BY d.day, d."order") AS rn
+                    FROM (
+                        SELECT DISTINCT ON (m.day, m."order") m.transportation, m.day, m."order"
+                        FROM route_place_maps m
+                        WHERE m.route_id = r.route_id AND m.transportation IS NOT NULL AND m.transportation <> ''
+                        ORDER BY m.day, m."order", m.id
+                    ) d
+                ) t
+            ), '[]'::jsonb)
+        )
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('routes', 'itinerary')
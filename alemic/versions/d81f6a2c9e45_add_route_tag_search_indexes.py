@@ -0,0 +1,40 @@
+"""Add indexes for tag-based route search
+
+Revision ID: d81f6a2c9e45
+Revises: c52d8e3b4a07
+Create Date: 2025-11-05 11:27:40.662013
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd81f6a2c9e45'
+down_revision: Union[str, Sequence[str], None] = 'c52d8e3b4a07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 가장 흔한 조합(환경+동행)은 복합 인덱스로 정렬(route_id DESC)까지 처리
+    op.create_index('ix_routes_tag_env_tag_with_route_id', 'routes', ['tag_env', 'tag_with', 'route_id'], unique=False)
+    # 나머지 조합은 단일 컬럼 인덱스를 BitmapAnd로 결합
+    op.create_index('ix_routes_tag_period', 'routes', ['tag_period'], unique=False)
+    op.create_index('ix_routes_tag_with', 'routes', ['tag_with'], unique=False)
+    op.create_index('ix_routes_tag_move', 'routes', ['tag_move'], unique=False)
+    op.create_index('ix_routes_tag_atmosphere', 'routes', ['tag_atmosphere'], unique=False)
+    op.create_index('ix_routes_tag_place_count', 'routes', ['tag_place_count'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_routes_tag_place_count', table_name='routes')
+    op.drop_index('ix_routes_tag_atmosphere', table_name='routes')
+    op.drop_index('ix_routes_tag_move', table_name='routes')
+    op.drop_index('ix_routes_tag_with', table_name='routes')
+    op.drop_index('ix_routes_tag_period', table_name='routes')
+    op.drop_index('ix_routes_tag_env_tag_with_route_id', table_name='routes')
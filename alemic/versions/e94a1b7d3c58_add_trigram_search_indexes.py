@@ -0,0 +1,54 @@
+"""Add jamo name columns and trigram indexes for local search
+
+Revision ID: e94a1b7d3c58
+Revises: d81f6a2c9e45
+Create Date: 2025-11-06 18:33:09.251876
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e94a1b7d3c58'
+down_revision: Union[str, Sequence[str], None] = 'd81f6a2c9e45'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+
+    op.add_column('places', sa.Column('name_jamo', sa.String(length=1000), nullable=True))
+    op.add_column('routes', sa.Column('name_jamo', sa.String(length=1000), nullable=True))
+    # app.utils.hangul.decompose_jamo 와 동일한 NFD 분해로 기존 데이터 백필
+    op.execute("UPDATE places SET name_jamo = normalize(name, NFD)")
+    op.execute("UPDATE routes SET name_jamo = normalize(name, NFD)")
+
+    op.create_index('ix_places_name_trgm', 'places', ['name'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_places_name_jamo_trgm', 'places', ['name_jamo'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'name_jamo': 'gin_trgm_ops'})
+    op.create_index('ix_places_intro_trgm', 'places', ['intro'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'intro': 'gin_trgm_ops'})
+    op.create_index('ix_places_address_name_trgm', 'places', ['address_name'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'address_name': 'gin_trgm_ops'})
+    op.create_index('ix_routes_name_trgm', 'routes', ['name'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_routes_name_jamo_trgm', 'routes', ['name_jamo'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'name_jamo': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_routes_name_jamo_trgm', table_name='routes')
+    op.drop_index('ix_routes_name_trgm', table_name='routes')
+    op.drop_index('ix_places_address_name_trgm', table_name='places')
+    op.drop_index('ix_places_intro_trgm', table_name='places')
+    op.drop_index('ix_places_name_jamo_trgm', table_name='places')
+    op.drop_index('ix_places_name_trgm', table_name='places')
+    op.drop_column('routes', 'name_jamo')
+    op.drop_column('places', 'name_jamo')
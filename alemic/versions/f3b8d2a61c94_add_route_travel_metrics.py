@@ -0,0 +1,80 @@
+"""Add travel distance/time metrics to routes
+
+Revision ID: f3b8d2a61c94
+Revises: e94a1b7d3c58
+Create Date: 2025-11-10 14:21:47.318205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b8d2a61c94'
+down_revision: Union[str, Sequence[str], None] = 'e94a1b7d3c58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('routes', sa.Column('total_distance_km', sa.Float(), nullable=True))
+    op.add_column('routes', sa.Column('travel_minutes', sa.Integer(), nullable=True))
+    op.add_column('routes', sa.Column('day_metrics', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.create_index('ix_routes_total_distance_km', 'routes', ['total_distance_km'], unique=False)
+
+    # 기존 루트의 지표 채우기 (app.services.route_metrics.compute_route_metrics 와 동일한 규칙:
+    # 하루 일정의 연속한 장소 사이 대권 거리 합, 이동 시간 = 거리 * 1.3 / tag_move 별 속도)
+    # 이후 재계산은 scripts/recompute_route_metrics.py
+    op.execute("""
+        WITH stops AS (
+            SELECT m.route_id, m.day, p.latitude AS lat, p.longitude AS lng,
+                   lag(p.latitude) OVER w AS prev_lat, lag(p.longitude) OVER w AS prev_lng
+            FROM route_place_maps m
+            JOIN places p ON p.place_id = m.place_id
+            WINDOW w AS (PARTITION BY m.route_id, m.day ORDER BY m."order", m.id)
+        ),
+        days AS (
+            SELECT s.route_id, s.day,
+                   COALESCE(SUM(2 * 6371.0088 * asin(sqrt(least(1.0,
+                       power(sin(radians(s.lat - s.prev_lat) / 2), 2)
+                       + cos(radians(s.prev_lat)) * cos(radians(s.lat)) * power(sin(radians(s.lng - s.prev_lng) / 2), 2)
+                   )))), 0) AS km,
+                   CASE r.tag_move
+                       WHEN 'walk' THEN 4.0 WHEN 'bicycle' THEN 12.0 WHEN 'car' THEN 35.0
+                       WHEN 'public' THEN 20.0 WHEN 'train' THEN 45.0 ELSE 20.0
+                   END AS speed
+            FROM stops s
+            JOIN routes r ON r.route_id = s.route_id
+            GROUP BY s.route_id, s.day, r.tag_move
+        ),
+        totals AS (
+            SELECT route_id,
+                   round(SUM(km)::numeric, 2)::float AS total_distance_km,
+                   round(SUM(km * 1.3 / speed * 60)::numeric)::int AS travel_minutes,
+                   jsonb_agg(jsonb_build_object(
+                       'day', day,
+                       'distance_km', round(km::numeric, 2),
+                       'travel_minutes', round((km * 1.3 / speed * 60)::numeric)::int
+                   ) ORDER BY day) AS day_metrics
+            FROM days
+            GROUP BY route_id
+        )
+        UPDATE routes r
+        SET total_distance_km = t.total_distance_km,
+            travel_minutes = t.travel_minutes,
+            day_metrics = t.day_metrics
+        FROM totals t
+        WHERE r.route_id = t.route_id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_routes_total_distance_km', table_name='routes')
+    op.drop_column('routes', 'day_metrics')
+    op.drop_column('routes', 'travel_minutes')
+    op.drop_column('routes', 'total_distance_km')
@@ -1,16 +1,19 @@
 # app/api/v1/endpoints/favorites.py
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from app.core.database import get_db
+from app.core.read_replicas import get_read_db
 from app.schemas.favorite import (
     FavoritePlaceCreate, FavoriteRouteCreate,
     FavoritePlaceOut, FavoriteRouteOut,
+    FavoriteBatchIn, FavoriteBatchOut,
 )
 from app.crud import favorite as crud_fav
 from app.models import User
 from app.utils.security import get_current_user, get_optional_current_user
 from app.api.v1.endpoints.routes import to_loco_route
+from app.api.v1.endpoints.places import to_place_out
 from app.crud import place as crud_place
 from app.schemas.place import PlaceOut
 from app.schemas.route import RouteOut
@@ -27,14 +30,64 @@ def add_fav_place(body: FavoritePlaceCreate, db: Session = Depends(get_db), curr
 def add_fav_route(body: FavoriteRouteCreate, db: Session = Depends(get_db), current: User = Depends(get_current_user)):
     return crud_fav.add_favorite_route(db, current.id, body.route_id)
 
+@router.post("/batch", response_model=FavoriteBatchOut, summary="찜 일괄 추가/삭제 (오프라인 동기화)")
+def sync_favorites(body: FavoriteBatchIn, db: Session = Depends(get_db), current: User = Depends(get_current_user)):
+    # 없는 id는 건너뛰고 이미 반영된 변경은 무시하므로 재시도해도 안전합니다.
+    place_ids, route_ids = crud_fav.sync_favorites(
+        db, current.id,
+        add_place_ids=body.add_place_ids,
+        remove_place_ids=body.remove_place_ids,
+        add_route_ids=body.add_route_ids,
+        remove_route_ids=body.remove_route_ids,
+    )
+    return FavoriteBatchOut(place_ids=place_ids.tolist(), route_ids=route_ids.tolist())
+
+@router.get("/places/ids", response_model=List[int], summary="찜한 장소 ID 목록 조회")
+def get_my_favorite_place_ids(
+    current_user: User = Depends(get_optional_current_user),
+    db: Session = Depends(get_db),
+):
+    if not current_user:
+        return []
+    return crud_fav.get_favorite_place_ids(db, current_user.id).tolist()
+
+@router.get("/routes/ids", response_model=List[int], summary="찜한 루트 ID 목록 조회")
+def get_my_favorite_route_ids(
+    current_user: User = Depends(get_optional_current_user),
+    db: Session = Depends(get_db),
+):
+    if not current_user:
+        return []
+    return crud_fav.get_favorite_route_ids(db, current_user.id).tolist()
+
 # NEW: list my favorites
 @router.get("/places/{user_id}", response_model=List[FavoritePlaceOut])
-def list_my_fav_places(user_id: int, db: Session = Depends(get_db)):
-    return crud_fav.list_my_favorite_places(db, user_id)
+def list_my_fav_places(
+    user_id: int,
+    db: Session = Depends(get_read_db),
+    limit: int = Query(50, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+):
+    favorite_places = crud_fav.list_my_favorite_places(db, user_id, limit=limit, offset=offset)
+    return [
+        FavoritePlaceOut(
+            id=fav_place.id,
+            user_id=fav_place.user_id,
+            place_id=fav_place.place_id,
+            created_at=fav_place.created_at,
+            place=to_place_out(fav_place.place) if fav_place.place else None,
+        )
+        for fav_place in favorite_places
+    ]
 
 @router.get("/routes/{user_id}", response_model=List[FavoriteRouteOut])
-def list_my_fav_routes(user_id: int, db: Session = Depends(get_db)):
-    favorite_routes = crud_fav.list_my_favorite_routes(db, user_id)
+def list_my_fav_routes(
+    user_id: int,
+    db: Session = Depends(get_read_db),
+    limit: int = Query(50, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+):
+    favorite_routes = crud_fav.list_my_favorite_routes(db, user_id, limit=limit, offset=offset)
     
     response = []
     for fav_route in favorite_routes:
@@ -64,17 +117,6 @@ def remove_fav_route(route_id: int, db: Session = Depends(get_db), current: User
     return None
 
 
-@router.get("/places/ids", summary="찜한 장소 ID 목록 조회")
-def get_my_favorite_place_ids(
-    current_user: User = Depends(get_optional_current_user),
-    db: Session = Depends(get_db),
-):
-    if not current_user:
-        return []
-    favorites = crud_fav.list_my_favorite_places(db, current_user.id)
-    return [fav.place_id for fav in favorites]
-
-
 @router.get(
     "/places",
     response_model=List[PlaceOut],
@@ -83,6 +125,8 @@ def get_my_favorite_place_ids(
 def get_my_favorite_places(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
+    limit: int = Query(50, ge=1, le=100),
+    offset: int = Query(0, ge=0),
 ):
-    favorites = crud_fav.list_my_favorite_places(db, current_user.id)
-    return [fav.place for fav in favorites]
\ No newline at end of file
+    favorites = crud_fav.list_my_favorite_places(db, current_user.id, limit=limit, offset=offset)
+    return [to_place_out(fav.place) for fav in favorites if fav.place]
\ No newline at end of file
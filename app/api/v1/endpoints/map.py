@@ -1,21 +1,23 @@
 # app/api/v1/endpoints/map.py
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.read_replicas import get_read_db
 from app.crud import place as crud_place
 from app.crud.user import crud_user
 from app.crud.favorite import list_my_favorite_places
 from app.schemas.place import PlaceOut
+from app.api.v1.endpoints.places import to_place_out
 from app.utils.security import get_current_user
 
 
 router = APIRouter(prefix="/map", tags=["map"])
 
 @router.get("/places", response_model=List[PlaceOut])
-def read_places_for_map(db: Session = Depends(get_db)):
+def read_places_for_map(db: Session = Depends(get_read_db)):
     places = crud_place.list_all(db)
     return places
 
@@ -25,9 +27,15 @@ def read_places_for_map(db: Session = Depends(get_db)):
     response_model=List[PlaceOut],
     summary="특정 유저가 찜한 장소 목록",
 )
-def get_user_favorite_places(user_id: int, db: Session = Depends(get_db)):
+def get_user_favorite_places(
+    user_id: int,
+    db: Session = Depends(get_read_db),
+    limit: Optional[int] = Query(None, ge=1, description="생략하면 전체 (지도에 모두 표시)"),
+    offset: int = Query(0, ge=0),
+):
     """
-    주어진 user_id를 가진 유저가 찜한 장소 목록을 반환합니다.
+    주어진 user_id를 가진 유저가 찜한 장소 목록을 반환합니다. (최근 찜한 순)
+    지도는 전체를 표시하므로 기본은 전체이고, limit/offset 을 주면 페이지 단위로 반환합니다.
     """
-    favorites = list_my_favorite_places(db, user_id=user_id)
-    return [fav.place for fav in favorites]
\ No newline at end of file
+    favorites = list_my_favorite_places(db, user_id=user_id, limit=limit, offset=offset)
+    return [to_place_out(fav.place) for fav in favorites if fav.place]
\ No newline at end of file
@@ -1,17 +1,22 @@
 # app/api/v1/endpoints/places.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from app.core.database import get_db
-from app.schemas.place import PlaceCreate, PlaceOut, PlaceExploreOut, PlaceSearchResult
+from app.core.read_replicas import get_read_db
+from app.core.responses import PydanticJSONResponse
+from app.schemas.place import PlaceCreate, PlaceOut, PlaceExploreOut, PlaceSearchResult, PlaceImportIn, PlaceImportOut, NearbyPlaceOut
 from app.crud import place as crud_place
+from app.crud import favorite as crud_fav
 from app.models import User, Place # Place 모델 추가
-from app.utils.security import get_current_user
+from app.utils.security import get_current_user, get_optional_current_user
+from app.services.favorite_cache import FavoriteIds
+from app.services.nearby import bounding_box, nearby_from_rows, nearby_index
 
 router = APIRouter(prefix="/places", tags=["places"])
 
 # Place 모델 객체를 PlaceOut 스키마로 변환하는 헬퍼 함수
-def to_place_out(place: Place) -> PlaceOut:
+def to_place_out(place: Place, favorite_ids: Optional[FavoriteIds] = None) -> PlaceOut:
     return PlaceOut(
         place_id=place.place_id,
         name=place.name,
@@ -34,10 +39,11 @@ def to_place_out(place: Place) -> PlaceOut:
         liked=place.count_real,  # '진짜예요' 투표 수를 liked로 설정
         user_id=place.created_by,
         city_name=place.creator.city.kor_name if place.creator and place.creator.city else None,
+        is_favorite=place.place_id in favorite_ids if favorite_ids is not None else None,
     )
 
-# Place 모델 객체를 PlaceSearchResult 스키마로 변환하는 헬퍼 함수
-def to_place_search_result(place: Place) -> PlaceSearchResult:
+# Place 모델 객체(또는 crud.place.PLACE_CARD_COLUMNS Row)를 PlaceSearchResult 스키마로 변환하는 헬퍼 함수
+def to_place_search_result(place: Place, favorite_ids: Optional[FavoriteIds] = None) -> PlaceSearchResult:
     return PlaceSearchResult(
         member_id=place.created_by,
         place_id=place.place_id,
@@ -45,21 +51,29 @@ def to_place_search_result(place: Place) -> PlaceSearchResult:
         image_url=place.image_url,
         liked=place.count_real,
         short_location=place.short_location,
-        intro=place.intro
+        intro=place.intro,
+        is_favorite=place.place_id in favorite_ids if favorite_ids is not None else None,
     )
 
+def favorite_place_ids(
+    current: Optional[User] = Depends(get_optional_current_user),
+    db: Session = Depends(get_db),
+) -> Optional[FavoriteIds]:
+    """로그인한 사용자의 찜한 장소 id 집합 (비로그인 시 None). 목록 전체에 대해 한 번만 조회합니다."""
+    return crud_fav.get_favorite_place_ids(db, current.id) if current else None
+
 @router.get("/explore", response_model=PlaceExploreOut, summary="장소 탐색 페이지 데이터 조회")
-def get_place_explore(db: Session = Depends(get_db)):
+def get_place_explore(db: Session = Depends(get_read_db), favorite_ids: Optional[FavoriteIds] = Depends(favorite_place_ids)):
     ranked_places_db = crud_place.get_ranked_places(db, limit=25)
     new_places_db = crud_place.get_new_places(db, limit=25)
 
-    ranked_places = [to_place_search_result(p) for p in ranked_places_db]
-    new_places = [to_place_search_result(p) for p in new_places_db]
+    ranked_places = [to_place_search_result(p, favorite_ids) for p in ranked_places_db]
+    new_places = [to_place_search_result(p, favorite_ids) for p in new_places_db]
 
-    return PlaceExploreOut(
+    return PydanticJSONResponse(PlaceExploreOut(
         ranked_places=ranked_places,
         new_places=new_places
-    )
+    ))
 
 @router.post("", response_model=PlaceOut)
 def create_place(body: PlaceCreate, db: Session = Depends(get_db), current: User = Depends(get_current_user)):
@@ -67,24 +81,62 @@ def create_place(body: PlaceCreate, db: Session = Depends(get_db), current: User
     db.refresh(place, attribute_names=['creator']) # creator 관계를 리프레시
     return to_place_out(place)
 
+@router.post("/import", response_model=PlaceImportOut, summary="카카오 검색 결과 장소 일괄 등록")
+def import_places(body: PlaceImportIn, db: Session = Depends(get_db), current: User = Depends(get_current_user)):
+    # 같은 kakao_place_id 는 다시 등록되지 않으므로 재시도해도 안전합니다.
+    inserted, existing = crud_place.import_kakao_places(db, user_id=current.id, docs=body.documents)
+    return PlaceImportOut(inserted=inserted, existing=existing)
+
 @router.get("", response_model=List[PlaceOut])
-def list_places(db: Session = Depends(get_db)):
+def list_places(db: Session = Depends(get_read_db), favorite_ids: Optional[FavoriteIds] = Depends(favorite_place_ids)):
     places_db = crud_place.list_all(db)
-    return [to_place_out(p) for p in places_db]
+    return PydanticJSONResponse([to_place_out(p, favorite_ids) for p in places_db])
 
 @router.get("/{place_id}", response_model=PlaceOut, summary="장소 상세 조회")
-def read_place_detail(place_id: int, db: Session = Depends(get_db)):
+def read_place_detail(place_id: int, db: Session = Depends(get_read_db), favorite_ids: Optional[FavoriteIds] = Depends(favorite_place_ids)):
     obj = crud_place.get_by_id(db, place_id)
     if not obj:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Place not found")
     else:
-        return to_place_out(obj)
+        return to_place_out(obj, favorite_ids)
+
+@router.get("/{place_id}/nearby", response_model=List[NearbyPlaceOut], summary="근처 장소 추천")
+def list_nearby_places(
+    place_id: int,
+    radius_km: float = Query(3.0, gt=0, le=20, description="검색 반경 (km)"),
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_read_db),
+    favorite_ids: Optional[FavoriteIds] = Depends(favorite_place_ids),
+):
+    """반경 안의 장소를 거리와 Wilson score 를 섞은 점수순으로 반환합니다. (기준 장소 제외)"""
+    origin = crud_place.get_coordinates(db, [place_id]).get(place_id)
+    if origin is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Place not found")
+    latitude, longitude = origin
+
+    if nearby_index.ready:
+        nearby_index.refresh_if_stale(db)
+        ranked = nearby_index.nearby(latitude, longitude, radius_km, limit, exclude=place_id)
+    else:
+        # 인덱스 빌드 전에는 위경도 범위 조회로 대체
+        rows = crud_place.get_in_bounding_box(db, *bounding_box(latitude, longitude, radius_km))
+        ranked = nearby_from_rows(latitude, longitude, rows, radius_km, limit, exclude=place_id)
+
+    places_db = crud_place.get_cards_by_ids(db, [nearby_id for nearby_id, _ in ranked])
+    distances = dict(ranked)
+    return PydanticJSONResponse([
+        NearbyPlaceOut(
+            **to_place_search_result(p, favorite_ids).model_dump(),
+            distance_km=round(distances[p.place_id], 2),
+        )
+        for p in places_db
+    ])
 
 @router.get("/by-user/{user_id}", response_model=List[PlaceOut], summary="특정 사용자가 생성한 장소 목록 조회")
-def list_places_by_user(user_id: int, db: Session = Depends(get_db)):
+def list_places_by_user(user_id: int, db: Session = Depends(get_read_db), favorite_ids: Optional[FavoriteIds] = Depends(favorite_place_ids)):
     places_db = crud_place.get_by_user_id(db, user_id=user_id)
     if not places_db:
         # 사용자가 없거나 장소를 생성하지 않은 경우 빈 리스트를 반환하는 것이 일반적입니다.
         # 만약 사용자가 없는 경우 404를 반환하고 싶다면 별도의 사용자 확인 로직이 필요합니다.
         return []
-    return [to_place_out(p) for p in places_db]
\ No newline at end of file
+    return PydanticJSONResponse([to_place_out(p, favorite_ids) for p in places_db])
\ No newline at end of file
@@ -3,6 +3,7 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session, joinedload
 from app.core.database import get_db
+from app.core.read_replicas import get_read_db
 from app.schemas.qna import QuestionCreate, QuestionOut, AnswerCreate, AnswerOut
 from app.crud import qna as crud_qna
 from app.models import User, Question, Answer
@@ -18,7 +19,7 @@ def create_question(body: QuestionCreate, db: Session = Depends(get_db), current
     return question
 
 @router.get("/questions", response_model=List[QuestionOut])
-def list_questions(db: Session = Depends(get_db)):
+def list_questions(db: Session = Depends(get_read_db)):
     # crud_qna.list_questions()는 관계를 로드하지 않으므로, 여기서 직접 쿼리합니다.
     questions = db.query(Question).options(
         joinedload(Question.author),
@@ -36,7 +37,7 @@ def list_questions(db: Session = Depends(get_db)):
     return questions
 
 @router.get("/questions/{question_id}", response_model=QuestionOut)
-def read_question(question_id: int, db: Session = Depends(get_db)):
+def read_question(question_id: int, db: Session = Depends(get_read_db)):
     q = db.query(Question).options(
         joinedload(Question.author),
         joinedload(Question.answers).joinedload(Answer.author)
@@ -1,46 +1,29 @@
 # app/api/v1/endpoints/routes.py
+from collections import Counter
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional
 from app.core.database import get_db
-from app.schemas.route import RouteCreate, RouteOut, RouteExploreOut, HashTag, RoutePlace, Transportation, LocoRoute
+from app.core.read_replicas import get_read_db
+from app.core.responses import PydanticJSONResponse
+from app.schemas.route import RouteCreate, RouteOut, RouteExploreOut, HashTag, RoutePlace, Transportation, LocoRoute, RouteBatchCreate, RouteBatchCreateOut, RouteFacetSearchOut, RouteOptimizeIn, RouteOptimizeOut
 from app.crud import route as crud_route
+from app.crud import place as crud_place
+from app.crud import favorite as crud_fav
 from app.models import User, Route, RoutePlaceMap, Place, RegionCity
-from app.utils.security import get_current_user
+from app.utils.security import get_current_user, get_optional_current_user
+from app.services.itinerary import itinerary_from_place_maps
+from app.services.route_facets import route_facet_index
+from app.services.route_optimizer import MAX_STOPS_PER_DAY, optimize_places
+from app.services.favorite_cache import FavoriteIds
 
 router = APIRouter(prefix="/routes", tags=["routes"])
 
 
-def to_loco_route(route: "Route") -> LocoRoute:
-    # places 및 transportations 정보 가공
-    places_schema = []
-    transportations_schema = []
-    
-    # day와 order로 정렬
-    sorted_places = sorted(route.places, key=lambda p: (p.day, p.order))
-    
-    for p_map in sorted_places:
-        # RoutePlace 스키마 생성
-        if p_map.place: # 장소 정보가 있는 경우에만 처리
-            places_schema.append(RoutePlace(
-                id=p_map.place.place_id,
-                name=p_map.place.name,
-                category=p_map.place.type,
-                day=p_map.day,
-                order=p_map.order
-            ))
-        
-        # Transportation 스키마 생성 (중복 제거 로직 포함)
-        if p_map.transportation:
-            # 같은 day, order를 가진 transportation이 이미 있는지 확인
-            exists = any(t.day == p_map.day and t.order == p_map.order for t in transportations_schema)
-            if not exists:
-                transportations_schema.append(Transportation(
-                    id=len(transportations_schema) + 1, # 임시 ID
-                    name=p_map.transportation,
-                    day=p_map.day,
-                    order=p_map.order
-                ))
+def to_loco_route(route: "Route", favorite_ids: Optional[FavoriteIds] = None) -> LocoRoute:
+    # route: Route 엔티티 또는 crud.route.ROUTE_CARD_COLUMNS 로 조회한 Row (목록 조회)
+    # 생성 시 저장한 일정 스냅샷을 그대로 사용 (스냅샷이 없는 기존 루트만 places에서 생성)
+    itinerary = route.itinerary or itinerary_from_place_maps(route.places)
 
     # 태그 정보 가공
     tag_data = {
@@ -51,7 +34,7 @@ def to_loco_route(route: "Route") -> LocoRoute:
         "atmosphere": str(route.tag_atmosphere or ''),
         "place_count": str(route.tag_place_count or '')
     }
-    tags_schema = HashTag.model_validate(tag_data)
+    tags_schema = HashTag(**tag_data)
 
     return LocoRoute(
         user_id=route.created_by,
@@ -62,27 +45,39 @@ def to_loco_route(route: "Route") -> LocoRoute:
         intro=route.intro,
         liked=route.count_real,  # TODO: 'liked' 필드를 즐겨찾기 수로 변경해야 함
         tags=tags_schema,
-        places=places_schema,
-        transportations=transportations_schema,
+        places=itinerary["places"],
+        transportations=itinerary["transportations"],
         count_real=route.count_real,
         count_soso=route.count_soso,
         count_bad=route.count_bad,
         created_at=route.created_at,
+        is_favorite=route.route_id in favorite_ids if favorite_ids is not None else None,
+        total_distance_km=route.total_distance_km,
+        travel_minutes=route.travel_minutes,
+        day_metrics=route.day_metrics,
     )
 
 
+def favorite_route_ids(
+    current: Optional[User] = Depends(get_optional_current_user),
+    db: Session = Depends(get_db),
+) -> Optional[FavoriteIds]:
+    """로그인한 사용자의 찜한 루트 id 집합 (비로그인 시 None). 목록 전체에 대해 한 번만 조회합니다."""
+    return crud_fav.get_favorite_route_ids(db, current.id) if current else None
+
+
 @router.get("/explore", response_model=RouteExploreOut, summary="루트 탐색 페이지 데이터 조회")
-def get_route_explore(db: Session = Depends(get_db)):
+def get_route_explore(db: Session = Depends(get_read_db), favorite_ids: Optional[FavoriteIds] = Depends(favorite_route_ids)):
     ranked_routes_db = crud_route.get_ranked_routes(db, limit=25)
     new_routes_db = crud_route.get_new_routes(db, limit=25)
     
-    ranked_routes = [to_loco_route(r) for r in ranked_routes_db]
-    new_routes = [to_loco_route(r) for r in new_routes_db]
+    ranked_routes = [to_loco_route(r, favorite_ids) for r in ranked_routes_db]
+    new_routes = [to_loco_route(r, favorite_ids) for r in new_routes_db]
     
-    return RouteExploreOut(
+    return PydanticJSONResponse(RouteExploreOut(
         ranked_routes=ranked_routes,
         new_routes=new_routes
-    )
+    ))
 
 
 @router.post("", status_code=status.HTTP_201_CREATED)
@@ -97,46 +92,122 @@ def create_route(body: RouteCreate, db: Session = Depends(get_db), current: User
         )
 
 
+@router.post("/batch", response_model=RouteBatchCreateOut, status_code=status.HTTP_201_CREATED, summary="여러 경로 일괄 생성")
+def create_routes_batch(body: RouteBatchCreate, db: Session = Depends(get_db), current: User = Depends(get_current_user)):
+    try:
+        routes = crud_route.create_many(db, user_id=current.id, objs_in=body.routes)
+        return RouteBatchCreateOut(route_ids=[r.route_id for r in routes])
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An error occurred: {str(e)}"
+        )
+
+
+@router.post("/optimize", response_model=RouteOptimizeOut, summary="일정 방문 순서 최적화")
+def optimize_route(body: RouteOptimizeIn, db: Session = Depends(get_read_db), current: User = Depends(get_current_user)):
+    """
+    날마다 장소 방문 순서를 이동 거리가 짧아지도록 다시 정렬합니다. (nearest-neighbour + 2-opt)
+    저장하지 않고 결과만 반환하므로, 반환된 places 로 POST /routes 를 호출하면 됩니다.
+    이동수단(transportations)은 (day, order) 자리를 그대로 유지합니다.
+    """
+    if max(Counter(p.day for p in body.places).values()) > MAX_STOPS_PER_DAY:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"하루 최대 {MAX_STOPS_PER_DAY}개 장소까지 최적화할 수 있습니다.",
+        )
+
+    coords = crud_place.get_coordinates(db, list({p.place_id for p in body.places}))
+    missing = sorted({p.place_id for p in body.places} - coords.keys())
+    if missing:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Place not found: {missing}")
+
+    places, before_km, after_km = optimize_places(body.places, coords, body.fix_start, body.fix_end)
+    return RouteOptimizeOut(
+        places=places,
+        distance_before_km=round(before_km, 2),
+        distance_after_km=round(after_km, 2),
+        distance_saved_km=round(before_km - after_km, 2),
+    )
+
+
 @router.get("", response_model=List[LocoRoute], summary="모든 경로 목록 조회")
-def list_routes(db: Session = Depends(get_db)):
+def list_routes(db: Session = Depends(get_read_db), favorite_ids: Optional[FavoriteIds] = Depends(favorite_route_ids)):
     routes_db = crud_route.list_all(db)
-    return [to_loco_route(r) for r in routes_db]
+    return PydanticJSONResponse([to_loco_route(r, favorite_ids) for r in routes_db])
+
+
+def tag_filters(
+    tag_period: Optional[int] = Query(None, description="여행 기간 (일)"),
+    tag_env: Optional[str] = Query(None, description="여행 환경 (e.g., sea, mountain)"),
+    tag_with: Optional[str] = Query(None, description="동행 (e.g., alone, friend)"),
+    tag_move: Optional[str] = Query(None, description="이동 수단 (e.g., car, public)"),
+    tag_atmosphere: Optional[str] = Query(None, description="분위기 (e.g., 자유롭고 감성적인)"),
+    tag_place_count: Optional[int] = Query(None, description="하루 방문 장소 수"),
+) -> dict:
+    # 빈 문자열은 필터 없음으로 처리 (crud.route.search_by_tags와 동일)
+    return dict(
+        tag_period=tag_period,
+        tag_env=tag_env or None,
+        tag_with=tag_with or None,
+        tag_move=tag_move or None,
+        tag_atmosphere=tag_atmosphere or None,
+        tag_place_count=tag_place_count,
+    )
 
 
 @router.get("/search", response_model=List[LocoRoute], summary="태그로 경로 검색")
 def search_routes(
+        db: Session = Depends(get_read_db),
+        filters: dict = Depends(tag_filters),
+        min_distance_km: Optional[float] = Query(None, ge=0, description="최소 총 이동 거리 (km)"),
+        max_distance_km: Optional[float] = Query(None, ge=0, description="최대 총 이동 거리 (km)"),
+        favorite_ids: Optional[FavoriteIds] = Depends(favorite_route_ids),
+):
+    if min_distance_km is not None or max_distance_km is not None:
+        # 거리 조건은 패싯 인덱스에 없으므로 SQL 로 함께 검색 (ix_routes_total_distance_km)
+        routes_db = crud_route.search_by_tags(
+            db, **filters, min_distance_km=min_distance_km, max_distance_km=max_distance_km,
+        )
+    elif route_facet_index.ready:
+        # 패싯 인덱스로 id를 구한 뒤 한 번에 조회
+        route_facet_index.refresh_if_stale(db)
+        route_ids, _ = route_facet_index.search(filters)
+        routes_db = crud_route.get_by_ids(db, route_ids)
+    else:
+        routes_db = crud_route.search_by_tags(db, **filters)
+    return PydanticJSONResponse([to_loco_route(r, favorite_ids) for r in routes_db])
+
+
+@router.get("/facets", response_model=RouteFacetSearchOut, summary="태그 패싯 검색 (태그별 개수 포함)")
+def search_routes_with_facets(
         db: Session = Depends(get_db),
-        tag_period: Optional[int] = Query(None, description="여행 기간 (일)"),
-        tag_env: Optional[str] = Query(None, description="여행 환경 (e.g., sea, mountain)"),
-        tag_with: Optional[str] = Query(None, description="동행 (e.g., alone, friend)"),
-        tag_move: Optional[str] = Query(None, description="이동 수단 (e.g., car, public)"),
-        tag_atmosphere: Optional[str] = Query(None, description="분위기 (e.g., 자유롭고 감성적인)"),
-        tag_place_count: Optional[int] = Query(None, description="하루 방문 장소 수"),
+        filters: dict = Depends(tag_filters),
+        limit: int = Query(50, ge=1, le=100),
+        offset: int = Query(0, ge=0),
+        favorite_ids: Optional[FavoriteIds] = Depends(favorite_route_ids),
 ):
-    routes_db = crud_route.search_by_tags(
-        db,
-        tag_period=tag_period,
-        tag_env=tag_env,
-        tag_with=tag_with,
-        tag_move=tag_move,
-        tag_atmosphere=tag_atmosphere,
-        tag_place_count=tag_place_count,
-    )
-    return [to_loco_route(r) for r in routes_db]
+    if not route_facet_index.ready:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="패싯 인덱스를 준비 중입니다.")
 
+    route_facet_index.refresh_if_stale(db)
+    route_ids, total = route_facet_index.search(filters, limit=limit, offset=offset)
+    routes_db = crud_route.get_by_ids(db, route_ids)
+    return PydanticJSONResponse(RouteFacetSearchOut(
+        total=total,
+        facets=route_facet_index.facet_counts(filters),
+        routes=[to_loco_route(r, favorite_ids) for r in routes_db],
+    ))
 
-@router.get("/{route_id}", response_model=LocoRoute, summary="경로 상세 조회")
-def read_route_detail(route_id: int, db: Session = Depends(get_db)):
-    obj = db.query(Route).options(
-        joinedload(Route.creator).joinedload(User.city),
-        joinedload(Route.places).joinedload(RoutePlaceMap.place)
-    ).filter(Route.route_id == route_id).first()
 
+@router.get("/{route_id}", response_model=LocoRoute, summary="경로 상세 조회")
+def read_route_detail(route_id: int, db: Session = Depends(get_read_db), favorite_ids: Optional[FavoriteIds] = Depends(favorite_route_ids)):
+    obj = crud_route.get_by_id(db, route_id)
     if not obj:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Route not found")
-    return to_loco_route(obj)
+    return to_loco_route(obj, favorite_ids)
 
 @router.get("/by-user/{user_id}", response_model=List[LocoRoute], summary="특정 사용자가 만든 경로 목록 조회")
-def list_routes_by_user(user_id: int, db: Session = Depends(get_db)):
+def list_routes_by_user(user_id: int, db: Session = Depends(get_read_db), favorite_ids: Optional[FavoriteIds] = Depends(favorite_route_ids)):
     routes_db = crud_route.get_routes_by_user(db, user_id=user_id)
-    return [to_loco_route(r) for r in routes_db]
\ No newline at end of file
+    return PydanticJSONResponse([to_loco_route(r, favorite_ids) for r in routes_db])
\ No newline at end of file
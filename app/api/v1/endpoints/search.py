@@ -1,7 +1,17 @@
 # app/api/v1/endpoints/search.py
 
-from fastapi import APIRouter, HTTPException, Query
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from app.core.database import get_db
+from app.core.read_replicas import get_read_db
+from app.core.responses import PydanticJSONResponse
+from app.crud import place as crud_place, route as crud_route
+from app.schemas.search import LocalSearchOut, SuggestItem
 from app.services import external_api
+from app.services.autocomplete import autocomplete_index
+from app.api.v1.endpoints.places import to_place_search_result
+from app.api.v1.endpoints.routes import to_loco_route
 
 router = APIRouter(prefix="/search", tags=["search"])
 
@@ -19,4 +29,30 @@ def search_places(keyword: str = Query(..., min_length=2, description="검색할
     result = external_api.search_kakao_places_by_keyword(keyword)
     if result is None:
         raise HTTPException(status_code=503, detail="외부 API를 호출하는 데 실패했습니다.")
-    return result
\ No newline at end of file
+    return result
+
+
+@router.get("/local", response_model=LocalSearchOut, summary="등록된 장소/루트 검색 (오타 허용)")
+def search_local(
+    q: str = Query(..., min_length=1, max_length=50, description="검색어"),
+    limit: int = Query(20, ge=1, le=50),
+    db: Session = Depends(get_read_db),
+):
+    places = crud_place.search_local(db, q, limit=limit)
+    routes = crud_route.search_local(db, q, limit=limit)
+    return PydanticJSONResponse(LocalSearchOut(
+        places=[to_place_search_result(p) for p in places],
+        routes=[to_loco_route(r) for r in routes],
+    ))
+
+
+@router.get("/suggest", response_model=List[SuggestItem], summary="장소/루트 이름 자동완성 (초성 검색 지원)")
+def suggest(
+    q: str = Query(..., min_length=1, max_length=50, description="입력 중인 검색어 (예: 경ㅂ, ㄱㅂ)"),
+    limit: int = Query(10, ge=1, le=20),
+    db: Session = Depends(get_db),
+):
+    if not autocomplete_index.ready:
+        raise HTTPException(status_code=503, detail="자동완성 인덱스를 준비 중입니다.")
+    autocomplete_index.refresh_if_stale(db)
+    return [SuggestItem(type=kind, id=id, name=name) for kind, id, name in autocomplete_index.suggest(q, limit=limit)]
@@ -3,6 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session, joinedload
 from typing import List
 from app.core.database import get_db
+from app.core.read_replicas import get_read_db
 from app.schemas.user import UserOut, UserUpdate, UserPublic, LocoExploreOut, ProfileSearchResult
 from app.models import User, RegionCity
 from app.crud.user import crud_user
@@ -28,47 +29,34 @@ def me(db: Session = Depends(get_db), current: User = Depends(get_current_user))
 
 
 def to_profile_search_result(user: User) -> ProfileSearchResult:
-    # '담아요' 수 계산 로직
-    total_likes = 0
-    if user.created_places:
-        total_likes += sum(p.count_real for p in user.created_places)
-    if user.created_routes:
-        total_likes += sum(r.count_real for r in user.created_routes)
-    
+    # '담아요' 수는 crud에서 SQL로 집계된 total_likes를 사용
     return ProfileSearchResult(
         id=user.id,
         name=user.nickname,
         intro=user.intro,
         image_url=user.image_url,
-        liked=total_likes,
+        liked=user.total_likes or 0,
         rank=user.ranking,
         location=user.city.kor_name if user.city else None
     )
 
 
 @router.get("/explore", response_model=List[ProfileSearchResult], summary="프로필 탐색 페이지 데이터 조회")
-def get_user_explore(db: Session = Depends(get_db)):
+def get_user_explore(db: Session = Depends(get_read_db)):
     best_users_db = crud_user.get_best_users(db, limit=50) # 예시로 50명 조회
     
     return [to_profile_search_result(u) for u in best_users_db]
 
 
 @router.get("/loco-explore", response_model=LocoExploreOut, summary="로코탐색 페이지 데이터 조회")
-def get_loco_explore_users(db: Session = Depends(get_db)):
-    # crud 함수에서 이미 Eager Loading을 통해 데이터를 가져옵니다.
+def get_loco_explore_users(db: Session = Depends(get_read_db)):
+    # crud 함수에서 도시 정보와 '담아요' 합계를 함께 조회합니다.
     best_users_db = crud_user.get_best_users(db, limit=25)
     new_local_users_db = crud_user.get_new_local_users(db, limit=25)
 
     total_ranked_users = crud_user.get_total_ranked_user_count(db)
 
     def to_user_public(user: User, total_ranked: int) -> UserPublic:
-        # '담아요' 수 계산 로직
-        total_likes = 0
-        if user.created_places:
-            total_likes += sum(p.count_real for p in user.created_places)
-        if user.created_routes:
-            total_likes += sum(r.count_real for r in user.created_routes)
-
         user_data = UserPublic(
             id=user.id,
             nickname=user.nickname,
@@ -78,7 +66,7 @@ def get_loco_explore_users(db: Session = Depends(get_db)):
             ranking=user.ranking,
             points=user.points,
             grade=user.grade,
-            liked=total_likes,  # 계산된 합계 값을 사용
+            liked=user.total_likes or 0,  # SQL에서 집계된 합계 값을 사용
             city_name=user.city.kor_name if user.city else None,
             ranking_percentile=(user.ranking / total_ranked) * 100 if user.ranking and total_ranked > 0 else None
         )
@@ -107,18 +95,11 @@ def update_me(payload: UserUpdate, db: Session = Depends(get_db), current: User
 # --- 변수 경로를 마지막에 배치 ---
 
 @router.get("/{user_id}", response_model=UserPublic, summary="다른 사용자 프로필 상세 조회")
-def read_user_public_profile(user_id: int, db: Session = Depends(get_db)):
+def read_user_public_profile(user_id: int, db: Session = Depends(get_read_db)):
     obj = crud_user.get_by_id(db, user_id)
     if not obj:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
-    # '담아요' 수 계산 로직
-    total_likes = 0
-    if obj.created_places:
-        total_likes += sum(p.count_real for p in obj.created_places)
-    if obj.created_routes:
-        total_likes += sum(r.count_real for r in obj.created_routes)
-
     user_data = UserPublic(
         id=obj.id,
         nickname=obj.nickname,
@@ -128,7 +109,7 @@ def read_user_public_profile(user_id: int, db: Session = Depends(get_db)):
         ranking=obj.ranking,
         points=obj.points,
         grade=obj.grade,
-        liked=total_likes,  # 계산된 합계 값을 사용
+        liked=obj.total_likes or 0,  # SQL에서 집계된 합계 값을 사용
         city_name=obj.city.kor_name if obj.city else None,
     )
     return user_data
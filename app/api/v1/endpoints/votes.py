@@ -1,18 +1,28 @@
 # app/api/v1/endpoints/votes.py
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response, status
 from sqlalchemy.orm import Session
 from app.core.database import get_db
-from app.schemas.vote import PlaceVoteCreate, RouteVoteCreate
+from app.schemas.vote import PlaceVoteCreate, RouteVoteCreate, VoteAccepted
 from app.crud import vote as crud_vote
 from app.models import User
+from app.services.vote_queue import vote_queue, PLACE, ROUTE
 from app.utils.security import get_current_user
 
 router = APIRouter(prefix="/votes", tags=["votes"])
 
 @router.post("/places")
-def vote_place(body: PlaceVoteCreate, db: Session = Depends(get_db), current: User = Depends(get_current_user)):
+def vote_place(body: PlaceVoteCreate, response: Response, db: Session = Depends(get_db), current: User = Depends(get_current_user)):
+    if vote_queue.is_open:
+        # write-behind: 로그에 기록만 하고 바로 응답, 집계는 배치 워커가 반영
+        vote_queue.submit(PLACE, current.id, body.place_id, body.vote_type)
+        response.status_code = status.HTTP_202_ACCEPTED
+        return VoteAccepted(target_id=body.place_id, vote_type=body.vote_type)
     return crud_vote.vote_place(db, current.id, body.place_id, body.vote_type)
 
 @router.post("/routes")
-def vote_route(body: RouteVoteCreate, db: Session = Depends(get_db), current: User = Depends(get_current_user)):
+def vote_route(body: RouteVoteCreate, response: Response, db: Session = Depends(get_db), current: User = Depends(get_current_user)):
+    if vote_queue.is_open:
+        vote_queue.submit(ROUTE, current.id, body.route_id, body.vote_type)
+        response.status_code = status.HTTP_202_ACCEPTED
+        return VoteAccepted(target_id=body.route_id, vote_type=body.vote_type)
     return crud_vote.vote_route(db, current.id, body.route_id, body.vote_type)
\ No newline at end of file
@@ -21,6 +21,45 @@ class Settings(BaseSettings):
     TOUR_API_KEY: str = ""
     KAKAO_REST_API_KEY: str = ""
 
+    # 랭킹 배치 주기(초), 0이면 앱 내 스케줄러를 사용하지 않음 (cron 등 외부 실행)
+    RANKING_REFRESH_INTERVAL_SECONDS: int = 600
+
+    # 루트 패싯 인덱스 재빌드 주기(초, 삭제/누락된 루트 반영), 0이면 시작 시 한 번만 빌드
+    ROUTE_FACET_INDEX_REBUILD_SECONDS: int = 600
+
+    # 자동완성 인덱스 재빌드 주기(초, 인기도 변화/누락된 장소·루트 반영), 0이면 시작 시 한 번만 빌드
+    AUTOCOMPLETE_INDEX_REBUILD_SECONDS: int = 600
+
+    # 근처 장소 인덱스 재빌드 주기(초, 투표 수 변화를 순위에 반영), 0이면 시작 시 한 번만 빌드
+    NEARBY_INDEX_REBUILD_SECONDS: int = 600
+
+    # 요청별 SQL 계측: 문장 수 또는 DB 시간(ms)이 임계값을 넘으면 경고 로그
+    QUERY_STATS_ENABLED: bool = True
+    QUERY_STATS_WARN_STATEMENTS: int = 20
+    QUERY_STATS_WARN_DB_MS: float = 200.0
+
+    # Prometheus 메트릭 수집 (/metrics)
+    # /metrics 는 Authorization: Bearer <METRICS_TOKEN> 요청에만 응답, 비어 있으면 /metrics 를 노출하지 않음 (404)
+    # 여러 워커로 실행할 때는 PROMETHEUS_MULTIPROC_DIR 환경 변수 필요 (app.core.metrics 참고)
+    METRICS_ENABLED: bool = True
+    METRICS_TOKEN: str = ""
+
+    # 읽기 전용 replica (JSON 배열, 비어 있으면 모든 읽기를 primary 로)
+    # 연결 실패/복제 지연 초과 replica 는 REPLICA_EJECT_SECONDS 동안 제외,
+    # 쓰기 요청 후 READ_YOUR_WRITES_SECONDS 동안은 같은 클라이언트의 읽기를 primary 로 보냄
+    REPLICA_DATABASE_URLS: list[str] = []
+    REPLICA_EJECT_SECONDS: int = 30
+    REPLICA_MAX_LAG_SECONDS: float = 5.0
+    REPLICA_HEALTH_CHECK_INTERVAL_SECONDS: int = 10
+    READ_YOUR_WRITES_SECONDS: int = 10
+
+    # 투표 write-behind: 투표를 로컬 로그 + 메모리 버퍼에 받고 주기적으로 모아서 반영 (202 응답)
+    # 로그는 반영 주기마다 fsync 하므로 프로세스 종료 시에는 손실이 없지만,
+    # 호스트 장애/전원 차단 시에는 마지막 VOTE_FLUSH_INTERVAL_MS 동안 받은 투표를 잃을 수 있음
+    VOTE_WRITE_BEHIND_ENABLED: bool = False
+    VOTE_FLUSH_INTERVAL_MS: int = 200
+    VOTE_LOG_DIR: str = "var/vote_log"
+
     # CORS
     ALLOWED_ORIGINS: list[str] = Field(default_factory=lambda: ["http://localhost:5173", "http://localhost:5174", "http://localhost:3000", "https://loco-fe.vercel.app"], env="ALLOWED_ORIGINS")
 
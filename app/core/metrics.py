@@ -0,0 +1,138 @@
+# app/core/metrics.py
+import os
+import secrets
+import time
+from typing import Dict, Iterator, Optional
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest
+from prometheus_client import multiprocess
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+from sqlalchemy.engine import Engine
+
+# 대부분의 API는 수~수백 ms, 추천(임베딩 + 벡터 검색)은 수 초까지 걸리므로 넓게 잡음
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP 요청 수", ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간", ["method", "route"], buckets=LATENCY_BUCKETS,
+)
+EMBEDDING_DURATION = Histogram(
+    "embedding_inference_seconds", "문장 임베딩 모델 추론 시간", buckets=LATENCY_BUCKETS,
+)
+EXTERNAL_API_CALLS = Counter(
+    "external_api_calls_total", "외부 API 호출 수", ["host", "outcome"],
+)
+EXTERNAL_API_DURATION = Histogram(
+    "external_api_call_duration_seconds", "외부 API 호출 시간 (재시도 포함)", ["host"], buckets=LATENCY_BUCKETS,
+)
+
+# 여러 워커(uvicorn --workers, gunicorn)로 실행할 때는 서버 시작 전에 이 환경 변수로 빈 디렉터리를 지정해야 함.
+# 지정하면 카운터/히스토그램을 워커별 파일에 기록하고 스크레이프 시 모든 워커의 값을 합산합니다.
+# 지정하지 않으면 각 워커가 자기 값만 가지므로 스크레이프마다 임의의 워커 값이 보입니다.
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+# 라우트에 매칭되지 않은 요청(404 스캔 등)은 경로 대신 이 값으로 묶어 라벨 수가 늘어나지 않게 함
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class DBPoolCollector(Collector):
+    """
+    스크레이프 시점의 SQLAlchemy 커넥션 풀 상태를 풀(primary/replica)별 게이지로 노출합니다.
+    멀티프로세스 모드에서는 스크레이프를 처리한 워커의 풀만 보이므로 pid 라벨을 붙입니다.
+    """
+
+    def __init__(self):
+        self.binds: Dict[str, Engine] = {}
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        multiprocess_mode = MULTIPROC_DIR_ENV in os.environ
+        labels = ["pool", "pid"] if multiprocess_mode else ["pool"]
+        for name, doc, method in (
+            ("db_pool_size", "커넥션 풀 크기", "size"),
+            ("db_pool_checked_out", "사용 중인 커넥션 수", "checkedout"),
+            ("db_pool_checked_in", "대기 중인 커넥션 수", "checkedin"),
+            ("db_pool_overflow", "풀 크기를 초과해 연 커넥션 수", "overflow"),
+        ):
+            family = GaugeMetricFamily(name, doc, labels=labels)
+            for pool_name, bind in self.binds.items():
+                getter = getattr(bind.pool, method, None)
+                if getter is not None:
+                    family.add_metric([pool_name, str(os.getpid())] if multiprocess_mode else [pool_name], getter())
+            yield family
+
+
+_db_pools = DBPoolCollector()
+
+
+def register_db_pool(bind: Engine, name: str = "primary") -> None:
+    if not _db_pools.binds:
+        REGISTRY.register(_db_pools)
+    _db_pools.binds[name] = bind
+
+
+class MetricsMiddleware:
+    """
+    요청 수와 처리 시간을 라우트 템플릿(/places/{place_id}) 단위로 기록하는 ASGI 미들웨어.
+    라벨 조합별 자식 메트릭을 캐시해 요청당 오버헤드를 줄입니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._children = {}
+
+    def _observe(self, method: str, route: str, status: int, elapsed: float) -> None:
+        key = (method, route, status)
+        children = self._children.get(key)
+        if children is None:
+            children = self._children[key] = (
+                HTTP_REQUESTS.labels(method, route, str(status)),
+                HTTP_REQUEST_DURATION.labels(method, route),
+            )
+        children[0].inc()
+        children[1].observe(elapsed)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # 라우팅 후 scope에 매칭된 라우트가 기록됨
+            route = scope.get("route")
+            self._observe(
+                scope["method"],
+                getattr(route, "path", UNMATCHED_ROUTE),
+                status,
+                time.perf_counter() - started,
+            )
+
+
+def is_scrape_authorized(authorization: Optional[str], token: str) -> bool:
+    """Authorization: Bearer <token> 헤더가 설정된 토큰과 일치하는지 확인합니다."""
+    scheme, _, value = (authorization or "").partition(" ")
+    return scheme.lower() == "bearer" and secrets.compare_digest(value.strip(), token)
+
+
+def render_latest() -> tuple:
+    """Prometheus 텍스트 형식의 (본문, Content-Type). 멀티프로세스 모드면 모든 워커의 값을 합산합니다."""
+    if MULTIPROC_DIR_ENV in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        if _db_pools.binds:
+            registry.register(_db_pools)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
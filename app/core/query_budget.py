@@ -0,0 +1,46 @@
+# app/core/query_budget.py
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Sequence
+
+from sqlalchemy.engine import Engine
+
+from app.core import query_stats
+from app.core.query_stats import QueryStats, track_all_queries
+
+
+class StatementBudgetExceeded(AssertionError):
+    """블록 안에서 실행된 SQL 문 수가 예산을 넘었을 때 발생합니다."""
+
+
+def app_engines() -> List[Engine]:
+    """앱이 사용하는 엔진 (primary + 설정된 replica)"""
+    from app.core.database import engine
+    from app.core.read_replicas import replica_pool
+
+    return [engine, *(replica_pool.engines if replica_pool is not None else [])]
+
+
+@contextmanager
+def statement_budget(max_statements: int, binds: Optional[Sequence[Engine]] = None) -> Iterator[QueryStats]:
+    """
+    블록 안에서 실행된 SQL 문을 집계해, 개수가 max_statements를 넘으면 StatementBudgetExceeded를 발생시킵니다.
+    app.core.query_stats 계측 위에서 동작하며(binds 에 계측 리스너를 설치, 기본은 primary + replica),
+    N+1 회귀를 잡기 위한 점검용이므로 다른 요청이 동시에 실행되지 않는 환경에서 사용합니다.
+
+    사용 예:
+        with statement_budget(2) as stats:
+            client.get("/api/v1/favorites/routes/1")
+    """
+    for bind in binds if binds is not None else app_engines():
+        query_stats.install(bind)
+
+    with track_all_queries(keep_statements=True) as stats:
+        yield stats
+
+    if stats.count > max_statements:
+        slowest = "\n".join(f"  {ms:.1f}ms {sql.splitlines()[0][:120]}" for ms, sql in stats.slowest)
+        listing = "\n".join(f"  {i + 1}. {s.splitlines()[0][:120]}" for i, s in enumerate(stats.statements))
+        raise StatementBudgetExceeded(
+            f"SQL 문 {stats.count}개 실행 (예산 {max_statements}개, DB {stats.total_ms:.1f}ms)\n"
+            f"가장 느린 문장:\n{slowest}\n실행 순서:\n{listing}"
+        )
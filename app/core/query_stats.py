@@ -0,0 +1,168 @@
+# app/core/query_stats.py
+import heapq
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# 요청별로 보관할 가장 느린 SQL 문 수
+SLOWEST_KEPT = 3
+
+
+class QueryStats:
+    """
+    한 요청(또는 track_queries 블록) 동안 실행된 SQL 문 수, 총 DB 시간, 가장 느린 문장.
+    keep_statements=True 이면 실행된 문장을 순서대로 모두 보관합니다. (예산 점검용)
+    """
+    __slots__ = ("count", "total_ms", "_slowest", "statements")
+
+    def __init__(self, keep_statements: bool = False):
+        self.count = 0
+        self.total_ms = 0.0
+        self._slowest: List[Tuple[float, str]] = []  # (ms, statement) 최소 힙
+        self.statements: Optional[List[str]] = [] if keep_statements else None
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if self.statements is not None:
+            self.statements.append(statement)
+        if len(self._slowest) < SLOWEST_KEPT:
+            heapq.heappush(self._slowest, (elapsed_ms, statement))
+        elif elapsed_ms > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, (elapsed_ms, statement))
+
+    @property
+    def slowest(self) -> List[Tuple[float, str]]:
+        return sorted(self._slowest, reverse=True)
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.total_ms:.1f};desc="{self.count} queries"'
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+# track_all_queries 블록이 열려 있는 동안에는 컨텍스트와 무관하게 모든 스레드의 SQL 문을 함께 집계
+_global_stats: List[QueryStats] = []
+_global_lock = threading.Lock()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed_ms = (time.perf_counter() - conn.info["query_started_at"].pop()) * 1000
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed_ms)
+    if _global_stats:
+        with _global_lock:
+            for global_stats in _global_stats:
+                if global_stats is not stats:
+                    global_stats.record(statement, elapsed_ms)
+
+
+def _handle_error(exception_context):
+    # 실패한 문장은 after_cursor_execute가 호출되지 않으므로 시작 시각만 정리
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_started_at"):
+        conn.info["query_started_at"].pop()
+
+
+def install(bind: Engine) -> None:
+    """엔진에 SQL 문 계측 리스너를 등록합니다. (track_queries 블록 밖에서는 시각만 재고 버림)"""
+    if event.contains(bind, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(bind, "before_cursor_execute", _before_cursor_execute)
+    event.listen(bind, "after_cursor_execute", _after_cursor_execute)
+    event.listen(bind, "handle_error", _handle_error)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    블록 안에서 실행된 SQL 문을 집계합니다. 컨텍스트 변수로 추적하므로
+    같은 컨텍스트(요청, 스레드풀로 복사된 컨텍스트 포함)의 쿼리만 집계됩니다.
+
+    사용 예:
+        with track_queries() as stats:
+            crud_place.list_all(db)
+        assert stats.count <= 2
+    """
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@contextmanager
+def track_all_queries(keep_statements: bool = False) -> Iterator[QueryStats]:
+    """
+    track_queries 와 같지만 컨텍스트와 무관하게 계측된 엔진의 모든 SQL 문을 집계합니다.
+    TestClient 처럼 요청이 다른 스레드(이벤트 루프)에서 실행되는 점검용이며,
+    다른 요청의 쿼리도 함께 집계되므로 운영 중인 서버에서는 track_queries 를 사용합니다.
+    """
+    stats = QueryStats(keep_statements=keep_statements)
+    with _global_lock:
+        _global_stats.append(stats)
+    try:
+        yield stats
+    finally:
+        with _global_lock:
+            _global_stats.remove(stats)
+
+
+class QueryStatsMiddleware:
+    """
+    요청별 SQL 문 수와 DB 시간을 Server-Timing 헤더로 내보내고 로그로 남기는 ASGI 미들웨어.
+    문장 수나 DB 시간이 임계값을 넘으면 가장 느린 문장과 함께 경고 로그를 남깁니다.
+    """
+
+    def __init__(self, app, warn_statements: int = 20, warn_db_ms: float = 200.0):
+        self.app = app
+        self.warn_statements = warn_statements
+        self.warn_db_ms = warn_db_ms
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        with track_queries() as stats:
+            async def send_with_timing(message):
+                if message["type"] == "http.response.start":
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", stats.server_timing().encode("latin-1")))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                self._log(scope, stats, (time.perf_counter() - started) * 1000)
+
+    def _log(self, scope, stats: QueryStats, elapsed_ms: float) -> None:
+        route = scope.get("route")
+        path = getattr(route, "path", None) or scope.get("path", "")
+        if stats.count > self.warn_statements or stats.total_ms > self.warn_db_ms:
+            slowest = " | ".join(f"{ms:.1f}ms {sql.split(chr(10))[0][:200]}" for ms, sql in stats.slowest)
+            logger.warning(
+                "db_stats method=%s path=%s statements=%d db_ms=%.1f total_ms=%.1f slowest=[%s]",
+                scope["method"], path, stats.count, stats.total_ms, elapsed_ms, slowest,
+            )
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "db_stats method=%s path=%s statements=%d db_ms=%.1f total_ms=%.1f",
+                scope["method"], path, stats.count, stats.total_ms, elapsed_ms,
+            )
@@ -0,0 +1,199 @@
+# app/core/read_replicas.py
+import asyncio
+import itertools
+import logging
+import time
+from typing import Dict, Generator, List, Optional
+
+from fastapi import Request
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session, sessionmaker
+from starlette.datastructures import MutableHeaders
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# 쓰기 이후 이 시각(epoch 초)까지는 primary 에서 읽도록 표시하는 쿠키
+PRIMARY_COOKIE = "read_primary_until"
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# 같은 워커에서 최근에 쓴 클라이언트(Authorization 헤더 해시) → primary 고정 만료 시각
+# 쿠키를 보내지 않는 API 클라이언트용
+_recent_writers: Dict[int, float] = {}
+MAX_RECENT_WRITERS = 10_000
+
+# 복제 지연(초). WAL 을 모두 재생했으면 0 (쓰기가 없을 때 지연이 커 보이는 것 방지)
+REPLICATION_LAG_SQL = text("""
+SELECT CASE
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+END
+""")
+
+
+class ReplicaPool:
+    """
+    읽기 전용 replica 엔진 묶음.
+    라운드 로빈으로 세션을 나눠 주고, 연결 실패나 복제 지연 초과 시 eject_seconds 동안 제외합니다.
+    제외 기간이 끝난 replica 는 다음 요청에서 다시 시도되며, 모든 replica 가 제외되면 primary 를 사용합니다.
+    """
+
+    def __init__(self, urls: List[str], eject_seconds: float = 30, max_lag_seconds: float = 5.0):
+        self.urls = urls
+        self.engines: List[Engine] = [create_engine(url, future=True, pool_pre_ping=True) for url in urls]
+        self._sessions = [
+            sessionmaker(bind=bind, autocommit=False, autoflush=False, future=True) for bind in self.engines
+        ]
+        self.eject_seconds = eject_seconds
+        self.max_lag_seconds = max_lag_seconds
+        self._ejected_until = [0.0] * len(self.engines)
+        self._counter = itertools.count()
+        for index, bind in enumerate(self.engines):
+            event.listen(bind, "handle_error", self._error_listener(index))
+
+    def _error_listener(self, index: int):
+        def on_error(context) -> None:
+            # 요청 도중 replica 연결이 끊기면 다음 요청부터 제외
+            if context.is_disconnect:
+                self.eject(index, "connection lost")
+        return on_error
+
+    def is_healthy(self, index: int) -> bool:
+        return self._ejected_until[index] <= time.monotonic()
+
+    def eject(self, index: int, reason: str) -> None:
+        if self.is_healthy(index):
+            logger.warning("replica %d 제외 (%ds): %s", index, self.eject_seconds, reason)
+        self._ejected_until[index] = time.monotonic() + self.eject_seconds
+
+    def _next_index(self) -> Optional[int]:
+        start = next(self._counter)
+        for offset in range(len(self.engines)):
+            index = (start + offset) % len(self.engines)
+            if self.is_healthy(index):
+                return index
+        return None
+
+    def session(self) -> Session:
+        """정상 replica 의 세션을 반환합니다. 연결에 실패한 replica 는 제외하고 다음 replica, 모두 실패하면 primary 세션."""
+        for _ in range(len(self.engines)):
+            index = self._next_index()
+            if index is None:
+                break
+            db = self._sessions[index]()
+            try:
+                db.connection()
+            except DBAPIError as exc:
+                db.close()
+                self.eject(index, str(exc.orig))
+                continue
+            return db
+        return SessionLocal()
+
+    def check_health(self) -> None:
+        """모든 replica 에 접속해 복제 지연을 확인하고, 실패하거나 max_lag_seconds 를 넘으면 제외합니다."""
+        for index, bind in enumerate(self.engines):
+            try:
+                with bind.connect() as conn:
+                    if bind.dialect.name != "postgresql":
+                        continue
+                    lag = conn.execute(REPLICATION_LAG_SQL).scalar() or 0
+            except DBAPIError as exc:
+                self.eject(index, str(exc.orig))
+                continue
+            if lag > self.max_lag_seconds:
+                self.eject(index, f"replication lag {lag:.1f}s")
+
+    def dispose(self) -> None:
+        for bind in self.engines:
+            bind.dispose()
+
+
+replica_pool: Optional[ReplicaPool] = (
+    ReplicaPool(settings.REPLICA_DATABASE_URLS, settings.REPLICA_EJECT_SECONDS, settings.REPLICA_MAX_LAG_SECONDS)
+    if settings.REPLICA_DATABASE_URLS else None
+)
+
+
+def mark_recent_writer(authorization: str, until: float) -> None:
+    if len(_recent_writers) >= MAX_RECENT_WRITERS:
+        now = time.time()
+        for key in [k for k, v in _recent_writers.items() if v <= now]:
+            del _recent_writers[key]
+        if len(_recent_writers) >= MAX_RECENT_WRITERS:
+            _recent_writers.clear()
+    _recent_writers[hash(authorization)] = until
+
+
+def prefers_primary(request: Request) -> bool:
+    """최근 READ_YOUR_WRITES_SECONDS 안에 쓰기를 한 클라이언트인지 (쿠키 또는 같은 워커의 기록)"""
+    now = time.time()
+    cookie = request.cookies.get(PRIMARY_COOKIE)
+    if cookie:
+        try:
+            if float(cookie) > now:
+                return True
+        except ValueError:
+            pass
+    authorization = request.headers.get("authorization")
+    return authorization is not None and _recent_writers.get(hash(authorization), 0.0) > now
+
+
+def get_read_db(request: Request) -> Generator:
+    """
+    읽기 전용 핸들러(GET, 조회만 하는 POST)용 DB 세션 제공자.
+    replica 가 설정되어 있으면 replica 세션을, 최근에 쓰기를 한 클라이언트에게는 primary 세션을 줍니다.
+    사용 예: def endpoint(db: Session = Depends(get_read_db)): ...
+    """
+    if replica_pool is None or prefers_primary(request):
+        db = SessionLocal()
+    else:
+        db = replica_pool.session()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+class ReadYourWritesMiddleware:
+    """
+    쓰기 요청(GET/HEAD/OPTIONS 제외)이 성공하면 window_seconds 동안 같은 클라이언트의 읽기를 primary 로 고정합니다.
+    쿠키는 여러 워커 사이에서, Authorization 헤더 기록은 쿠키를 보내지 않는 클라이언트를 위해 같은 워커 안에서 쓰입니다.
+    """
+
+    def __init__(self, app, window_seconds: int):
+        self.app = app
+        self.window_seconds = window_seconds
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                until = time.time() + self.window_seconds
+                # 프론트엔드가 다른 도메인이므로 https 에서는 cross-site 요청에도 쿠키가 실리도록 SameSite=None
+                same_site = "None; Secure" if scope.get("scheme") == "https" else "Lax"
+                MutableHeaders(scope=message).append(
+                    "set-cookie",
+                    f"{PRIMARY_COOKIE}={until:.0f}; Max-Age={self.window_seconds}; Path=/; HttpOnly; SameSite={same_site}",
+                )
+                for name, value in scope["headers"]:
+                    if name == b"authorization":
+                        mark_recent_writer(value.decode("latin-1"), until)
+                        break
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+async def replica_health_scheduler(pool: ReplicaPool, interval_seconds: int) -> None:
+    """interval_seconds 간격으로 replica 연결/복제 지연을 확인합니다."""
+    while True:
+        await asyncio.to_thread(pool.check_health)
+        await asyncio.sleep(interval_seconds)
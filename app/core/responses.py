@@ -0,0 +1,32 @@
+# app/core/responses.py
+from functools import lru_cache
+from typing import Any, List, Type
+
+from fastapi.responses import Response
+from pydantic import BaseModel, TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[model])
+
+
+class PydanticJSONResponse(Response):
+    """
+    이미 검증된 Pydantic 모델(또는 모델 리스트)을 pydantic-core 직렬화기로 바로 JSON 인코딩합니다.
+
+    엔드포인트가 Response 인스턴스를 반환하면 FastAPI는 response_model 재검증과
+    jsonable_encoder를 건너뛰므로, 헬퍼(to_place_out, to_loco_route 등)에서 만든 모델을
+    한 번만 검증하고 그대로 내려줄 수 있습니다. (response_model은 문서화 용도로 유지)
+    FastAPI 기본 동작과 동일하게 alias(by_alias=True)로 직렬화합니다.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content, by_alias=True)
+        if isinstance(content, list):
+            if not content:
+                return b"[]"
+            return _list_adapter(type(content[0])).dump_json(content, by_alias=True)
+        raise TypeError(f"PydanticJSONResponse는 BaseModel 또는 그 리스트만 지원합니다: {type(content)!r}")
@@ -1,60 +1,148 @@
 # app/crud/favorite.py
-from typing import List
+from typing import List, Optional, Sequence, Tuple
+from sqlalchemy import select, delete, literal, any_, bindparam, Integer
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.types import ARRAY
 from sqlalchemy.orm import Session, joinedload
-from app.models import FavoritePlace, FavoriteRoute, Place, Route
+from fastapi import HTTPException, status
+from app.models import FavoritePlace, FavoriteRoute, Place, Route, User
+from app.services.favorite_cache import favorite_cache, FavoriteIds
 
-def add_favorite_place(db: Session, user_id: int, place_id: int) -> FavoritePlace:
-    obj = db.query(FavoritePlace).filter_by(user_id=user_id, place_id=place_id).first()
-    if obj:
-        return obj
-    obj = FavoritePlace(user_id=user_id, place_id=place_id)
-    db.add(obj)
+# 찜 캐시 키 종류
+PLACE = "place"
+ROUTE = "route"
+
+def _upsert_favorite(db: Session, model, user_id: int, target_column, target_id: int):
+    """
+    INSERT ... ON CONFLICT (user_id, 대상 id) DO UPDATE ... RETURNING 한 문장으로 찜을 추가합니다.
+    이미 찜한 경우에도 같은 문장에서 기존 행이 반환되므로, 동시에 두 번 눌러도 중복 키 오류가 나지 않습니다.
+    (DO NOTHING은 기존 행을 반환하지 않아 의미 없는 값으로 갱신합니다.)
+    """
+    stmt = pg_insert(model).values({"user_id": user_id, target_column.key: target_id})
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[model.user_id, target_column],
+        set_={target_column.key: stmt.excluded[target_column.key]},
+    ).returning(model)
+    try:
+        obj = db.scalars(stmt).one()
+    except IntegrityError:
+        # 존재하지 않는 장소/루트 (외래 키 위반)
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="찜할 대상을 찾을 수 없습니다.")
     db.commit()
-    db.refresh(obj)
     return obj
 
-def add_favorite_route(db: Session, user_id: int, route_id: int) -> FavoriteRoute:
-    obj = db.query(FavoriteRoute).filter_by(user_id=user_id, route_id=route_id).first()
-    if obj:
-        return obj
-    obj = FavoriteRoute(user_id=user_id, route_id=route_id)
-    db.add(obj)
+def _delete_favorite(db: Session, model, user_id: int, target_column, target_id: int) -> bool:
+    """DELETE ... RETURNING 한 문장으로 찜을 삭제하고, 실제로 삭제된 행이 있었는지 반환합니다."""
+    deleted = db.execute(
+        delete(model)
+        .where(model.user_id == user_id, target_column == target_id)
+        .returning(model.id)
+    ).first()
     db.commit()
-    db.refresh(obj)
+    return deleted is not None
+
+def add_favorite_place(db: Session, user_id: int, place_id: int) -> FavoritePlace:
+    obj = _upsert_favorite(db, FavoritePlace, user_id, FavoritePlace.place_id, place_id)
+    favorite_cache.invalidate(PLACE, user_id)
     return obj
 
+def add_favorite_route(db: Session, user_id: int, route_id: int) -> FavoriteRoute:
+    obj = _upsert_favorite(db, FavoriteRoute, user_id, FavoriteRoute.route_id, route_id)
+    favorite_cache.invalidate(ROUTE, user_id)
+    return obj
+
+def _sync_favorites(db: Session, model, user_id: int, target_column, target_pk,
+                    add_ids: Sequence[int], remove_ids: Sequence[int]) -> None:
+    if add_ids:
+        # 존재하는 대상만 INSERT ... SELECT 로 추가 (없는 id는 건너뛰고, 이미 찜한 id는 ON CONFLICT로 무시)
+        db.execute(
+            pg_insert(model)
+            .from_select(
+                ["user_id", target_column.key],
+                select(literal(user_id), target_pk).where(
+                    target_pk == any_(bindparam(f"add_{target_column.key}s", list(add_ids), type_=ARRAY(Integer)))
+                ),
+            )
+            .on_conflict_do_nothing(index_elements=[model.user_id, target_column])
+        )
+    if remove_ids:
+        db.execute(
+            delete(model).where(
+                model.user_id == user_id,
+                target_column == any_(bindparam(f"remove_{target_column.key}s", list(remove_ids), type_=ARRAY(Integer))),
+            )
+        )
+
+def sync_favorites(
+    db: Session,
+    user_id: int,
+    add_place_ids: Sequence[int] = (),
+    remove_place_ids: Sequence[int] = (),
+    add_route_ids: Sequence[int] = (),
+    remove_route_ids: Sequence[int] = (),
+) -> Tuple[FavoriteIds, FavoriteIds]:
+    """
+    여러 장소/루트 찜을 한 트랜잭션으로 추가·삭제합니다. (오프라인 동기화용, 멱등)
+    추가 후 삭제 순서로 적용하므로 같은 id가 양쪽에 있으면 삭제가 우선합니다.
+    적용 후의 (찜한 장소 id, 찜한 루트 id)를 반환합니다.
+    """
+    _sync_favorites(db, FavoritePlace, user_id, FavoritePlace.place_id, Place.place_id, add_place_ids, remove_place_ids)
+    _sync_favorites(db, FavoriteRoute, user_id, FavoriteRoute.route_id, Route.route_id, add_route_ids, remove_route_ids)
+    db.commit()
+
+    favorite_cache.invalidate(PLACE, user_id)
+    favorite_cache.invalidate(ROUTE, user_id)
+    return get_favorite_place_ids(db, user_id), get_favorite_route_ids(db, user_id)
+
 # NEW: list current user's favorites
-def list_my_favorite_places(db: Session, user_id: int) -> List[FavoritePlace]:
+# 목록 직렬화(PlaceOut/LocoRoute)에서 접근하는 관계를 한 번에 로드해 N+1을 막습니다.
+# 루트의 일정은 routes.itinerary 스냅샷을 사용하므로 places 관계는 로드하지 않습니다.
+def list_my_favorite_places(db: Session, user_id: int, limit: Optional[int] = 50, offset: int = 0) -> List[FavoritePlace]:
+    # limit=None 이면 전체 (지도 화면)
     return (
         db.query(FavoritePlace)
-        .options(joinedload(FavoritePlace.place))
+        .options(joinedload(FavoritePlace.place).joinedload(Place.creator).joinedload(User.city))
         .filter(FavoritePlace.user_id == user_id)
-        .order_by(FavoritePlace.created_at.desc())
+        .order_by(FavoritePlace.created_at.desc(), FavoritePlace.id.desc())
+        .offset(offset)
+        .limit(limit)
         .all()
     )
 
-def list_my_favorite_routes(db: Session, user_id: int) -> List[FavoriteRoute]:
+def list_my_favorite_routes(db: Session, user_id: int, limit: int = 50, offset: int = 0) -> List[FavoriteRoute]:
     return (
         db.query(FavoriteRoute)
         .options(joinedload(FavoriteRoute.route))
         .filter(FavoriteRoute.user_id == user_id)
-        .order_by(FavoriteRoute.created_at.desc())
+        .order_by(FavoriteRoute.created_at.desc(), FavoriteRoute.id.desc())
+        .offset(offset)
+        .limit(limit)
         .all()
     )
 
+def get_favorite_place_ids(db: Session, user_id: int) -> FavoriteIds:
+    """찜한 장소 id 집합 (id 컬럼만 조회, 사용자별 캐시)"""
+    return favorite_cache.get(
+        PLACE, user_id,
+        lambda: db.scalars(select(FavoritePlace.place_id).where(FavoritePlace.user_id == user_id)).all(),
+    )
+
+def get_favorite_route_ids(db: Session, user_id: int) -> FavoriteIds:
+    """찜한 루트 id 집합 (id 컬럼만 조회, 사용자별 캐시)"""
+    return favorite_cache.get(
+        ROUTE, user_id,
+        lambda: db.scalars(select(FavoriteRoute.route_id).where(FavoriteRoute.user_id == user_id)).all(),
+    )
+
 # NEW: remove from favorites
 def remove_favorite_place(db: Session, user_id: int, place_id: int) -> bool:
-    obj = db.query(FavoritePlace).filter_by(user_id=user_id, place_id=place_id).first()
-    if not obj:
-        return False
-    db.delete(obj)
-    db.commit()
-    return True
+    deleted = _delete_favorite(db, FavoritePlace, user_id, FavoritePlace.place_id, place_id)
+    favorite_cache.invalidate(PLACE, user_id)
+    return deleted
 
 def remove_favorite_route(db: Session, user_id: int, route_id: int) -> bool:
-    obj = db.query(FavoriteRoute).filter_by(user_id=user_id, route_id=route_id).first()
-    if not obj:
-        return False
-    db.delete(obj)
-    db.commit()
-    return True
\ No newline at end of file
+    deleted = _delete_favorite(db, FavoriteRoute, user_id, FavoriteRoute.route_id, route_id)
+    favorite_cache.invalidate(ROUTE, user_id)
+    return deleted
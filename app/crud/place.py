@@ -1,85 +1,244 @@
 # app/crud/place.py
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import case, func, Float
-from typing import List, Optional
+from sqlalchemy import Row, func, or_, text, select, lambda_stmt
+from sqlalchemy.dialects.postgresql import insert
+from typing import Dict, List, Optional, Sequence, Tuple
 from fastapi import HTTPException, status
 from app.models import Place, User # User 모델 추가
-from app.schemas.place import PlaceCreate
+from app.schemas.place import PlaceCreate, KakaoPlaceDocument
+from app.crud.scoring import wilson_score
+from app.utils.hangul import decompose_jamo
+from app.services.autocomplete import autocomplete_index, PLACE
+from app.services.nearby import nearby_index
+
+# 로컬 검색: trigram 유사도 임계값과 (텍스트 유사도 : 인기도) 가중치
+SEARCH_SIMILARITY_THRESHOLD = 0.4
+SEARCH_TEXT_WEIGHT = 0.7
+
+# 일괄 등록 시 한 INSERT 문에 담을 행 수 (행당 바인드 파라미터 약 12개, Postgres 한도 65535)
+IMPORT_CHUNK_SIZE = 1000
 
 # 공통적으로 사용할 Eager Loading 옵션
 eager_loading_options = [
     joinedload(Place.creator).joinedload(User.city)
 ]
 
+# Wilson score 식은 모듈 로드 시 한 번만 만들어 재사용
+RANKING_SCORE = wilson_score(Place.count_real, Place.count_bad)
+
+# 탐색/검색 카드(PlaceSearchResult)에 필요한 컬럼만 조회: 엔티티 생성, identity map 등록,
+# creator/city 조인 없이 Row 로 반환 (to_place_search_result 는 속성 이름으로 읽으므로 그대로 사용 가능)
+PLACE_CARD_COLUMNS = (
+    Place.place_id,
+    Place.created_by,
+    Place.name,
+    Place.image_url,
+    Place.count_real,
+    Place.short_location,
+    Place.intro,
+)
+
+# 조회 함수는 lambda_stmt 로 작성: 첫 호출 때 만든 SQL 구조와 컴파일 결과를 캐시하고,
+# 이후 호출에서는 클로저 값(limit, id 등)만 바인드 파라미터로 추출하므로 식 트리를 다시 만들지 않음
+
 def create(db: Session, user_id: int, obj_in: PlaceCreate) -> Place:
-    # kakao_place_id로 기존 장소 검색
-    existing_place = db.query(Place).filter(Place.kakao_place_id == obj_in.kakao_place_id).first()
-    if existing_place:
+    # INSERT ... ON CONFLICT DO NOTHING 한 번으로 중복 확인과 삽입을 처리 (동시 등록 시에도 409)
+    stmt = (
+        insert(Place)
+        .values(
+            name=obj_in.name,
+            name_jamo=decompose_jamo(obj_in.name),
+            type=obj_in.type,
+            is_frequent=obj_in.is_frequent,
+            atmosphere=obj_in.atmosphere,
+            pros=obj_in.pros,
+            cons=obj_in.cons,
+            image_url=obj_in.image_url,
+            latitude=obj_in.latitude,
+            longitude=obj_in.longitude,
+            kakao_place_id=obj_in.kakao_place_id,
+            created_by=user_id,
+            intro=obj_in.intro,
+            phone=obj_in.phone,
+            address_name=obj_in.address_name,
+            short_location=obj_in.short_location,
+            link=obj_in.link,
+        )
+        .on_conflict_do_nothing(index_elements=[Place.kakao_place_id])
+        .returning(Place)
+    )
+    place = db.scalars(stmt).first()
+    if place is None:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="이미 등록된 장소입니다."
         )
-
-    place = Place(
-        name=obj_in.name,
-        type=obj_in.type,
-        is_frequent=obj_in.is_frequent,
-        atmosphere=obj_in.atmosphere,
-        pros=obj_in.pros,
-        cons=obj_in.cons,
-        image_url=obj_in.image_url,
-        latitude=obj_in.latitude,
-        longitude=obj_in.longitude,
-        kakao_place_id=obj_in.kakao_place_id,
-        created_by=user_id,
-        intro=obj_in.intro,
-        phone=obj_in.phone,
-        address_name=obj_in.address_name,
-        link=obj_in.link,
-    )
-    db.add(place)
     db.commit()
     db.refresh(place)
+    autocomplete_index.add(PLACE, place.place_id, place.name)
+    nearby_index.add(place.place_id, place.latitude, place.longitude)
     return place
 
+def _kakao_document_row(user_id: int, doc: KakaoPlaceDocument) -> dict:
+    """카카오 검색 결과 한 건을 places 테이블 행으로 변환합니다. (컬럼 길이에 맞춰 자름)"""
+    category = doc.category_group_name or (doc.category_name or "").split(">")[-1].strip() or "기타"
+    address = doc.road_address_name or doc.address_name
+    return {
+        "name": doc.place_name,
+        "name_jamo": decompose_jamo(doc.place_name),
+        "type": category[:50],
+        "is_frequent": False,
+        "latitude": doc.y,
+        "longitude": doc.x,
+        "kakao_place_id": doc.id,
+        "created_by": user_id,
+        "phone": doc.phone[:20] if doc.phone else None,
+        "address_name": address[:255] if address else None,
+        "short_location": " ".join(doc.address_name.split()[:2])[:100] if doc.address_name else None,
+        "link": doc.place_url[:255] if doc.place_url else None,
+    }
+
+def import_kakao_places(db: Session, user_id: int, docs: Sequence[KakaoPlaceDocument]) -> Tuple[List[int], List[int]]:
+    """
+    카카오 검색 결과를 일괄 등록합니다. (멱등)
+    청크마다 INSERT ... ON CONFLICT (kakao_place_id) DO NOTHING ... RETURNING 으로 새 행을 넣고,
+    RETURNING 에 없는 kakao_place_id 만 한 번 더 조회해 (inserted_ids, existing_ids)를 반환합니다.
+    이미 있던 장소(다른 사용자가 등록한 장소 포함)는 수정하지 않습니다.
+    문서는 클라이언트가 보낸 값이므로 기존 장소의 연락처/좌표를 덮어쓰지 않기 위함입니다.
+    """
+    # 요청 내 중복 id는 마지막 값만 사용
+    unique_docs = list({doc.id: doc for doc in docs}.values())
+    inserted: List[int] = []
+    existing: List[int] = []
+    new_places = []
+
+    for start in range(0, len(unique_docs), IMPORT_CHUNK_SIZE):
+        rows = [_kakao_document_row(user_id, doc) for doc in unique_docs[start:start + IMPORT_CHUNK_SIZE]]
+        stmt = (
+            insert(Place)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=[Place.kakao_place_id])
+            .returning(Place.place_id, Place.kakao_place_id, Place.name, Place.latitude, Place.longitude)
+        )
+
+        inserted_kakao_ids = set()
+        for place_id, kakao_place_id, name, latitude, longitude in db.execute(stmt):
+            inserted.append(place_id)
+            inserted_kakao_ids.add(kakao_place_id)
+            new_places.append((place_id, name, latitude, longitude))
+
+        conflicted = [row["kakao_place_id"] for row in rows if row["kakao_place_id"] not in inserted_kakao_ids]
+        if conflicted:
+            existing.extend(db.scalars(select(Place.place_id).where(Place.kakao_place_id.in_(conflicted))))
+
+    db.commit()
+    autocomplete_index.add_many((PLACE, place_id, name, 0) for place_id, name, _, _ in new_places)
+    for place_id, _, latitude, longitude in new_places:
+        nearby_index.add(place_id, latitude, longitude)
+    return inserted, existing
+
 def list_all(db: Session, limit: int = 50, offset: int = 0) -> List[Place]:
-    return db.query(Place).options(*eager_loading_options).order_by(Place.place_id.desc()).offset(offset).limit(limit).all()
+    stmt = lambda_stmt(lambda: (
+        select(Place).options(*eager_loading_options).order_by(Place.place_id.desc()).offset(offset).limit(limit)
+    ))
+    return db.scalars(stmt).all()
 
 def get_by_id(db: Session, place_id: int) -> Optional[Place]:
-    return db.query(Place).options(*eager_loading_options).filter(Place.place_id == place_id).first()
+    stmt = lambda_stmt(lambda: select(Place).options(*eager_loading_options).where(Place.place_id == place_id))
+    return db.scalars(stmt).first()
+
+
+def get_coordinates(db: Session, place_ids: List[int]) -> Dict[int, Tuple[float, float]]:
+    """place_id -> (latitude, longitude). 없는 장소는 결과에 포함되지 않습니다."""
+    if not place_ids:
+        return {}
+    stmt = lambda_stmt(lambda: (
+        select(Place.place_id, Place.latitude, Place.longitude).where(Place.place_id.in_(place_ids))
+    ))
+    return {row.place_id: (row.latitude, row.longitude) for row in db.execute(stmt)}
+
+
+def get_cards_by_ids(db: Session, place_ids: List[int]) -> List[Row]:
+    """place_id 목록으로 한 번에 조회하고, 입력 순서를 유지하여 반환합니다. (카드 컬럼만)"""
+    if not place_ids:
+        return []
+    stmt = lambda_stmt(lambda: select(*PLACE_CARD_COLUMNS).where(Place.place_id.in_(place_ids)))
+    by_id = {place.place_id: place for place in db.execute(stmt)}
+    return [by_id[place_id] for place_id in place_ids if place_id in by_id]
 
 
-def get_ranked_places(db: Session, limit: int = 25) -> List[Place]:
-    n = (Place.count_real + Place.count_bad).cast(Float)
-    z = 1.96  # 95% 신뢰수준
+def get_in_bounding_box(db: Session, min_lat: float, max_lat: float, min_lng: float, max_lng: float) -> List[Row]:
+    """위경도 범위 안의 장소 (place_id, latitude, longitude, count_real, count_bad). ix_places_latitude_longitude 사용"""
+    stmt = lambda_stmt(lambda: (
+        select(Place.place_id, Place.latitude, Place.longitude, Place.count_real, Place.count_bad)
+        .where(Place.latitude.between(min_lat, max_lat), Place.longitude.between(min_lng, max_lng))
+    ))
+    return db.execute(stmt).all()
 
-    ranking_score = case(
-        (n > 0, (
-            (Place.count_real.cast(Float) / n + (z*z) / (2*n) - z * func.sqrt(( (Place.count_real.cast(Float) / n) * (1 - (Place.count_real.cast(Float) / n)) + (z*z) / (4*n) ) / n)) / (1 + (z*z)/n)
-        )),
-        else_=0.0
-    ).label("ranking_score")
 
-    return db.query(Place).options(*eager_loading_options).order_by(ranking_score.desc()).limit(limit).all()
+def get_ranked_places(db: Session, limit: int = 25) -> List[Row]:
+    stmt = lambda_stmt(lambda: select(*PLACE_CARD_COLUMNS).order_by(RANKING_SCORE.desc()).limit(limit))
+    return db.execute(stmt).all()
+
+def search_local(db: Session, q: str, limit: int = 20) -> List[Row]:
+    """
+    이름/소개/주소에 대한 trigram 유사도와 Wilson score를 결합해 장소를 검색합니다.
+    자모 분해된 이름도 비교하므로 한글 오타(예: 경북궁 → 경복궁)를 허용합니다.
+    """
+    q_jamo = decompose_jamo(q)
+    # 오타 허용을 위해 word_similarity 임계값을 기본값(0.6)보다 낮춤
+    db.execute(
+        text("SELECT set_config('pg_trgm.word_similarity_threshold', :threshold, true)"),
+        {"threshold": str(SEARCH_SIMILARITY_THRESHOLD)},
+    )
+
+    def build():
+        text_score = func.greatest(
+            func.word_similarity(q, Place.name),
+            func.word_similarity(q_jamo, Place.name_jamo),
+            func.coalesce(func.word_similarity(q, Place.address_name), 0) * 0.8,
+            func.coalesce(func.word_similarity(q, Place.intro), 0) * 0.5,
+        )
+        score = text_score * SEARCH_TEXT_WEIGHT + RANKING_SCORE * (1 - SEARCH_TEXT_WEIGHT)
+        return (
+            select(*PLACE_CARD_COLUMNS)
+            .where(or_(
+                Place.name.op("%>")(q),
+                Place.name_jamo.op("%>")(q_jamo),
+                Place.address_name.op("%>")(q),
+                Place.intro.op("%>")(q),
+            ))
+            .order_by(score.desc(), Place.place_id.desc())
+            .limit(limit)
+        )
+
+    return db.execute(lambda_stmt(build)).all()
 
-def get_new_places(db: Session, limit: int = 25) -> List[Place]:
-    return db.query(Place).options(*eager_loading_options).order_by(Place.created_at.desc()).limit(limit).all()
+def get_new_places(db: Session, limit: int = 25) -> List[Row]:
+    stmt = lambda_stmt(lambda: select(*PLACE_CARD_COLUMNS).order_by(Place.created_at.desc()).limit(limit))
+    return db.execute(stmt).all()
 
 def count_by_user(db: Session, user_id: int) -> int:
-    return db.query(Place).filter(Place.created_by == user_id).count()
+    stmt = lambda_stmt(lambda: select(func.count()).select_from(Place).where(Place.created_by == user_id))
+    return db.scalar(stmt)
 
 def sum_likes_by_user(db: Session, user_id: int) -> int:
-    total_likes = db.query(func.sum(Place.count_real)).filter(Place.created_by == user_id).scalar()
+    stmt = lambda_stmt(lambda: select(func.sum(Place.count_real)).where(Place.created_by == user_id))
+    total_likes = db.scalar(stmt)
     return total_likes if total_likes is not None else 0
 
 def sum_loco_count_by_user(db: Session, user_id: int) -> List[int]:
-    result = db.query(
-        func.sum(Place.count_real),
-        func.sum(Place.count_normal),
-        func.sum(Place.count_bad)
-    ).filter(Place.created_by == user_id).first()
+    stmt = lambda_stmt(lambda: (
+        select(func.sum(Place.count_real), func.sum(Place.count_normal), func.sum(Place.count_bad))
+        .where(Place.created_by == user_id)
+    ))
+    result = db.execute(stmt).first()
     return [result[0] or 0, result[1] or 0, result[2] or 0]
 
 def get_by_user_id(db: Session, user_id: int) -> List[Place]:
     """특정 사용자가 생성한 모든 장소를 조회합니다."""
-    return db.query(Place).options(*eager_loading_options).filter(Place.created_by == user_id).order_by(Place.place_id.desc()).all()
\ No newline at end of file
+    stmt = lambda_stmt(lambda: (
+        select(Place).options(*eager_loading_options).where(Place.created_by == user_id).order_by(Place.place_id.desc())
+    ))
+    return db.scalars(stmt).all()
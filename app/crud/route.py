@@ -1,27 +1,69 @@
 # app/crud/route.py
-from typing import Optional, List
+from typing import AbstractSet, Dict, Optional, List, Tuple
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import case, func, Float
+from sqlalchemy import Row, func, Integer, literal, select, insert, any_, bindparam, or_, text, lambda_stmt
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.types import ARRAY
 from app.models import Route, User, RoutePlaceMap, Place, RegionCity
 from app.schemas.route import RouteCreate
-# from app.services.vector_service import text_to_vector # 삭제
+from app.services.itinerary import build_itinerary
+from app.services.route_metrics import compute_route_metrics
+from app.services.route_facets import route_facet_index
+from app.services.autocomplete import autocomplete_index, ROUTE
+from app.crud.scoring import wilson_score
+from app.crud.place import SEARCH_SIMILARITY_THRESHOLD, SEARCH_TEXT_WEIGHT
+from app.utils.hangul import decompose_jamo
 
 # 공통적으로 사용할 Eager Loading 옵션
+# (일정은 Route.itinerary 스냅샷을 사용하므로 places 컬렉션은 로드하지 않음)
 eager_loading_options = [
     joinedload(Route.creator).joinedload(User.city),
-    joinedload(Route.places).joinedload(RoutePlaceMap.place)
 ]
 
-def create(db: Session, user_id: int, obj_in: RouteCreate) -> Route:
-    # tags_text = (
-    #     f"{obj_in.tag_env or ''} "
-    #     f"{obj_in.tag_with or ''} "
-    #     f"{obj_in.tag_atmosphere or ''}"
-    # )
-    # embedding_vector = text_to_vector(tags_text) if tags_text.strip() else None
-    
-    route = Route(
+# Wilson score 식은 모듈 로드 시 한 번만 만들어 재사용
+RANKING_SCORE = wilson_score(Route.count_real, Route.count_bad)
+
+# 목록 카드(LocoRoute)에 필요한 컬럼만 조회: 엔티티/identity map/creator 조인 없이 Row 로 반환.
+# 일정 스냅샷은 c52d8e3b4a07 에서 모든 루트에 채워졌으므로 비어 있으면 빈 일정으로 대체
+EMPTY_ITINERARY = {"places": [], "transportations": []}
+ROUTE_CARD_COLUMNS = (
+    Route.route_id,
+    Route.created_by,
+    Route.name,
+    Route.image_url,
+    Route.location,
+    Route.intro,
+    Route.count_real,
+    Route.count_soso,
+    Route.count_bad,
+    Route.created_at,
+    Route.tag_period,
+    Route.tag_env,
+    Route.tag_with,
+    Route.tag_move,
+    Route.tag_atmosphere,
+    Route.tag_place_count,
+    func.coalesce(Route.itinerary, literal(EMPTY_ITINERARY, JSONB)).label("itinerary"),
+    Route.total_distance_km,
+    Route.travel_minutes,
+    Route.day_metrics,
+)
+
+# 조회 함수는 lambda_stmt 로 작성해 SQL 구조/컴파일 결과를 캐시하고 호출마다 바인드 값만 추출 (crud/place.py 참고)
+
+def _build_route(
+    user_id: int, obj_in: RouteCreate, place_info: Dict[int, Tuple[str, str]], metrics: Optional[dict],
+) -> Route:
+    itinerary = build_itinerary(
+        stops=[
+            (p.place_id, *place_info[p.place_id], p.day, p.order)
+            for p in obj_in.places if p.place_id in place_info
+        ],
+        transports=[(t.name, t.day, t.order) for t in obj_in.transportations],
+    )
+    return Route(
         name=obj_in.name,
+        name_jamo=decompose_jamo(obj_in.name),
         is_recommend=obj_in.is_recommend,
         image_url=obj_in.image_url,
         tag_period=obj_in.tag_period,
@@ -31,53 +73,107 @@ def create(db: Session, user_id: int, obj_in: RouteCreate) -> Route:
         tag_atmosphere=obj_in.tag_atmosphere,
         tag_place_count=obj_in.tag_place_count,
         created_by=user_id,
-        # embedding=embedding_vector # 삭제
+        itinerary=itinerary,
+        total_distance_km=metrics["total_distance_km"] if metrics else None,
+        travel_minutes=metrics["travel_minutes"] if metrics else None,
+        day_metrics=metrics["days"] if metrics else None,
     )
-    db.add(route)
-    db.flush()  # flush to get the route_id for the new route
 
-    # Create RoutePlaceMap entries for places
+def _build_place_map_rows(route_id: int, obj_in: RouteCreate, valid_place_ids: AbstractSet[int]) -> List[dict]:
+    rows = []
+    # 존재하는 장소만 매핑 (기존 동작과 동일하게 없는 장소는 건너뜀)
     for place_data in obj_in.places:
-        db_place = db.query(Place).filter(Place.place_id == place_data.place_id).first()
-        if db_place:
-            route_place_map = RoutePlaceMap(
-                route_id=route.route_id,
-                place_id=db_place.place_id,
-                day=place_data.day,
-                order=place_data.order,
-                is_transportation=False
-            )
-            db.add(route_place_map)
-
-    # Create RoutePlaceMap entries for transportations
+        if place_data.place_id in valid_place_ids:
+            rows.append({
+                "route_id": route_id,
+                "place_id": place_data.place_id,
+                "day": place_data.day,
+                "order": place_data.order,
+                "is_transportation": False,
+                "transportation": None,
+            })
     for trans_data in obj_in.transportations:
-        route_place_map = RoutePlaceMap(
-            route_id=route.route_id,
-            day=trans_data.day,
-            order=trans_data.order,
-            is_transportation=True,
-            transportation=trans_data.name
+        rows.append({
+            "route_id": route_id,
+            "place_id": None,
+            "day": trans_data.day,
+            "order": trans_data.order,
+            "is_transportation": True,
+            "transportation": trans_data.name,
+        })
+    return rows
+
+def create_many(db: Session, user_id: int, objs_in: List[RouteCreate]) -> List[Route]:
+    """
+    여러 루트를 한 트랜잭션에서 생성합니다.
+    - 루트 INSERT는 flush 한 번으로 일괄 처리
+    - 장소 존재 여부는 WHERE place_id = ANY(:ids) 한 번으로 검증
+    - 일정 스냅샷(Route.itinerary)과 이동 지표(거리/시간)를 함께 저장
+    - RoutePlaceMap은 multi-row INSERT 한 번으로 삽입
+    """
+    place_ids = list({p.place_id for obj_in in objs_in for p in obj_in.places})
+    # place_id -> (name, type), (latitude, longitude): 검증, 일정 스냅샷, 이동 지표 계산을 한 번의 조회로 처리
+    place_info: Dict[int, Tuple[str, str]] = {}
+    place_coords: Dict[int, Tuple[float, float]] = {}
+    if place_ids:
+        rows = db.execute(
+            select(Place.place_id, Place.name, Place.type, Place.latitude, Place.longitude).where(
+                Place.place_id == any_(bindparam("place_ids", place_ids, type_=ARRAY(Integer)))
+            )
         )
-        db.add(route_place_map)
+        for row in rows:
+            place_info[row.place_id] = (row.name, row.type)
+            place_coords[row.place_id] = (row.latitude, row.longitude)
+
+    # 요청 내 순번 -> 이동 지표 (모든 루트를 한 번에 계산)
+    metrics = compute_route_metrics(
+        [
+            (index, p.day, p.order, *place_coords[p.place_id])
+            for index, obj_in in enumerate(objs_in) for p in obj_in.places if p.place_id in place_coords
+        ],
+        {index: obj_in.tag_move for index, obj_in in enumerate(objs_in)},
+    )
+    routes = [_build_route(user_id, obj_in, place_info, metrics.get(index)) for index, obj_in in enumerate(objs_in)]
+    db.add_all(routes)
+    db.flush()  # flush to get the route_id for the new routes
+
+    map_rows = []
+    for route, obj_in in zip(routes, objs_in):
+        map_rows.extend(_build_place_map_rows(route.route_id, obj_in, place_info.keys()))
+    if map_rows:
+        db.execute(insert(RoutePlaceMap).values(map_rows))
 
+    # 커밋 시 만료(expire)되어 재조회가 일어나지 않도록 세션에서 분리한 뒤 커밋
+    for route in routes:
+        db.expunge(route)
     db.commit()
-    db.refresh(route)
-    return route
+
+    # 패싯/자동완성 인덱스에 새 루트 반영
+    for route, obj_in in zip(routes, objs_in):
+        route_facet_index.add(route.route_id, obj_in.model_dump())
+    autocomplete_index.add_many((ROUTE, route.route_id, obj_in.name, 0) for route, obj_in in zip(routes, objs_in))
+    return routes
+
+def create(db: Session, user_id: int, obj_in: RouteCreate) -> Route:
+    return create_many(db, user_id=user_id, objs_in=[obj_in])[0]
 
 def get_by_id(db: Session, route_id: int) -> Optional[Route]:
-    return db.query(Route).options(
-        joinedload(Route.places).joinedload(RoutePlaceMap.place)
-    ).filter(Route.route_id == route_id).first()
-
-def list_all(db: Session, limit: int = 50, offset: int = 0) -> List[Route]:
-    return (
-        db.query(Route)
-        .options(*eager_loading_options)
-        .order_by(Route.route_id.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
-    )
+    stmt = lambda_stmt(lambda: select(Route).options(*eager_loading_options).where(Route.route_id == route_id))
+    return db.scalars(stmt).first()
+
+def get_by_ids(db: Session, route_ids: List[int]) -> List[Row]:
+    """route_id 목록으로 한 번에 조회하고, 입력 순서를 유지하여 반환합니다. (목록 카드 컬럼만)"""
+    if not route_ids:
+        return []
+    stmt = lambda_stmt(lambda: select(*ROUTE_CARD_COLUMNS).where(Route.route_id.in_(route_ids)))
+    by_id = {route.route_id: route for route in db.execute(stmt)}
+    return [by_id[route_id] for route_id in route_ids if route_id in by_id]
+
+def list_all(db: Session, limit: int = 50, offset: int = 0) -> List[Row]:
+    stmt = lambda_stmt(lambda: (
+        select(*ROUTE_CARD_COLUMNS).order_by(Route.route_id.desc()).offset(offset).limit(limit)
+    ))
+    return db.execute(stmt).all()
 
 def search_by_tags(
     db: Session,
@@ -89,68 +185,88 @@ def search_by_tags(
     tag_move: Optional[str] = None,
     tag_atmosphere: Optional[str] = None,
     tag_place_count: Optional[int] = None,
-) -> List[Route]:
-    query = db.query(Route).options(*eager_loading_options)
+    min_distance_km: Optional[float] = None,
+    max_distance_km: Optional[float] = None,
+) -> List[Row]:
+    # 조건 조합마다 별도로 캐시됨 (lambda 위치가 캐시 키의 일부)
+    stmt = lambda_stmt(lambda: select(*ROUTE_CARD_COLUMNS))
 
     if tag_period is not None:
-        query = query.filter(Route.tag_period == tag_period)
+        stmt += lambda s: s.where(Route.tag_period == tag_period)
     if tag_env:
-        query = query.filter(Route.tag_env == tag_env)
+        stmt += lambda s: s.where(Route.tag_env == tag_env)
     if tag_with:
-        query = query.filter(Route.tag_with == tag_with)
+        stmt += lambda s: s.where(Route.tag_with == tag_with)
     if tag_move:
-        query = query.filter(Route.tag_move == tag_move)
+        stmt += lambda s: s.where(Route.tag_move == tag_move)
     if tag_atmosphere:
-        query = query.filter(Route.tag_atmosphere == tag_atmosphere)
+        stmt += lambda s: s.where(Route.tag_atmosphere == tag_atmosphere)
     if tag_place_count is not None:
-        query = query.filter(Route.tag_place_count == tag_place_count)
+        stmt += lambda s: s.where(Route.tag_place_count == tag_place_count)
+    # 총 이동 거리 범위 (지표가 없는 루트는 제외됨)
+    if min_distance_km is not None:
+        stmt += lambda s: s.where(Route.total_distance_km >= min_distance_km)
+    if max_distance_km is not None:
+        stmt += lambda s: s.where(Route.total_distance_km <= max_distance_km)
 
-    return (
-        query.order_by(Route.route_id.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
-    )
+    stmt += lambda s: s.order_by(Route.route_id.desc()).offset(offset).limit(limit)
+    return db.execute(stmt).all()
 
 
-def get_ranked_routes(db: Session, limit: int = 25) -> List[Route]:
-    n = (Route.count_real + Route.count_bad).cast(Float)
-    z = 1.96  # 95% 신뢰수준
+def get_ranked_routes(db: Session, limit: int = 25) -> List[Row]:
+    stmt = lambda_stmt(lambda: select(*ROUTE_CARD_COLUMNS).order_by(RANKING_SCORE.desc()).limit(limit))
+    return db.execute(stmt).all()
 
-    ranking_score = case(
-        (n > 0, (
-            (Route.count_real.cast(Float) / n + (z*z) / (2*n) - z * func.sqrt(( (Route.count_real.cast(Float) / n) * (1 - (Route.count_real.cast(Float) / n)) + (z*z) / (4*n) ) / n)) / (1 + (z*z)/n)
-        )),
-        else_=0.0
-    ).label("ranking_score")
+def search_local(db: Session, q: str, limit: int = 20) -> List[Row]:
+    """이름에 대한 trigram 유사도(자모 포함)와 Wilson score를 결합해 루트를 검색합니다."""
+    q_jamo = decompose_jamo(q)
+    db.execute(
+        text("SELECT set_config('pg_trgm.word_similarity_threshold', :threshold, true)"),
+        {"threshold": str(SEARCH_SIMILARITY_THRESHOLD)},
+    )
 
-    return db.query(Route).options(*eager_loading_options).order_by(ranking_score.desc()).limit(limit).all()
+    def build():
+        text_score = func.greatest(
+            func.word_similarity(q, Route.name),
+            func.word_similarity(q_jamo, Route.name_jamo),
+        )
+        score = text_score * SEARCH_TEXT_WEIGHT + RANKING_SCORE * (1 - SEARCH_TEXT_WEIGHT)
+        return (
+            select(*ROUTE_CARD_COLUMNS)
+            .where(or_(Route.name.op("%>")(q), Route.name_jamo.op("%>")(q_jamo)))
+            .order_by(score.desc(), Route.route_id.desc())
+            .limit(limit)
+        )
+
+    return db.execute(lambda_stmt(build)).all()
 
-def get_new_routes(db: Session, limit: int = 25) -> List[Route]:
-    return db.query(Route).options(*eager_loading_options).order_by(Route.created_at.desc()).limit(limit).all()
+def get_new_routes(db: Session, limit: int = 25) -> List[Row]:
+    stmt = lambda_stmt(lambda: select(*ROUTE_CARD_COLUMNS).order_by(Route.created_at.desc()).limit(limit))
+    return db.execute(stmt).all()
 
-def get_routes_by_user(db: Session, user_id: int, limit: int = 50, offset: int = 0) -> List[Route]:
-    return (
-        db.query(Route)
-        .options(*eager_loading_options)
-        .filter(Route.created_by == user_id)
+def get_routes_by_user(db: Session, user_id: int, limit: int = 50, offset: int = 0) -> List[Row]:
+    stmt = lambda_stmt(lambda: (
+        select(*ROUTE_CARD_COLUMNS)
+        .where(Route.created_by == user_id)
         .order_by(Route.route_id.desc())
         .offset(offset)
         .limit(limit)
-        .all()
-    )
+    ))
+    return db.execute(stmt).all()
 
 def count_by_user(db: Session, user_id: int) -> int:
-    return db.query(Route).filter(Route.created_by == user_id).count()
+    stmt = lambda_stmt(lambda: select(func.count()).select_from(Route).where(Route.created_by == user_id))
+    return db.scalar(stmt)
 
 def sum_likes_by_user(db: Session, user_id: int) -> int:
-    total_likes = db.query(func.sum(Route.count_real)).filter(Route.created_by == user_id).scalar()
+    stmt = lambda_stmt(lambda: select(func.sum(Route.count_real)).where(Route.created_by == user_id))
+    total_likes = db.scalar(stmt)
     return total_likes if total_likes is not None else 0
 
 def sum_loco_count_by_user(db: Session, user_id: int) -> List[int]:
-    result = db.query(
-        func.sum(Route.count_real),
-        func.sum(Route.count_soso),
-        func.sum(Route.count_bad)
-    ).filter(Route.created_by == user_id).first()
-    return [result[0] or 0, result[1] or 0, result[2] or 0]
\ No newline at end of file
+    stmt = lambda_stmt(lambda: (
+        select(func.sum(Route.count_real), func.sum(Route.count_soso), func.sum(Route.count_bad))
+        .where(Route.created_by == user_id)
+    ))
+    result = db.execute(stmt).first()
+    return [result[0] or 0, result[1] or 0, result[2] or 0]
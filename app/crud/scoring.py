@@ -0,0 +1,21 @@
+# app/crud/scoring.py
+from sqlalchemy import case, func, Float
+
+WILSON_Z = 1.96  # 95% 신뢰수준
+
+
+def wilson_score(positive, negative):
+    """
+    '진짜예요'(positive)와 '아쉬워요'(negative) 투표 수로 Wilson score 하한값을 계산하는 SQL 식.
+    투표가 없으면 0.0
+    """
+    n = (positive + negative).cast(Float)
+    p = positive.cast(Float) / n
+    z = WILSON_Z
+
+    return case(
+        (n > 0, (
+            (p + (z*z) / (2*n) - z * func.sqrt((p * (1 - p) + (z*z) / (4*n)) / n)) / (1 + (z*z)/n)
+        )),
+        else_=0.0
+    )
@@ -1,12 +1,45 @@
 # app/crud/user.py
+import time
 from typing import Optional, List
-from sqlalchemy.orm import Session, selectinload
-from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload, with_expression
+from sqlalchemy import func, select
 from app.models import User, Place, Route
 from app.schemas.user import UserCreate, UserUpdate
 
 
+def _total_likes_expression():
+    """사용자가 작성한 장소/루트의 '진짜예요' 합계를 상관 서브쿼리로 계산합니다."""
+    place_likes = (
+        select(func.coalesce(func.sum(Place.count_real), 0))
+        .where(Place.created_by == User.id)
+        .correlate(User)
+        .scalar_subquery()
+    )
+    route_likes = (
+        select(func.coalesce(func.sum(Route.count_real), 0))
+        .where(Route.created_by == User.id)
+        .correlate(User)
+        .scalar_subquery()
+    )
+    return place_likes + route_likes
+
+
+# 프로필 목록/상세에서 공통으로 사용하는 로딩 옵션 (자식 컬렉션은 로드하지 않음)
+profile_loading_options = [
+    joinedload(User.city),
+    with_expression(User.total_likes, _total_likes_expression()),
+]
+
+
+# 랭킹 대상 사용자 수 캐시 유지 시간 (랭킹 배치가 돌면 즉시 갱신됨)
+RANKED_COUNT_CACHE_TTL_SECONDS = 300
+
+
 class CRUDUser:
+    def __init__(self):
+        self._ranked_count: Optional[int] = None
+        self._ranked_count_expires_at: float = 0.0
+
     def get_by_email(self, db: Session, email: str) -> Optional[User]:
         return db.query(User).filter(User.email == email).first()
 
@@ -38,37 +71,27 @@ class CRUDUser:
         return user
 
     def get_by_id(self, db: Session, user_id: int) -> Optional[User]:
-        # Eager loading 추가
-        return db.query(User).options(
-            selectinload(User.created_places),
-            selectinload(User.created_routes)
-        ).filter(User.id == user_id).first()
+        return db.query(User).options(*profile_loading_options).filter(User.id == user_id).first()
 
 
     def get_user_ranking(self, db: Session, user_id: int) -> Optional[int]:
-        subquery = db.query(
-            User.id,
-            func.row_number().over(order_by=User.points.desc()).label('rank')
-        ).subquery()
-        result = db.query(subquery.c.rank).filter(subquery.c.id == user_id).first()
-        return result[0] if result else None
+        # 랭킹은 배치 작업(app.services.ranking)이 users.ranking에 미리 계산해 둡니다.
+        return db.query(User.ranking).filter(User.id == user_id).scalar()
 
     def get_best_users(self, db: Session, limit: int = 25) -> List[User]:
-        # Eager loading 추가
-        return db.query(User).options(
-            selectinload(User.created_places),
-            selectinload(User.created_routes)
-        ).filter(User.ranking.isnot(None)).order_by(User.ranking.asc()).limit(limit).all()
+        return db.query(User).options(*profile_loading_options).filter(User.ranking.isnot(None)).order_by(User.ranking.asc()).limit(limit).all()
 
     def get_new_local_users(self, db: Session, limit: int = 25) -> List[User]:
-        # Eager loading 추가
-        return db.query(User).options(
-            selectinload(User.created_places),
-            selectinload(User.created_routes)
-        ).filter(User.is_local == True).order_by(User.created_at.desc()).limit(limit).all()
+        return db.query(User).options(*profile_loading_options).filter(User.is_local == True).order_by(User.created_at.desc()).limit(limit).all()
 
     def get_total_ranked_user_count(self, db: Session) -> int:
-        return db.query(User).filter(User.ranking.isnot(None)).count()
+        if self._ranked_count is None or time.monotonic() >= self._ranked_count_expires_at:
+            self.set_ranked_user_count(db.query(User).filter(User.ranking.isnot(None)).count())
+        return self._ranked_count
+
+    def set_ranked_user_count(self, count: int) -> None:
+        self._ranked_count = count
+        self._ranked_count_expires_at = time.monotonic() + RANKED_COUNT_CACHE_TTL_SECONDS
 
 
 crud_user = CRUDUser()
\ No newline at end of file
@@ -1,8 +1,13 @@
 # app/crud/vote.py
+import logging
+from typing import Sequence, Tuple
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 from app.models import PlaceVote, RouteVote, Place, Route
 from app.models.vote_enums import VoteType
 
+logger = logging.getLogger(__name__)
+
 def vote_place(db: Session, user_id: int, place_id: int, vote: VoteType) -> PlaceVote:
     pv = db.query(PlaceVote).filter_by(user_id=user_id, place_id=place_id).first()
     if pv:
@@ -34,4 +39,78 @@ def vote_route(db: Session, user_id: int, route_id: int, vote: VoteType) -> Rout
     route.count_bad = db.query(RouteVote).filter_by(route_id=route_id, vote_type=VoteType.bad).count()
     db.commit()
     db.refresh(rv)
-    return rv
\ No newline at end of file
+    return rv
+
+# ---- write-behind 배치 반영 (app/services/vote_queue.py) ----
+
+# 배치당 한 번에 보내는 최대 투표 수 (unnest 배열 크기 상한)
+APPLY_CHUNK_SIZE = 5000
+
+# (투표 테이블, 대상 테이블, 대상 PK, real/normal/bad 집계 컬럼)
+_VOTE_TARGETS = {
+    "place": ("place_votes", "places", "place_id", ("count_real", "count_normal", "count_bad")),
+    "route": ("route_votes", "routes", "route_id", ("count_real", "count_soso", "count_bad")),
+}
+
+
+def _apply_vote_batch(db: Session, kind: str, votes: Sequence[Tuple[int, int, VoteType]]) -> int:
+    vote_table, target_table, pk, (real_col, normal_col, bad_col) = _VOTE_TARGETS[kind]
+
+    # 사용자별 최신 투표를 upsert (삭제된 대상/사용자에 대한 투표는 건너뜀)
+    upsert = text(f"""
+        INSERT INTO {vote_table} (user_id, {pk}, vote_type)
+        SELECT v.user_id, v.target_id, v.vote_type::votetype
+        FROM unnest(CAST(:user_ids AS int[]), CAST(:target_ids AS int[]), CAST(:vote_types AS text[]))
+             AS v(user_id, target_id, vote_type)
+        JOIN {target_table} t ON t.{pk} = v.target_id
+        JOIN users u ON u.id = v.user_id
+        ON CONFLICT (user_id, {pk}) DO UPDATE SET vote_type = EXCLUDED.vote_type
+    """)
+    applied = 0
+    for start in range(0, len(votes), APPLY_CHUNK_SIZE):
+        chunk = votes[start:start + APPLY_CHUNK_SIZE]
+        applied += db.execute(upsert, {
+            "user_ids": [v[0] for v in chunk],
+            "target_ids": [v[1] for v in chunk],
+            "vote_types": [VoteType(v[2]).value for v in chunk],
+        }).rowcount
+    if applied < len(votes):
+        # 이미 202 로 응답한 투표이므로 최소한 건수를 남김
+        logger.warning("삭제된 %s/사용자에 대한 투표 %d건을 건너뜀", kind, len(votes) - applied)
+
+    # 배치에 포함된 대상마다 집계를 한 번만 다시 계산 (재실행해도 같은 결과)
+    target_ids = sorted({v[1] for v in votes})
+    params = {"ids": target_ids}
+    # 여러 워커의 배치가 서로 다른 순서로 행을 잠가 교착되지 않도록 id 순서로 먼저 잠금
+    db.execute(text(f"SELECT 1 FROM {target_table} WHERE {pk} = ANY(CAST(:ids AS int[])) ORDER BY {pk} FOR UPDATE"), params)
+    db.execute(text(f"""
+        UPDATE {target_table} t
+        SET {real_col} = c.n_real, {normal_col} = c.n_normal, {bad_col} = c.n_bad
+        FROM (
+            SELECT ids.id,
+                   COUNT(v.{pk}) FILTER (WHERE v.vote_type = 'real') AS n_real,
+                   COUNT(v.{pk}) FILTER (WHERE v.vote_type = 'normal') AS n_normal,
+                   COUNT(v.{pk}) FILTER (WHERE v.vote_type = 'bad') AS n_bad
+            FROM unnest(CAST(:ids AS int[])) AS ids(id)
+            LEFT JOIN {vote_table} v ON v.{pk} = ids.id
+            GROUP BY ids.id
+        ) c
+        WHERE t.{pk} = c.id
+          AND (t.{real_col}, t.{normal_col}, t.{bad_col}) IS DISTINCT FROM (c.n_real, c.n_normal, c.n_bad)
+    """), params)
+    return applied
+
+
+def apply_vote_batch(db: Session, place_votes: Sequence[Tuple[int, int, VoteType]],
+                     route_votes: Sequence[Tuple[int, int, VoteType]]) -> int:
+    """
+    모아 둔 (user_id, 대상 id, 투표) 목록을 한 트랜잭션으로 반영하고 반영된 투표 수를 반환합니다.
+    같은 (사용자, 대상)의 투표는 호출 전에 최신 값 하나로 합쳐져 있어야 합니다.
+    """
+    applied = 0
+    if place_votes:
+        applied += _apply_vote_batch(db, "place", place_votes)
+    if route_votes:
+        applied += _apply_vote_batch(db, "route", route_votes)
+    db.commit()
+    return applied
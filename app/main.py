@@ -1,16 +1,90 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+from app.core.database import engine
+from app.core import query_stats, metrics
+from app.core.read_replicas import replica_pool, replica_health_scheduler, ReadYourWritesMiddleware
 from app.api.v1.api import api_router
+from app.services.ranking import ranking_scheduler
+from app.services.route_facets import build_route_facet_index, route_facet_index_scheduler
+from app.services.autocomplete import build_autocomplete_index, autocomplete_index_scheduler
+from app.services.nearby import build_nearby_index, nearby_index_scheduler
+from app.services.vote_queue import vote_queue, vote_flush_scheduler
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 백그라운드 작업 시작
+    tasks = [
+        asyncio.create_task(asyncio.to_thread(build_route_facet_index)),
+        asyncio.create_task(asyncio.to_thread(build_autocomplete_index)),
+        asyncio.create_task(asyncio.to_thread(build_nearby_index)),
+    ]
+    if settings.ROUTE_FACET_INDEX_REBUILD_SECONDS > 0:
+        tasks.append(asyncio.create_task(route_facet_index_scheduler(settings.ROUTE_FACET_INDEX_REBUILD_SECONDS)))
+    if settings.AUTOCOMPLETE_INDEX_REBUILD_SECONDS > 0:
+        tasks.append(asyncio.create_task(autocomplete_index_scheduler(settings.AUTOCOMPLETE_INDEX_REBUILD_SECONDS)))
+    if settings.NEARBY_INDEX_REBUILD_SECONDS > 0:
+        tasks.append(asyncio.create_task(nearby_index_scheduler(settings.NEARBY_INDEX_REBUILD_SECONDS)))
+    if settings.RANKING_REFRESH_INTERVAL_SECONDS > 0:
+        tasks.append(asyncio.create_task(ranking_scheduler(settings.RANKING_REFRESH_INTERVAL_SECONDS)))
+    if replica_pool is not None and settings.REPLICA_HEALTH_CHECK_INTERVAL_SECONDS > 0:
+        tasks.append(asyncio.create_task(replica_health_scheduler(replica_pool, settings.REPLICA_HEALTH_CHECK_INTERVAL_SECONDS)))
+    if settings.VOTE_WRITE_BEHIND_ENABLED:
+        vote_queue.open(settings.VOTE_LOG_DIR)
+        tasks.append(asyncio.create_task(vote_flush_scheduler(vote_queue, settings.VOTE_FLUSH_INTERVAL_MS)))
+    yield
+    for task in tasks:
+        task.cancel()
+    # 취소는 다음 await 에서 전달되므로 작업들이 취소를 처리할 때까지 기다림
+    await asyncio.gather(*tasks, return_exceptions=True)
+    if vote_queue.is_open:
+        # 종료 전 남은 투표 반영 (실패하면 로그가 남아 다음 시작 시 재생)
+        try:
+            await asyncio.to_thread(vote_queue.flush)
+        finally:
+            vote_queue.close()
+    # 취소된 작업이 to_thread 로 넘긴 랭킹/인덱스 빌드는 스레드에서 계속 실행되므로 끝날 때까지 기다린 뒤 엔진 정리
+    await asyncio.get_running_loop().shutdown_default_executor()
+    if replica_pool is not None:
+        replica_pool.dispose()
+
 
 # FastAPI 앱 생성
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description=settings.DESCRIPTION,
     version=settings.VERSION,
-    openapi_url="/api/v1/openapi.json"
+    openapi_url="/api/v1/openapi.json",
+    lifespan=lifespan,
 )
 
+replica_engines = replica_pool.engines if replica_pool is not None else []
+
+# 요청별 SQL 문 수/DB 시간 계측 (Server-Timing 헤더 + 로그)
+if settings.QUERY_STATS_ENABLED:
+    query_stats.install(engine)
+    for replica_engine in replica_engines:
+        query_stats.install(replica_engine)
+    app.add_middleware(
+        query_stats.QueryStatsMiddleware,
+        warn_statements=settings.QUERY_STATS_WARN_STATEMENTS,
+        warn_db_ms=settings.QUERY_STATS_WARN_DB_MS,
+    )
+
+# Prometheus 메트릭 (라우트별 요청 수/지연 시간, DB 풀 상태)
+if settings.METRICS_ENABLED:
+    metrics.register_db_pool(engine)
+    for index, replica_engine in enumerate(replica_engines):
+        metrics.register_db_pool(replica_engine, f"replica-{index}")
+    app.add_middleware(metrics.MetricsMiddleware)
+
+# replica 사용 시: 쓰기 직후 같은 클라이언트의 읽기는 primary 로 (read-your-writes)
+if replica_pool is not None:
+    app.add_middleware(ReadYourWritesMiddleware, window_seconds=settings.READ_YOUR_WRITES_SECONDS)
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -27,6 +101,18 @@ app.include_router(api_router, prefix="/api/v1")
 async def root():
     return {"message": "Travel Platform API is running!"}
 
+@app.get("/metrics", include_in_schema=False)
+def prometheus_metrics(request: Request):
+    # 라우트별 트래픽/DB 풀 상태가 노출되므로 토큰을 설정한 경우에만 제공
+    if not settings.METRICS_ENABLED or not settings.METRICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if not metrics.is_scrape_authorized(request.headers.get("authorization"), settings.METRICS_TOKEN):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid metrics token", headers={"WWW-Authenticate": "Bearer"},
+        )
+    body, content_type = metrics.render_latest()
+    return Response(content=body, media_type=content_type)
+
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
\ No newline at end of file
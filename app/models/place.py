@@ -1,7 +1,7 @@
 from typing import Optional
 from datetime import datetime
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import Integer, String, Text, DateTime, Boolean, ForeignKey, Float
+from sqlalchemy import Integer, String, Text, DateTime, Boolean, ForeignKey, Float, Index
 from sqlalchemy.sql import func
 from app.core.database import Base
 
@@ -11,12 +11,22 @@ class PlaceType(str):
 
 class Place(Base):
     __tablename__ = "places"
+    __table_args__ = (
+        # 로컬 검색용 trigram GIN 인덱스 (pg_trgm)
+        Index("ix_places_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index("ix_places_name_jamo_trgm", "name_jamo", postgresql_using="gin", postgresql_ops={"name_jamo": "gin_trgm_ops"}),
+        Index("ix_places_intro_trgm", "intro", postgresql_using="gin", postgresql_ops={"intro": "gin_trgm_ops"}),
+        Index("ix_places_address_name_trgm", "address_name", postgresql_using="gin", postgresql_ops={"address_name": "gin_trgm_ops"}),
+        # 근처 장소 조회(인덱스 준비 전 SQL 경로)의 위경도 범위 검색
+        Index("ix_places_latitude_longitude", "latitude", "longitude"),
+    )
 
     place_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(255), index=True)
+    name_jamo: Mapped[Optional[str]] = mapped_column(String(1000), nullable=True)  # 자모 분해된 이름 (오타 허용 검색용)
     type: Mapped[str] = mapped_column(String(50))  # enum 문자열로 보관
     is_frequent: Mapped[bool] = mapped_column(Boolean, default=False)  # 자주가는/직접추가 구분
-    created_by: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    created_by: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
 
     kakao_place_id: Mapped[Optional[str]] = mapped_column(String(64), unique=True, nullable=True, index=True)
 
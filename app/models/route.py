@@ -1,7 +1,8 @@
 from typing import Optional
 from datetime import datetime
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import Integer, String, Text, DateTime, Boolean, ForeignKey
+from sqlalchemy import Integer, String, Text, DateTime, Boolean, Float, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from app.core.database import Base
 from pgvector.sqlalchemy import Vector
@@ -9,13 +10,21 @@ from pgvector.sqlalchemy import Vector
 
 class Route(Base):
     __tablename__ = "routes"
+    __table_args__ = (
+        # 설문 기반 검색에서 가장 흔한 조합(환경+동행) + route_id DESC 정렬을 인덱스만으로 처리
+        Index("ix_routes_tag_env_tag_with_route_id", "tag_env", "tag_with", "route_id"),
+        # 로컬 검색용 trigram GIN 인덱스 (pg_trgm)
+        Index("ix_routes_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index("ix_routes_name_jamo_trgm", "name_jamo", postgresql_using="gin", postgresql_ops={"name_jamo": "gin_trgm_ops"}),
+    )
 
     route_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(255), index=True)
+    name_jamo: Mapped[Optional[str]] = mapped_column(String(1000), nullable=True)  # 자모 분해된 이름 (오타 허용 검색용)
     intro: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     location: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     is_recommend: Mapped[bool] = mapped_column(Boolean, default=False)  # 추천/직접만든 구분
-    created_by: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    created_by: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
 
     image_url: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
@@ -25,18 +34,26 @@ class Route(Base):
 
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.current_timestamp())
 
-    # 태그들
-    tag_period: Mapped[Optional[int]] = mapped_column(nullable=True)                # 1~33 (32 장기, 33 all)
+    # 태그들 (단일 컬럼 인덱스는 임의 조합 검색 시 BitmapAnd로 결합됨)
+    tag_period: Mapped[Optional[int]] = mapped_column(nullable=True, index=True)                # 1~33 (32 장기, 33 all)
     tag_env: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)       # sea/mountain/city/country/all
-    tag_with: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)      # alone/friend/family/pet/love/all
-    tag_move: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)      # walk/bicycle/car/public/train/all
-    tag_atmosphere: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
-    tag_place_count: Mapped[Optional[int]] = mapped_column(nullable=True)           # 1~6 (6 all)
+    tag_with: Mapped[Optional[str]] = mapped_column(String(20), nullable=True, index=True)      # alone/friend/family/pet/love/all
+    tag_move: Mapped[Optional[str]] = mapped_column(String(20), nullable=True, index=True)      # walk/bicycle/car/public/train/all
+    tag_atmosphere: Mapped[Optional[str]] = mapped_column(String(50), nullable=True, index=True)
+    tag_place_count: Mapped[Optional[int]] = mapped_column(nullable=True, index=True)           # 1~6 (6 all)
 
     creator = relationship("User", back_populates="created_routes")
     favorites = relationship("FavoriteRoute", back_populates="route", cascade="all, delete-orphan")
     votes = relationship("RouteVote", back_populates="route", cascade="all, delete-orphan")
     places = relationship("RoutePlaceMap", back_populates="route", cascade="all, delete-orphan")
 
+    # 일정 스냅샷 (생성 시 places/transportations를 미리 직렬화, app.services.itinerary 참고)
+    itinerary: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+
+    # 이동 지표 (생성 시 장소 좌표로 계산, app.services.route_metrics 참고). 장소가 없는 루트는 NULL
+    total_distance_km: Mapped[Optional[float]] = mapped_column(Float, nullable=True, index=True)
+    travel_minutes: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    day_metrics: Mapped[Optional[list]] = mapped_column(JSONB, nullable=True)  # [{"day", "distance_km", "travel_minutes"}, ...]
+
     # 해시태그 벡터를 저장할 컬럼
     embedding: Mapped[Vector] = mapped_column(Vector(768), nullable=True)
\ No newline at end of file
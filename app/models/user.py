@@ -3,7 +3,7 @@ from typing import Optional
 from datetime import datetime
 import enum
 
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, query_expression
 from sqlalchemy import (
     Integer, String, DateTime, ForeignKey, Boolean,
     Enum as SQLAlchemyEnum
@@ -42,7 +42,7 @@ class User(Base):
     is_local: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
     # 랭킹, 포인트, 등급 컬럼
-    ranking: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    ranking: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, index=True)
     points: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     grade: Mapped[UserGrade] = mapped_column(
         SQLAlchemyEnum(UserGrade),
@@ -50,6 +50,9 @@ class User(Base):
         nullable=False
     )
 
+    # 작성한 장소/루트의 '진짜예요' 합계 (조회 시 with_expression으로 SQL에서 집계)
+    total_likes: Mapped[Optional[int]] = query_expression()
+
     # --- 관계 설정 ---
     city = relationship("RegionCity", back_populates="users")
     created_places = relationship("Place", back_populates="creator", cascade="all, delete-orphan", passive_deletes=True)
@@ -1,7 +1,7 @@
 # app/schemas/favorite.py
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel
+from typing import List, Optional
+from pydantic import BaseModel, Field
 from app.schemas.place import PlaceOut
 from app.schemas.route import LocoRoute
 
@@ -30,4 +30,14 @@ class FavoriteRouteOut(BaseModel):
     route: Optional[LocoRoute]
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class FavoriteBatchIn(BaseModel):
+    add_place_ids: List[int] = Field(default_factory=list, max_length=500)
+    remove_place_ids: List[int] = Field(default_factory=list, max_length=500)
+    add_route_ids: List[int] = Field(default_factory=list, max_length=500)
+    remove_route_ids: List[int] = Field(default_factory=list, max_length=500)
+
+class FavoriteBatchOut(BaseModel):
+    place_ids: List[int]
+    route_ids: List[int]
@@ -41,6 +41,7 @@ class PlaceOut(BaseModel):
     liked: Optional[int] = None
     user_id: Optional[int] = None
     city_name: Optional[str] = None
+    is_favorite: Optional[bool] = None  # 로그인한 경우에만 채워짐
 
     class Config:
         from_attributes = True
@@ -65,7 +66,34 @@ class PlaceSearchResult(BaseModel):
     liked: int
     short_location: Optional[str] = None
     intro: Optional[str] = None
+    is_favorite: Optional[bool] = None  # 로그인한 경우에만 채워짐
+
+class NearbyPlaceOut(PlaceSearchResult):
+    distance_km: float  # 기준 장소로부터의 직선 거리
 
 class PlaceExploreOut(BaseModel):
     ranked_places: List[PlaceSearchResult]
-    new_places: List[PlaceSearchResult]
\ No newline at end of file
+    new_places: List[PlaceSearchResult]
+
+
+class KakaoPlaceDocument(BaseModel):
+    """카카오 로컬 키워드 검색 응답의 documents 항목"""
+    id: str = Field(..., max_length=64)
+    place_name: str = Field(..., max_length=255)
+    category_name: Optional[str] = None
+    category_group_name: Optional[str] = None
+    phone: Optional[str] = None
+    address_name: Optional[str] = None
+    road_address_name: Optional[str] = None
+    x: float  # 경도
+    y: float  # 위도
+    place_url: Optional[str] = None
+
+
+class PlaceImportIn(BaseModel):
+    documents: List[KakaoPlaceDocument] = Field(..., min_length=1, max_length=10000)
+
+
+class PlaceImportOut(BaseModel):
+    inserted: List[int]
+    existing: List[int]
\ No newline at end of file
@@ -1,7 +1,8 @@
 # app/schemas/route.py
-from typing import Optional, List
+from typing import Annotated, Optional, List, Dict
 from datetime import datetime
 from pydantic import BaseModel, Field
+from pydantic.dataclasses import dataclass
 
 class RoutePlaceCreate(BaseModel):
     place_id: int
@@ -29,27 +30,57 @@ class RouteCreate(BaseModel):
     class Config:
         from_attributes = True
 
-class HashTag(BaseModel):
+class RouteOptimizeIn(BaseModel):
+    # 요청당 최적화 비용 상한 (하루 장소 수는 route_optimizer.MAX_STOPS_PER_DAY 로 따로 제한)
+    places: List[RoutePlaceCreate] = Field(..., min_length=1, max_length=300)
+    fix_start: bool = True      # 각 날의 첫 장소를 출발지로 고정
+    fix_end: bool = False       # 각 날의 마지막 장소를 도착지로 고정
+
+class RouteOptimizeOut(BaseModel):
+    places: List[RoutePlaceCreate]   # 날마다 order 를 1부터 다시 매긴 목록 (RouteCreate.places 에 그대로 사용)
+    distance_before_km: float
+    distance_after_km: float
+    distance_saved_km: float
+
+class RouteBatchCreate(BaseModel):
+    routes: List[RouteCreate] = Field(..., min_length=1, max_length=100)
+
+class RouteBatchCreateOut(BaseModel):
+    route_ids: List[int]
+
+# 응답 루트마다 일정 항목 수만큼 만들어지는 하위 객체는 __slots__ dataclass 로 정의
+# (BaseModel 은 인스턴스마다 __dict__ 와 fields_set 을 가져 탐색 페이지 한 번에 수천 개가 할당됨)
+# 필드/alias/JSON 출력은 BaseModel 일 때와 동일합니다.
+@dataclass(slots=True)
+class HashTag:
     period: str         # 여행 기간 (ex. "1박2일")
     env: str            # 장소 환경 (ex. "도시" / "자연")
-    with_who: str = Field(..., alias='with')           # 동반자 (ex. "연인")
+    with_who: Annotated[str, Field(alias='with')]   # 동반자 (ex. "연인")
     move: str           # 이동수단 (ex. "자동차")
     atmosphere: str     # 분위기 (ex. "잔잔하고 조용한")
     place_count: str    # 하루 방문지 수 (ex. "3")
 
-class RoutePlace(BaseModel):
+@dataclass(slots=True)
+class RoutePlace:
     id: int
     name: str
     category: str
     day: int
     order: int
 
-class Transportation(BaseModel):
+@dataclass(slots=True)
+class Transportation:
     id: int
     name: str
     day: int
     order: int
 
+@dataclass(slots=True)
+class DayMetrics:
+    day: int
+    distance_km: float      # 하루 일정의 장소 간 직선 거리 합
+    travel_minutes: int     # tag_move 기준 예상 이동 시간
+
 class LocoRoute(BaseModel):
     user_id: Optional[int] = Field(None, alias='userId')
     id: int
@@ -65,6 +96,11 @@ class LocoRoute(BaseModel):
     count_soso: Optional[int] = Field(None, alias='countSoso')
     count_bad: Optional[int] = Field(None, alias='countBad')
     created_at: datetime
+    is_favorite: Optional[bool] = Field(None, alias='isFavorite')  # 로그인한 경우에만 채워짐
+    # 이동 지표 (장소가 없는 루트는 None)
+    total_distance_km: Optional[float] = Field(None, alias='totalDistanceKm')
+    travel_minutes: Optional[int] = Field(None, alias='travelMinutes')
+    day_metrics: Optional[List[DayMetrics]] = Field(None, alias='dayMetrics')
 
     class Config:
         from_attributes = True
@@ -96,4 +132,9 @@ class RouteExploreOut(BaseModel):
     new_routes: List[LocoRoute]
 
     class Config:
-        populate_by_name = True
\ No newline at end of file
+        populate_by_name = True
+
+class RouteFacetSearchOut(BaseModel):
+    total: int
+    facets: Dict[str, Dict[str, int]]  # 태그 -> {값: 개수}
+    routes: List[LocoRoute]
@@ -0,0 +1,15 @@
+# app/schemas/search.py
+from typing import List
+from pydantic import BaseModel
+from app.schemas.place import PlaceSearchResult
+from app.schemas.route import LocoRoute
+
+class LocalSearchOut(BaseModel):
+    places: List[PlaceSearchResult]
+    routes: List[LocoRoute]
+
+
+class SuggestItem(BaseModel):
+    type: str  # place / route
+    id: int
+    name: str
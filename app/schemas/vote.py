@@ -8,4 +8,10 @@ class PlaceVoteCreate(BaseModel):
 
 class RouteVoteCreate(BaseModel):
     route_id: int
-    vote_type: VoteType
\ No newline at end of file
+    vote_type: VoteType
+
+class VoteAccepted(BaseModel):
+    """write-behind 모드에서 투표가 접수되었음을 알리는 응답 (집계 반영은 VOTE_FLUSH_INTERVAL_MS 이내)"""
+    target_id: int
+    vote_type: VoteType
+    queued: bool = True
@@ -0,0 +1,310 @@
+# app/services/autocomplete.py
+import asyncio
+import bisect
+import heapq
+import logging
+import threading
+import time
+from typing import Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+
+import numpy as np
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.models import Place, Route
+from app.utils.hangul import to_jamo_key, to_choseong_key, is_choseong_query
+
+logger = logging.getLogger(__name__)
+
+PLACE = "place"
+ROUTE = "route"
+
+# 인기도가 같은 후보를 이름 길이순으로 고를 때 최대 몇 개까지 살펴볼지
+MAX_CANDIDATES = 1000
+
+# 새 키는 이 개수만큼 정렬된 버퍼에 모았다가 본 배열에 한 번에 병합
+PENDING_MERGE_SIZE = 1024
+
+# 다른 워커에서 생성된 장소/루트를 반영하기 위한 증분 갱신 주기
+REFRESH_INTERVAL_SECONDS = 30
+
+# 접두어 구간의 끝을 찾기 위한 센티널 (키에 나오지 않는 가장 큰 코드 포인트)
+_KEY_SENTINEL = "\U0010ffff"
+
+
+class _PrefixIndex:
+    """
+    정렬된 키 배열 + bisect 기반 접두어 인덱스. keys[i]는 entries[refs[i]]를 가리킵니다.
+    키 순서대로 놓은 인기도(weight) 위에 구간 최댓값 세그먼트 트리를 두어,
+    접두어가 일치하는 구간 전체에서 인기순으로 후보를 꺼냅니다. (구간 크기와 무관하게 O(k log n))
+    새 키는 작은 정렬 버퍼에 넣었다가 PENDING_MERGE_SIZE개가 모이면 한 번에 병합합니다.
+    """
+
+    __slots__ = ("keys", "refs", "_tree", "_size", "_pending")
+
+    def __init__(self):
+        self.keys: List[str] = []
+        self.refs: List[int] = []
+        self._pending: List[Tuple[str, int, int]] = []  # (key, ref, weight), key 순으로 정렬
+        self._build_tree(np.empty(0, dtype=np.int64))
+
+    def load(self, triples: List[Tuple[str, int, int]]) -> None:
+        triples.sort()
+        self.keys = [key for key, _, _ in triples]
+        self.refs = [ref for _, ref, _ in triples]
+        self._build_tree(np.fromiter((weight for _, _, weight in triples), dtype=np.int64, count=len(triples)))
+        self._pending = []
+
+    def _build_tree(self, weights: np.ndarray) -> None:
+        # 리프는 [size, size + n), 노드 i의 자식은 2i, 2i+1 (빈 리프는 -1)
+        size = 1
+        while size < len(weights):
+            size *= 2
+        tree = np.full(2 * size, -1, dtype=np.int64)
+        tree[size:size + len(weights)] = weights
+        level = size
+        while level > 1:
+            tree[level // 2:level] = np.maximum(tree[level:2 * level:2], tree[level + 1:2 * level:2])
+            level //= 2
+        self._tree, self._size = tree, size
+
+    def insert_many(self, triples: List[Tuple[str, int, int]]) -> None:
+        """여러 키를 한 번 정렬해 버퍼에 넣고, 버퍼가 차면 한 번에 병합합니다."""
+        self._pending.extend(triples)
+        self._pending.sort()
+        if len(self._pending) >= PENDING_MERGE_SIZE:
+            self._merge_pending()
+
+    def _merge_pending(self) -> None:
+        # 버퍼(정렬됨)의 삽입 위치를 bisect로 찾고, 슬라이스를 이어 붙여 한 번에 병합 (O(n) 복사)
+        positions = [bisect.bisect_right(self.keys, key) for key, _, _ in self._pending]
+        keys: List[str] = []
+        refs: List[int] = []
+        prev = 0
+        for pos, (key, ref, _) in zip(positions, self._pending):
+            keys.extend(self.keys[prev:pos])
+            refs.extend(self.refs[prev:pos])
+            keys.append(key)
+            refs.append(ref)
+            prev = pos
+        keys.extend(self.keys[prev:])
+        refs.extend(self.refs[prev:])
+        weights = np.insert(
+            self._tree[self._size:self._size + len(self.keys)], positions, [w for _, _, w in self._pending]
+        )
+        self.keys, self.refs = keys, refs
+        self._build_tree(weights)
+        self._pending = []
+
+    def _ranked_main(self, lo: int, hi: int) -> Iterator[Tuple[int, int]]:
+        # [lo, hi) 를 덮는 노드들을 힙에 넣고, 꺼낸 노드가 리프가 아니면 자식을 다시 넣어 큰 weight 순으로 리프를 반환
+        tree, size = self._tree, self._size
+        heap = []
+        lo, hi = lo + size, hi + size
+        while lo < hi:
+            if lo & 1:
+                heap.append((-int(tree[lo]), lo))
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                heap.append((-int(tree[hi]), hi))
+            lo, hi = lo >> 1, hi >> 1
+        heapq.heapify(heap)
+        while heap:
+            neg_weight, node = heapq.heappop(heap)
+            if node >= size:
+                yield -neg_weight, self.refs[node - size]
+            else:
+                heapq.heappush(heap, (-int(tree[2 * node]), 2 * node))
+                heapq.heappush(heap, (-int(tree[2 * node + 1]), 2 * node + 1))
+
+    def ranked(self, prefix: str) -> Iterator[Tuple[int, int]]:
+        """접두어가 일치하는 (weight, ref)를 weight가 큰 순서로 반환합니다."""
+        end = prefix + _KEY_SENTINEL
+        main = self._ranked_main(bisect.bisect_left(self.keys, prefix), bisect.bisect_left(self.keys, end))
+        lo, hi = bisect.bisect_left(self._pending, (prefix,)), bisect.bisect_left(self._pending, (end,))
+        pending = sorted(((weight, ref) for _, ref, weight in self._pending[lo:hi]), reverse=True)
+        return heapq.merge(main, pending, key=lambda item: -item[0])
+
+
+def _word_starts(name: str) -> List[str]:
+    """이름 전체와 공백으로 구분된 각 단어부터 시작하는 부분 문자열 (예: '서울 경복궁' → ['서울 경복궁', '경복궁'])"""
+    words = name.split()
+    return [" ".join(words[i:]) for i in range(len(words))] or [name]
+
+
+class AutocompleteIndex:
+    """
+    장소/루트 이름 자동완성 인덱스.
+    이름을 호환 자모 키('ㄱㅕㅇㅂㅗㄱ...')와 초성 키('ㄱㅂㄱ')로 분해해 각각 정렬 배열에 보관하고,
+    입력 중인 음절('경ㅂ')과 초성 검색('ㄱㅂ')을 모두 접두어 검색으로 처리합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: List[Tuple[str, int, str, int]] = []  # (kind, id, name, weight)
+        self._jamo = _PrefixIndex()
+        self._choseong = _PrefixIndex()
+        # DB에서 읽어 온 최대 id (이 워커의 add 로는 올리지 않음, 다른 워커가 만든 더 작은 id를 놓치지 않도록)
+        self._db_max_ids = {PLACE: 0, ROUTE: 0}
+        # 이 워커에서 add 했지만 아직 DB에서 읽지 않은 (kind, id), 증분 갱신 때 중복 추가하지 않음
+        self._local_ids: Set[Tuple[str, int]] = set()
+        # 빌드 중(load 실행 중)에 add 된 항목, 새 인덱스로 교체한 뒤 다시 반영
+        self._adds_during_load: Optional[List[Tuple[str, int, str, int]]] = None
+        self._refreshed_at = 0.0
+        self.ready = False
+
+    @staticmethod
+    def _keys(name: str) -> Tuple[List[str], List[str]]:
+        starts = _word_starts(name)
+        return [to_jamo_key(s) for s in starts], [to_choseong_key(s) for s in starts]
+
+    def load(self, rows: Iterable[Mapping]) -> int:
+        """
+        kind, id, name, weight 를 가진 행 목록으로 인덱스를 새로 만듭니다.
+        build 가 행을 읽는 동안 add 된 항목은 교체 후 다시 반영합니다.
+        """
+        entries, jamo_triples, choseong_triples = [], [], []
+        max_ids = {PLACE: 0, ROUTE: 0}
+        for row in rows:
+            ref = len(entries)
+            weight = row["weight"] or 0
+            entries.append((row["kind"], row["id"], row["name"], weight))
+            max_ids[row["kind"]] = max(max_ids[row["kind"]], row["id"])
+            jamo_keys, choseong_keys = self._keys(row["name"])
+            jamo_triples.extend((key, ref, weight) for key in jamo_keys)
+            choseong_triples.extend((key, ref, weight) for key in choseong_keys)
+
+        jamo, choseong = _PrefixIndex(), _PrefixIndex()
+        jamo.load(jamo_triples)
+        choseong.load(choseong_triples)
+        with self._lock:
+            self._entries, self._jamo, self._choseong = entries, jamo, choseong
+            self._add_many_locked([(entry, *self._keys(entry[2])) for entry in self._adds_during_load or []])
+            self._adds_during_load = None
+            self._db_max_ids = max_ids
+            self._local_ids = set()
+            self._refreshed_at = time.monotonic()
+            self.ready = True
+        return len(entries)
+
+    def build(self, db: Session) -> int:
+        """DB의 전체 장소/루트 이름으로 인덱스를 새로 만듭니다. (인기도도 이때 갱신)"""
+        with self._lock:
+            self._adds_during_load = []
+        try:
+            return self.load(self._fetch(db, place_after=0, route_after=0))
+        except Exception:
+            with self._lock:
+                self._adds_during_load = None
+            raise
+
+    @staticmethod
+    def _fetch(db: Session, place_after: int, route_after: int) -> Iterable[Mapping]:
+        places = select(Place.place_id, Place.name, Place.count_real).where(Place.place_id > place_after)
+        for row in db.execute(places.execution_options(yield_per=10000)):
+            yield {"kind": PLACE, "id": row.place_id, "name": row.name, "weight": row.count_real}
+        routes = select(Route.route_id, Route.name, Route.count_real).where(Route.route_id > route_after)
+        for row in db.execute(routes.execution_options(yield_per=10000)):
+            yield {"kind": ROUTE, "id": row.route_id, "name": row.name, "weight": row.count_real}
+
+    def add(self, kind: str, id: int, name: str, weight: int = 0) -> None:
+        """이름 1건을 인덱스에 추가합니다. (장소/루트 생성 시 호출)"""
+        self.add_many([(kind, id, name, weight)])
+
+    def add_many(self, items: Iterable[Tuple[str, int, str, int]]) -> None:
+        """(kind, id, name, weight) 여러 건을 한 번에 추가합니다. 새 키는 한 번만 정렬해 병합합니다. (일괄 등록 시 호출)"""
+        keyed = [(entry, *self._keys(entry[2])) for entry in items if entry[2]]
+        if not keyed:
+            return
+        with self._lock:
+            self._add_many_locked(keyed)
+            self._local_ids.update((entry[0], entry[1]) for entry, _, _ in keyed)
+            if self._adds_during_load is not None:
+                self._adds_during_load.extend(entry for entry, _, _ in keyed)
+
+    def _add_many_locked(self, keyed: List[Tuple[Tuple[str, int, str, int], List[str], List[str]]]) -> None:
+        # self._lock 안에서 호출
+        jamo_triples, choseong_triples = [], []
+        for entry, jamo_keys, choseong_keys in keyed:
+            ref = len(self._entries)
+            self._entries.append(entry)
+            jamo_triples.extend((key, ref, entry[3]) for key in jamo_keys)
+            choseong_triples.extend((key, ref, entry[3]) for key in choseong_keys)
+        self._jamo.insert_many(jamo_triples)
+        self._choseong.insert_many(choseong_triples)
+
+    def refresh_if_stale(self, db: Session) -> None:
+        """
+        마지막 갱신 이후 다른 프로세스에서 생성된 장소/루트를 증분 반영합니다.
+        DB에서 읽은 최대 id 이후만 조회하므로, 늦게 커밋된 작은 id와 인기도 변화는 주기적 재빌드에서 반영됩니다.
+        """
+        if not self.ready or time.monotonic() - self._refreshed_at < REFRESH_INTERVAL_SECONDS:
+            return
+        rows = list(self._fetch(db, place_after=self._db_max_ids[PLACE], route_after=self._db_max_ids[ROUTE]))
+        keyed = [(row, self._keys(row["name"])) for row in rows if row["name"]]
+        with self._lock:
+            new = []
+            for row, (jamo_keys, choseong_keys) in keyed:
+                ident = (row["kind"], row["id"])
+                if ident in self._local_ids:
+                    self._local_ids.discard(ident)
+                    continue
+                new.append(((row["kind"], row["id"], row["name"], row["weight"] or 0), jamo_keys, choseong_keys))
+            self._add_many_locked(new)
+            for row in rows:
+                self._db_max_ids[row["kind"]] = max(self._db_max_ids[row["kind"]], row["id"])
+            self._refreshed_at = time.monotonic()
+
+    def suggest(self, q: str, limit: int = 10) -> List[Tuple[str, int, str]]:
+        """접두어가 일치하는 이름을 인기순(weight)으로 최대 limit개 반환합니다. [(kind, id, name)]"""
+        q = q.strip()
+        if not q:
+            return []
+        if is_choseong_query(q):
+            index, prefix = self._choseong, to_choseong_key(q)
+        else:
+            index, prefix = self._jamo, to_jamo_key(q)
+
+        with self._lock:
+            # 인기순으로 꺼내다가 limit개를 채우면, 이름 길이 정렬을 위해 같은 인기도까지만 더 살펴봄
+            seen = set()
+            candidates = []
+            cutoff = None
+            for weight, ref in index.ranked(prefix):
+                if (cutoff is not None and weight < cutoff) or len(candidates) >= MAX_CANDIDATES:
+                    break
+                entry = self._entries[ref]
+                if (entry[0], entry[1]) in seen:
+                    continue
+                seen.add((entry[0], entry[1]))
+                candidates.append(entry)
+                if len(candidates) == limit:
+                    cutoff = weight
+        top = heapq.nsmallest(limit, candidates, key=lambda e: (-e[3], len(e[2]), e[2]))
+        return [(kind, id, name) for kind, id, name, _ in top]
+
+
+autocomplete_index = AutocompleteIndex()
+
+
+def build_autocomplete_index() -> None:
+    """독립 세션으로 자동완성 인덱스를 빌드합니다. (앱 시작 시 백그라운드 실행)"""
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        count = autocomplete_index.build(db)
+        logger.info("자동완성 인덱스 빌드 완료: %d건 (%.2fs)", count, time.perf_counter() - started)
+    except Exception:
+        logger.exception("자동완성 인덱스 빌드 실패")
+    finally:
+        db.close()
+
+
+async def autocomplete_index_scheduler(interval_seconds: int) -> None:
+    """interval_seconds 간격으로 인덱스를 다시 빌드해 인기도 변화와 증분 갱신에서 놓친 장소/루트를 반영합니다."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        await asyncio.to_thread(build_autocomplete_index)
@@ -1,5 +1,7 @@
 # app/services/external_api.py
 import ssl
+import time
+from urllib.parse import urlsplit
 import certifi
 import requests
 from urllib3.util.retry import Retry
@@ -8,6 +10,7 @@ from fastapi import HTTPException
 from xml.etree import ElementTree as ET
 
 from app.core.config import settings
+from app.core.metrics import EXTERNAL_API_CALLS, EXTERNAL_API_DURATION
 
 TOUR_API_BASE = "https://apis.data.go.kr/B551011/KorService2/searchKeyword2"
 KAKAO_LOCAL_API_BASE = "https://dapi.kakao.com/v2/local/search/keyword.json"
@@ -37,6 +40,24 @@ class LegacySSLAdapter(HTTPAdapter):
         kwargs["ssl_context"] = self._context
         return super().proxy_manager_for(*args, **kwargs)
 
+class InstrumentedSession(requests.Session):
+    """호스트별 외부 API 호출 수(응답 코드/예외 종류)와 호출 시간을 기록하는 세션"""
+
+    def request(self, method, url, *args, **kwargs):
+        host = urlsplit(url).hostname or "unknown"
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            resp = super().request(method, url, *args, **kwargs)
+            outcome = str(resp.status_code)
+            return resp
+        except requests.RequestException as e:
+            outcome = type(e).__name__
+            raise
+        finally:
+            EXTERNAL_API_CALLS.labels(host, outcome).inc()
+            EXTERNAL_API_DURATION.labels(host).observe(time.perf_counter() - started)
+
 # 세션 구성
 base_retries = Retry(
     total=3,
@@ -44,7 +65,7 @@ base_retries = Retry(
     status_forcelist=[429, 500, 502, 503, 504],
     allowed_methods=["GET"],
 )
-session = requests.Session()
+session = InstrumentedSession()
 session.mount("https://", HTTPAdapter(max_retries=base_retries))
 session.mount("https://apis.data.go.kr", LegacySSLAdapter(max_retries=base_retries))
 
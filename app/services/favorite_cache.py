@@ -0,0 +1,87 @@
+# app/services/favorite_cache.py
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Callable, Hashable, Iterable, Iterator, Tuple
+
+# 캐시에 유지할 최대 (종류, 사용자) 수 — 초과 시 가장 오래 사용하지 않은 항목부터 제거
+MAX_ENTRIES = 10_000
+
+# 다른 워커에서 변경된 찜 목록을 반영하기 위한 만료 시간
+TTL_SECONDS = 60
+
+
+class FavoriteIds:
+    """
+    한 사용자의 찜 id 집합.
+    정렬된 int64 배열 하나로 보관하므로 id 하나당 8바이트만 사용하며,
+    포함 여부는 이진 탐색으로 확인합니다.
+    """
+    __slots__ = ("_ids",)
+
+    def __init__(self, ids: Iterable[int] = ()):
+        self._ids = array("q", sorted(set(ids)))
+
+    def __contains__(self, value: int) -> bool:
+        i = bisect_left(self._ids, value)
+        return i < len(self._ids) and self._ids[i] == value
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def tolist(self):
+        return self._ids.tolist()
+
+
+class FavoriteMembershipCache:
+    """
+    사용자별 찜 목록 캐시 (LRU + TTL).
+    같은 워커의 찜 추가/삭제 시 invalidate 로 즉시 무효화하고,
+    다른 워커의 변경은 TTL_SECONDS 이내에 반영됩니다.
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, ttl: float = TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[float, FavoriteIds]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 조회 도중 무효화가 일어나면 조회 결과를 캐시에 넣지 않기 위한 버전
+        self._version = 0
+
+    def get(self, kind: str, user_id: int, loader: Callable[[], Iterable[int]]) -> FavoriteIds:
+        key = (kind, user_id)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] < self.ttl:
+                self._entries.move_to_end(key)
+                return entry[1]
+            version = self._version
+
+        # DB 조회는 락 밖에서 수행
+        ids = FavoriteIds(loader())
+        with self._lock:
+            if version != self._version:
+                return ids
+            self._entries[key] = (now, ids)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return ids
+
+    def invalidate(self, kind: str, user_id: int) -> None:
+        with self._lock:
+            self._version += 1
+            self._entries.pop((kind, user_id), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+favorite_cache = FavoriteMembershipCache()
@@ -0,0 +1,46 @@
+# app/services/itinerary.py
+from typing import Iterable, List, Optional, Tuple
+
+# 루트 일정 스냅샷(Route.itinerary) 포맷
+# {
+#   "places": [{"id", "name", "category", "day", "order"}, ...],          # (day, order) 순
+#   "transportations": [{"id", "name", "day", "order"}, ...],             # (day, order) 순, 중복 제거
+# }
+# LocoRoute.places / LocoRoute.transportations 와 필드가 동일하여 그대로 직렬화할 수 있습니다.
+
+
+def build_itinerary(
+    stops: Iterable[Tuple[int, str, str, int, int]],
+    transports: Iterable[Tuple[str, int, int]],
+) -> dict:
+    """
+    장소 (place_id, name, category, day, order)와 이동수단 (name, day, order) 목록으로
+    일정 스냅샷을 만듭니다.
+    """
+    places = [
+        {"id": place_id, "name": name, "category": category, "day": day, "order": order}
+        for place_id, name, category, day, order in sorted(stops, key=lambda s: (s[3], s[4]))
+    ]
+
+    transportations = []
+    seen = set()
+    for name, day, order in sorted(transports, key=lambda t: (t[1], t[2])):
+        # 같은 day, order를 가진 이동수단은 하나만 유지
+        if not name or (day, order) in seen:
+            continue
+        seen.add((day, order))
+        transportations.append({"id": len(transportations) + 1, "name": name, "day": day, "order": order})
+
+    return {"places": places, "transportations": transportations}
+
+
+def itinerary_from_place_maps(place_maps: Iterable) -> dict:
+    """RoutePlaceMap 목록으로부터 스냅샷을 만듭니다. (스냅샷이 없는 기존 루트용)"""
+    stops: List[Tuple[int, str, str, int, int]] = []
+    transports: List[Tuple[Optional[str], int, int]] = []
+    for p_map in place_maps:
+        if p_map.place:
+            stops.append((p_map.place.place_id, p_map.place.name, p_map.place.type, p_map.day, p_map.order))
+        if p_map.transportation:
+            transports.append((p_map.transportation, p_map.day, p_map.order))
+    return build_itinerary(stops, transports)
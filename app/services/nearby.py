@@ -0,0 +1,284 @@
+# app/services/nearby.py
+import asyncio
+import logging
+import math
+import threading
+import time
+from typing import Iterable, List, Mapping, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.crud.scoring import WILSON_Z
+from app.models import Place
+from app.services.route_metrics import haversine_km
+
+logger = logging.getLogger(__name__)
+
+# 격자 한 칸의 크기(도). 위도 0.02도 ≈ 2.2km
+CELL_DEG = 0.02
+LNG_CELLS = math.ceil(360 / CELL_DEG)
+KM_PER_DEG_LAT = 111.32
+
+# 근처 장소 순위: 거리 점수(1 - 거리/반경)와 Wilson score 의 가중 합
+NEARBY_DISTANCE_WEIGHT = 0.7
+
+# 새 장소는 이 개수만큼 별도 버퍼에 모았다가 정렬 배열에 병합
+PENDING_MERGE_SIZE = 1024
+
+# 다른 워커에서 생성된 장소를 반영하기 위한 증분 갱신 주기
+REFRESH_INTERVAL_SECONDS = 30
+
+
+def cell_keys(lat: np.ndarray, lng: np.ndarray) -> np.ndarray:
+    """위경도 → 격자 칸 번호 (위도 행 * LNG_CELLS + 경도 열). 같은 위도 행의 칸은 번호가 연속"""
+    rows = np.floor((np.asarray(lat) + 90) / CELL_DEG).astype(np.int64)
+    cols = np.floor((np.asarray(lng) + 180) / CELL_DEG).astype(np.int64)
+    return rows * LNG_CELLS + cols
+
+
+def wilson_lower_bound(positive: np.ndarray, negative: np.ndarray) -> np.ndarray:
+    """crud.scoring.wilson_score 와 같은 식의 NumPy 버전 (투표가 없으면 0)"""
+    n = (positive + negative).astype(np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        p = positive / n
+        z = WILSON_Z
+        score = (p + z * z / (2 * n) - z * np.sqrt((p * (1 - p) + z * z / (4 * n)) / n)) / (1 + z * z / n)
+    return np.where(n > 0, score, 0.0)
+
+
+def rank_nearby(distances_km: np.ndarray, scores: np.ndarray, radius_km: float) -> np.ndarray:
+    """거리와 Wilson score 를 섞은 점수 (클수록 앞)"""
+    return NEARBY_DISTANCE_WEIGHT * (1 - distances_km / radius_km) + (1 - NEARBY_DISTANCE_WEIGHT) * scores
+
+
+def top_nearby(
+    latitude: float,
+    longitude: float,
+    ids: np.ndarray,
+    lat: np.ndarray,
+    lng: np.ndarray,
+    scores: np.ndarray,
+    radius_km: float,
+    limit: int,
+    exclude: Optional[int] = None,
+) -> List[Tuple[int, float]]:
+    """후보 장소 중 반경 안에 있는 것을 rank_nearby 점수순으로 최대 limit개 반환합니다. [(place_id, 거리 km)]"""
+    distances = haversine_km(latitude, longitude, lat, lng)
+    within = distances <= radius_km
+    if exclude is not None:
+        within &= ids != exclude
+    ids, distances, scores = ids[within], distances[within], scores[within]
+    if not len(ids):
+        return []
+
+    rank = rank_nearby(distances, scores, radius_km)
+    top = np.argpartition(-rank, limit)[:limit] if len(rank) > limit else np.arange(len(rank))
+    top = top[np.argsort(-rank[top], kind="stable")]
+    return list(zip(ids[top].tolist(), distances[top].tolist()))
+
+
+def bounding_box(latitude: float, longitude: float, radius_km: float) -> Tuple[float, float, float, float]:
+    """반경을 덮는 (최소 위도, 최대 위도, 최소 경도, 최대 경도)"""
+    dlat = radius_km / KM_PER_DEG_LAT
+    dlng = radius_km / (KM_PER_DEG_LAT * max(math.cos(math.radians(latitude)), 0.01))
+    return latitude - dlat, latitude + dlat, longitude - dlng, longitude + dlng
+
+
+def nearby_from_rows(
+    latitude: float, longitude: float, rows: Iterable, radius_km: float, limit: int, exclude: Optional[int] = None,
+) -> List[Tuple[int, float]]:
+    """(place_id, latitude, longitude, count_real, count_bad) 행으로 top_nearby 를 계산합니다. (인덱스 준비 전 SQL 대체 경로)"""
+    rows = list(rows)
+    if not rows:
+        return []
+    ids, lat, lng, real, bad = (np.array(column) for column in zip(*rows))
+    return top_nearby(
+        latitude, longitude, ids.astype(np.int64), lat.astype(np.float64), lng.astype(np.float64),
+        wilson_lower_bound(real, bad), radius_km, limit, exclude,
+    )
+
+
+class NearbyIndex:
+    """
+    장소 좌표 격자 인덱스.
+    모든 장소를 격자 칸 번호 순으로 정렬한 배열(id, 위도, 경도, Wilson score)로 보관하고,
+    질의 지점 주변 칸들을 위도 행마다 searchsorted 한 번으로 찾아 후보만 거리 계산합니다.
+    새 장소는 작은 버퍼에 추가했다가 PENDING_MERGE_SIZE 개가 모이면 정렬 배열에 병합합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._keys = np.empty(0, dtype=np.int64)
+        self._ids = np.empty(0, dtype=np.int64)
+        self._lat = np.empty(0)
+        self._lng = np.empty(0)
+        self._scores = np.empty(0)
+        self._pending: List[Tuple[int, float, float, float]] = []  # (place_id, lat, lng, score)
+        # DB에서 읽어 온 최대 place_id (이 워커의 add 로는 올리지 않음, 다른 워커가 만든 더 작은 id를 놓치지 않도록)
+        self._db_max_place_id = 0
+        # 이 워커에서 add 했지만 아직 DB에서 읽지 않은 place_id, 증분 갱신 때 중복 추가하지 않음
+        self._local_ids: Set[int] = set()
+        # 빌드 중(DB 조회 시작 이후)에 add 된 장소, 새 배열로 교체한 뒤 버퍼에 다시 넣음
+        self._adds_during_load: Optional[List[Tuple[int, float, float, float]]] = None
+        self._refreshed_at = 0.0
+        self.ready = False
+
+    def load(self, ids: np.ndarray, lat: np.ndarray, lng: np.ndarray, scores: np.ndarray) -> int:
+        """
+        장소 배열로 인덱스를 새로 만듭니다. 반환값은 색인된 장소 수입니다.
+        build 가 DB 조회를 시작한 뒤 add 된 장소 중 배열에 없는 것은 버퍼로 옮겨 유지합니다.
+        """
+        keys = cell_keys(lat, lng)
+        order = np.argsort(keys, kind="stable")
+        ids = np.asarray(ids, dtype=np.int64)[order]
+        with self._lock:
+            self._keys, self._ids = keys[order], ids
+            self._lat, self._lng = np.asarray(lat, dtype=np.float64)[order], np.asarray(lng, dtype=np.float64)[order]
+            self._scores = np.asarray(scores, dtype=np.float64)[order]
+            added = self._adds_during_load or []
+            loaded = np.isin([place[0] for place in added], ids) if added else []
+            self._pending = [place for place, is_loaded in zip(added, loaded) if not is_loaded]
+            self._adds_during_load = None
+            self._db_max_place_id = int(ids.max()) if len(ids) else 0
+            self._local_ids = set()
+            self._refreshed_at = time.monotonic()
+            self.ready = True
+        return len(ids)
+
+    def build(self, db: Session) -> int:
+        """DB의 전체 장소로 인덱스를 새로 만듭니다. (투표 수가 바뀐 Wilson score 도 이때 갱신)"""
+        with self._lock:
+            self._adds_during_load = []
+        try:
+            return self._load_rows(self._fetch(db, after=0))
+        except Exception:
+            with self._lock:
+                self._adds_during_load = None
+            raise
+
+    def _load_rows(self, rows: Iterable[Mapping]) -> int:
+        ids, lat, lng, real, bad = [], [], [], [], []
+        for row in rows:
+            ids.append(row["place_id"])
+            lat.append(row["latitude"])
+            lng.append(row["longitude"])
+            real.append(row["count_real"] or 0)
+            bad.append(row["count_bad"] or 0)
+        return self.load(
+            np.array(ids, dtype=np.int64), np.array(lat, dtype=np.float64), np.array(lng, dtype=np.float64),
+            wilson_lower_bound(np.array(real), np.array(bad)),
+        )
+
+    @staticmethod
+    def _fetch(db: Session, after: int) -> Iterable[Mapping]:
+        stmt = select(Place.place_id, Place.latitude, Place.longitude, Place.count_real, Place.count_bad).where(
+            Place.place_id > after
+        )
+        for row in db.execute(stmt.execution_options(yield_per=10000)):
+            yield row._mapping
+
+    def add(self, place_id: int, latitude: float, longitude: float, count_real: int = 0, count_bad: int = 0) -> None:
+        """장소 1건을 인덱스에 추가합니다. (장소 생성 시 호출)"""
+        score = float(wilson_lower_bound(np.array([count_real]), np.array([count_bad]))[0])
+        place = (place_id, latitude, longitude, score)
+        with self._lock:
+            self._local_ids.add(place_id)
+            if self._adds_during_load is not None:
+                self._adds_during_load.append(place)
+            self._append_locked(place)
+
+    def _append_locked(self, place: Tuple[int, float, float, float]) -> None:
+        # self._lock 안에서 호출
+        self._pending.append(place)
+        if len(self._pending) >= PENDING_MERGE_SIZE:
+            self._merge_pending()
+
+    def _merge_pending(self) -> None:
+        # self._lock 안에서 호출. 버퍼를 정렬한 뒤 searchsorted 위치에 끼워 넣음 (전체 재정렬 없이 O(n) 복사)
+        ids, lat, lng, scores = (np.array(column) for column in zip(*self._pending))
+        keys = cell_keys(lat, lng)
+        order = np.argsort(keys, kind="stable")
+        positions = np.searchsorted(self._keys, keys[order], side="right")
+        self._keys = np.insert(self._keys, positions, keys[order])
+        self._ids = np.insert(self._ids, positions, ids[order].astype(np.int64))
+        self._lat = np.insert(self._lat, positions, lat[order])
+        self._lng = np.insert(self._lng, positions, lng[order])
+        self._scores = np.insert(self._scores, positions, scores[order])
+        self._pending = []
+
+    def refresh_if_stale(self, db: Session) -> None:
+        """
+        마지막 갱신 이후 다른 프로세스에서 생성된 장소를 증분 반영합니다.
+        DB에서 읽은 최대 id 이후만 조회하므로, 늦게 커밋된 작은 id는 주기적 재빌드에서 반영됩니다.
+        """
+        if not self.ready or time.monotonic() - self._refreshed_at < REFRESH_INTERVAL_SECONDS:
+            return
+        rows = list(self._fetch(db, after=self._db_max_place_id))
+        scores = wilson_lower_bound(
+            np.array([row["count_real"] or 0 for row in rows]), np.array([row["count_bad"] or 0 for row in rows])
+        )
+        with self._lock:
+            for row, score in zip(rows, scores.tolist()):
+                place_id = row["place_id"]
+                self._db_max_place_id = max(self._db_max_place_id, place_id)
+                if place_id in self._local_ids:
+                    self._local_ids.discard(place_id)
+                    continue
+                self._append_locked((place_id, row["latitude"], row["longitude"], score))
+            self._refreshed_at = time.monotonic()
+
+    def nearby(
+        self, latitude: float, longitude: float, radius_km: float, limit: int, exclude: Optional[int] = None,
+    ) -> List[Tuple[int, float]]:
+        """반경 radius_km 안의 장소를 거리/Wilson score 혼합 점수순으로 최대 limit개 반환합니다. [(place_id, 거리 km)]"""
+        with self._lock:
+            keys, ids, lat, lng, scores = self._keys, self._ids, self._lat, self._lng, self._scores
+            pending = list(self._pending)
+
+        # 반경을 덮는 위도 행 범위와, 행마다 같은 경도 칸 범위 (칸 번호가 연속이므로 행마다 한 구간)
+        lat_cells = math.ceil(radius_km / (KM_PER_DEG_LAT * CELL_DEG))
+        lng_cells = math.ceil(radius_km / (KM_PER_DEG_LAT * CELL_DEG * max(math.cos(math.radians(latitude)), 0.01)))
+        center = int(cell_keys(latitude, longitude))
+        row_starts = center + np.arange(-lat_cells, lat_cells + 1) * LNG_CELLS
+        starts = np.searchsorted(keys, row_starts - lng_cells, side="left")
+        ends = np.searchsorted(keys, row_starts + lng_cells, side="right")
+        candidates = np.concatenate([np.arange(s, e) for s, e in zip(starts.tolist(), ends.tolist())])
+
+        cand_ids, cand_lat, cand_lng, cand_scores = ids[candidates], lat[candidates], lng[candidates], scores[candidates]
+        if pending:
+            p_ids, p_lat, p_lng, p_scores = (np.array(column) for column in zip(*pending))
+            cand_ids = np.concatenate((cand_ids, p_ids.astype(np.int64)))
+            cand_lat, cand_lng = np.concatenate((cand_lat, p_lat)), np.concatenate((cand_lng, p_lng))
+            cand_scores = np.concatenate((cand_scores, p_scores))
+
+        return top_nearby(latitude, longitude, cand_ids, cand_lat, cand_lng, cand_scores, radius_km, limit, exclude)
+
+    @property
+    def size(self) -> int:
+        return len(self._ids) + len(self._pending)
+
+
+nearby_index = NearbyIndex()
+
+
+def build_nearby_index() -> None:
+    """독립 세션으로 근처 장소 인덱스를 빌드합니다. (앱 시작 시 백그라운드 실행)"""
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        count = nearby_index.build(db)
+        logger.info("근처 장소 인덱스 빌드 완료: %d건 (%.2fs)", count, time.perf_counter() - started)
+    except Exception:
+        logger.exception("근처 장소 인덱스 빌드 실패 (SQL 조회로 대체)")
+    finally:
+        db.close()
+
+
+async def nearby_index_scheduler(interval_seconds: int) -> None:
+    """interval_seconds 간격으로 인덱스를 다시 빌드해 투표 수 변화를 Wilson score 에 반영합니다."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        await asyncio.to_thread(build_nearby_index)
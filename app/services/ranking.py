@@ -0,0 +1,130 @@
+# app/services/ranking.py
+import asyncio
+import logging
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.crud.user import crud_user
+
+logger = logging.getLogger(__name__)
+
+# 포인트 산정 기준 (받은 투표/찜 기준)
+POINTS_PER_REAL_VOTE = 3
+POINTS_PER_NORMAL_VOTE = 1
+POINTS_PER_FAVORITE = 5
+
+# 등급 기준: 랭킹 상위 비율
+GRADE_S_RATIO = 0.05
+GRADE_A_RATIO = 0.20
+GRADE_B_RATIO = 0.50
+
+# 여러 워커가 동시에 실행하지 않도록 사용하는 advisory lock 키
+RANKING_LOCK_KEY = 7305001
+
+# 포인트 → 랭킹 → 등급을 한 번의 UPDATE ... FROM 으로 갱신합니다.
+# 값이 바뀐 행만 갱신하여 대규모 사용자 테이블에서도 쓰기량을 최소화합니다.
+RECOMPUTE_SQL = text("""
+WITH received AS (
+    SELECT p.created_by AS user_id,
+           SUM(CASE pv.vote_type WHEN 'real' THEN :real_pts WHEN 'normal' THEN :normal_pts ELSE 0 END) AS pts
+    FROM place_votes pv JOIN places p ON p.place_id = pv.place_id
+    GROUP BY p.created_by
+    UNION ALL
+    SELECT r.created_by,
+           SUM(CASE rv.vote_type WHEN 'real' THEN :real_pts WHEN 'normal' THEN :normal_pts ELSE 0 END)
+    FROM route_votes rv JOIN routes r ON r.route_id = rv.route_id
+    GROUP BY r.created_by
+    UNION ALL
+    SELECT p.created_by, COUNT(*) * :fav_pts
+    FROM favorite_places fp JOIN places p ON p.place_id = fp.place_id
+    GROUP BY p.created_by
+    UNION ALL
+    SELECT r.created_by, COUNT(*) * :fav_pts
+    FROM favorite_routes fr JOIN routes r ON r.route_id = fr.route_id
+    GROUP BY r.created_by
+),
+totals AS (
+    SELECT user_id, SUM(pts)::int AS points
+    FROM received
+    GROUP BY user_id
+),
+ranked AS (
+    SELECT u.id,
+           COALESCE(t.points, 0) AS points,
+           CASE WHEN COALESCE(t.points, 0) > 0
+                THEN row_number() OVER (ORDER BY COALESCE(t.points, 0) DESC, u.id)
+           END AS ranking,
+           COUNT(*) FILTER (WHERE COALESCE(t.points, 0) > 0) OVER () AS ranked_total
+    FROM users u
+    LEFT JOIN totals t ON t.user_id = u.id
+),
+graded AS (
+    SELECT id, points, ranking,
+           (CASE
+                WHEN ranking IS NULL THEN 'C'
+                WHEN ranking <= CEIL(ranked_total * :s_ratio) THEN 'S'
+                WHEN ranking <= CEIL(ranked_total * :a_ratio) THEN 'A'
+                WHEN ranking <= CEIL(ranked_total * :b_ratio) THEN 'B'
+                ELSE 'C'
+            END)::usergrade AS grade,
+           ranked_total
+    FROM ranked
+)
+UPDATE users u
+SET points = g.points, ranking = g.ranking, grade = g.grade
+FROM graded g
+WHERE u.id = g.id
+  AND (u.points, u.ranking, u.grade) IS DISTINCT FROM (g.points, g.ranking, g.grade)
+""")
+
+
+def recompute_rankings(db: Session) -> Optional[int]:
+    """
+    모든 사용자의 포인트/랭킹/등급을 재계산하고 랭킹 대상 사용자 수를 반환합니다.
+    다른 워커가 이미 실행 중이면 건너뛰고 None을 반환합니다.
+    """
+    acquired = db.execute(
+        text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": RANKING_LOCK_KEY}
+    ).scalar()
+    if not acquired:
+        db.rollback()
+        return None
+
+    db.execute(RECOMPUTE_SQL, {
+        "real_pts": POINTS_PER_REAL_VOTE,
+        "normal_pts": POINTS_PER_NORMAL_VOTE,
+        "fav_pts": POINTS_PER_FAVORITE,
+        "s_ratio": GRADE_S_RATIO,
+        "a_ratio": GRADE_A_RATIO,
+        "b_ratio": GRADE_B_RATIO,
+    })
+    ranked_count = db.execute(text("SELECT COUNT(*) FROM users WHERE ranking IS NOT NULL")).scalar() or 0
+    db.commit()
+
+    crud_user.set_ranked_user_count(ranked_count)
+    return ranked_count
+
+
+def run_ranking_job() -> Optional[int]:
+    """독립 세션으로 랭킹 재계산을 1회 실행합니다. (스케줄러/CLI 용)"""
+    db = SessionLocal()
+    try:
+        return recompute_rankings(db)
+    except Exception:
+        db.rollback()
+        logger.exception("랭킹 재계산 실패")
+        return None
+    finally:
+        db.close()
+
+
+async def ranking_scheduler(interval_seconds: int) -> None:
+    """interval_seconds 간격으로 랭킹 재계산을 반복 실행합니다."""
+    while True:
+        ranked_count = await asyncio.to_thread(run_ranking_job)
+        if ranked_count is not None:
+            logger.info("랭킹 재계산 완료: 랭킹 대상 %d명", ranked_count)
+        await asyncio.sleep(interval_seconds)
@@ -0,0 +1,233 @@
+# app/services/route_facets.py
+import asyncio
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.models import Route
+
+logger = logging.getLogger(__name__)
+
+# 패싯으로 사용하는 태그 컬럼
+FACET_FIELDS = ("tag_period", "tag_env", "tag_with", "tag_move", "tag_atmosphere", "tag_place_count")
+
+# 청크 하나가 담당하는 id 범위 (2^16개, roaring bitmap의 컨테이너 단위와 동일)
+CHUNK_BITS = 16
+CHUNK_MASK = (1 << CHUNK_BITS) - 1
+
+# 다른 워커에서 생성된 루트를 반영하기 위한 증분 갱신 주기
+REFRESH_INTERVAL_SECONDS = 30
+
+
+class Bitmap:
+    """
+    roaring 방식의 압축 비트맵.
+    상위 16비트를 키로 하는 청크마다 하위 16비트를 파이썬 int 비트셋(최대 8KB)으로 보관합니다.
+    AND는 양쪽에 공통으로 존재하는 청크끼리만 계산합니다.
+    """
+    __slots__ = ("_chunks",)
+
+    def __init__(self, chunks: Optional[Dict[int, int]] = None):
+        self._chunks: Dict[int, int] = chunks if chunks is not None else {}
+
+    @classmethod
+    def from_ids(cls, ids: Iterable[int]) -> "Bitmap":
+        buffers: Dict[int, bytearray] = {}
+        for value in ids:
+            key, low = value >> CHUNK_BITS, value & CHUNK_MASK
+            buf = buffers.get(key)
+            if buf is None:
+                buf = buffers[key] = bytearray((CHUNK_MASK + 1) // 8)
+            buf[low >> 3] |= 1 << (low & 7)
+        return cls({key: int.from_bytes(buf, "little") for key, buf in buffers.items()})
+
+    def add(self, value: int) -> None:
+        key = value >> CHUNK_BITS
+        self._chunks[key] = self._chunks.get(key, 0) | (1 << (value & CHUNK_MASK))
+
+    def __and__(self, other: "Bitmap") -> "Bitmap":
+        small, large = (self, other) if len(self._chunks) <= len(other._chunks) else (other, self)
+        chunks = {}
+        for key, bits in small._chunks.items():
+            other_bits = large._chunks.get(key)
+            if other_bits:
+                merged = bits & other_bits
+                if merged:
+                    chunks[key] = merged
+        return Bitmap(chunks)
+
+    def __len__(self) -> int:
+        return sum(bits.bit_count() for bits in self._chunks.values())
+
+    def iter_desc(self) -> Iterator[int]:
+        """큰 id부터 순서대로 반환합니다. (route_id DESC 정렬)"""
+        for key in sorted(self._chunks, reverse=True):
+            bits, base = self._chunks[key], key << CHUNK_BITS
+            while bits:
+                top = bits.bit_length() - 1
+                yield base + top
+                bits ^= 1 << top
+
+
+class RouteFacetIndex:
+    """
+    루트 태그 패싯 인덱스.
+    태그 값마다 route_id 비트맵을 유지하여 임의의 AND 필터와 패싯별 개수를
+    DB 조회 없이 계산하고, 결과 id로 한 번만 하이드레이션하도록 합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bitmaps: Dict[str, Dict[Any, Bitmap]] = {field: {} for field in FACET_FIELDS}
+        self._all = Bitmap()
+        # DB에서 읽어 온 최대 route_id (이 워커의 add 로는 올리지 않음, 다른 워커가 만든 더 작은 id를 놓치지 않도록)
+        self._db_max_route_id = 0
+        # 빌드 중(load 실행 중)에 add 된 루트, 새 비트맵으로 교체한 뒤 다시 반영
+        self._adds_during_load: Optional[List[Tuple[int, Mapping[str, Any]]]] = None
+        self._refreshed_at = 0.0
+        self.ready = False
+
+    def build(self, db: Session) -> int:
+        """전체 루트를 읽어 인덱스를 새로 만듭니다. 반환값은 색인된 루트 수입니다."""
+        stmt = select(Route.route_id, *(getattr(Route, field) for field in FACET_FIELDS))
+        with self._lock:
+            self._adds_during_load = []
+        try:
+            rows = db.execute(stmt.execution_options(yield_per=10000))
+            return self.load(row._mapping for row in rows)
+        except Exception:
+            with self._lock:
+                self._adds_during_load = None
+            raise
+
+    def load(self, rows: Iterable[Mapping[str, Any]]) -> int:
+        """
+        route_id와 태그 컬럼을 가진 행 목록으로 인덱스를 새로 만듭니다.
+        삭제된 루트는 새 인덱스에서 빠지고, build 가 행을 읽는 동안 add 된 루트는 교체 후 다시 반영합니다.
+        """
+        ids_by_value: Dict[str, Dict[Any, List[int]]] = {field: defaultdict(list) for field in FACET_FIELDS}
+        all_ids: List[int] = []
+        for row in rows:
+            route_id = row["route_id"]
+            all_ids.append(route_id)
+            for field in FACET_FIELDS:
+                value = row[field]
+                if value is not None:
+                    ids_by_value[field][value].append(route_id)
+
+        bitmaps = {
+            field: {value: Bitmap.from_ids(ids) for value, ids in values.items()}
+            for field, values in ids_by_value.items()
+        }
+        with self._lock:
+            self._bitmaps = bitmaps
+            self._all = Bitmap.from_ids(all_ids)
+            for route_id, tags in self._adds_during_load or []:
+                self._add_locked(route_id, tags)
+            self._adds_during_load = None
+            self._db_max_route_id = max(all_ids, default=0)
+            self._refreshed_at = time.monotonic()
+            self.ready = True
+        return len(all_ids)
+
+    def add(self, route_id: int, tags: Mapping[str, Any]) -> None:
+        """루트 1건을 인덱스에 추가합니다. (루트 생성 시 호출)"""
+        with self._lock:
+            self._add_locked(route_id, tags)
+            if self._adds_during_load is not None:
+                self._adds_during_load.append((route_id, {field: tags.get(field) for field in FACET_FIELDS}))
+
+    def _add_locked(self, route_id: int, tags: Mapping[str, Any]) -> None:
+        # self._lock 안에서 호출. 비트맵 OR 이므로 같은 루트를 여러 번 추가해도 결과는 같음
+        self._all.add(route_id)
+        for field in FACET_FIELDS:
+            value = tags.get(field)
+            if value is not None:
+                self._bitmaps[field].setdefault(value, Bitmap()).add(route_id)
+
+    def refresh_if_stale(self, db: Session) -> None:
+        """
+        마지막 갱신 이후 다른 프로세스에서 생성된 루트를 증분 반영합니다.
+        DB에서 읽은 최대 id 이후만 조회하므로, 늦게 커밋된 작은 id와 삭제는 주기적 재빌드에서 반영됩니다.
+        """
+        if not self.ready or time.monotonic() - self._refreshed_at < REFRESH_INTERVAL_SECONDS:
+            return
+        stmt = select(Route.route_id, *(getattr(Route, field) for field in FACET_FIELDS)).where(
+            Route.route_id > self._db_max_route_id
+        )
+        rows = db.execute(stmt).all()
+        with self._lock:
+            for row in rows:
+                self._add_locked(row.route_id, row._mapping)
+            if rows:
+                self._db_max_route_id = max(self._db_max_route_id, max(row.route_id for row in rows))
+            self._refreshed_at = time.monotonic()
+
+    def _match(self, filters: Mapping[str, Any], exclude: Optional[str] = None) -> Bitmap:
+        result = self._all
+        for field, value in filters.items():
+            if value is None or field == exclude:
+                continue
+            bitmap = self._bitmaps[field].get(value)
+            if bitmap is None:
+                return Bitmap()
+            result = result & bitmap
+        return result
+
+    def search(self, filters: Mapping[str, Any], limit: int = 50, offset: int = 0) -> Tuple[List[int], int]:
+        """필터에 맞는 route_id를 route_id DESC 순으로 반환합니다. (ids, 전체 개수)"""
+        ids = []
+        with self._lock:
+            matched = self._match(filters)
+            for index, route_id in enumerate(matched.iter_desc()):
+                if index >= offset + limit:
+                    break
+                if index >= offset:
+                    ids.append(route_id)
+            return ids, len(matched)
+
+    def facet_counts(self, filters: Mapping[str, Any]) -> Dict[str, Dict[str, int]]:
+        """
+        태그별 값 개수를 반환합니다.
+        각 태그의 개수는 그 태그 자신의 필터를 제외한 나머지 필터를 적용해 계산합니다.
+        """
+        counts: Dict[str, Dict[str, int]] = {}
+        with self._lock:
+            for field in FACET_FIELDS:
+                base = self._match(filters, exclude=field)
+                field_counts = {}
+                for value, bitmap in self._bitmaps[field].items():
+                    count = len(base & bitmap)
+                    if count:
+                        field_counts[str(value)] = count
+                counts[field] = field_counts
+        return counts
+
+
+route_facet_index = RouteFacetIndex()
+
+
+def build_route_facet_index() -> None:
+    """독립 세션으로 패싯 인덱스를 빌드합니다. (앱 시작 시 백그라운드 실행)"""
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        count = route_facet_index.build(db)
+        logger.info("루트 패싯 인덱스 빌드 완료: %d건 (%.2fs)", count, time.perf_counter() - started)
+    except Exception:
+        logger.exception("루트 패싯 인덱스 빌드 실패 (SQL 검색으로 대체)")
+    finally:
+        db.close()
+
+
+async def route_facet_index_scheduler(interval_seconds: int) -> None:
+    """interval_seconds 간격으로 인덱스를 다시 빌드해 삭제된 루트와 증분 갱신에서 놓친 루트를 반영합니다."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        await asyncio.to_thread(build_route_facet_index)
@@ -0,0 +1,93 @@
+# app/services/route_metrics.py
+from itertools import chain
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+# 루트 이동 지표 (Route.total_distance_km / travel_minutes / day_metrics)
+# {
+#   "total_distance_km": 12.34,                                       # 모든 날의 합
+#   "travel_minutes": 56,                                             # 이동 시간만 (체류 시간 제외)
+#   "days": [{"day", "distance_km", "travel_minutes"}, ...],          # day 순
+# }
+# 거리는 하루 일정의 (order 순) 연속한 장소 사이 직선(대권) 거리의 합입니다. 날과 날 사이 이동은 포함하지 않습니다.
+
+EARTH_RADIUS_KM = 6371.0088
+
+# tag_move 별 평균 이동 속도 (km/h, 신호/정차/환승을 포함한 도심 기준 추정치)
+SPEED_KMH = {"walk": 4.0, "bicycle": 12.0, "car": 35.0, "public": 20.0, "train": 45.0}
+DEFAULT_SPEED_KMH = SPEED_KMH["public"]  # all / 미지정
+
+# 직선 거리 → 실제 이동 경로 길이 보정 계수 (이동 시간 추정에만 사용)
+DETOUR_FACTOR = 1.3
+
+# (route_key, day, order, latitude, longitude)
+StopRow = Tuple[int, int, int, float, float]
+
+
+def speed_kmh(tag_move: Optional[str]) -> float:
+    return SPEED_KMH.get(tag_move or "", DEFAULT_SPEED_KMH)
+
+
+def haversine_km(lat1: np.ndarray, lng1: np.ndarray, lat2: np.ndarray, lng2: np.ndarray) -> np.ndarray:
+    """위경도(도) 배열 쌍 사이의 대권 거리(km)"""
+    lat1, lng1, lat2, lng2 = map(np.radians, (lat1, lng1, lat2, lng2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def compute_route_metrics(
+    rows: Iterable[StopRow],
+    tag_moves: Mapping[int, Optional[str]],
+) -> Dict[int, dict]:
+    """
+    여러 루트의 장소 목록으로 이동 지표를 한 번에 계산합니다. 반환값은 route_key → 지표 dict 입니다.
+    모든 루트의 장소를 (route, day, order) 순으로 정렬한 배열 하나로 모아
+    연속한 장소 사이 거리를 한 번에 계산하고, (route, day) 그룹별로 합산합니다.
+    """
+    rows = list(rows)
+    if not rows:
+        return {}
+    data = np.fromiter(chain.from_iterable(rows), dtype=np.float64, count=len(rows) * 5).reshape(-1, 5)
+    data = data[np.lexsort((data[:, 2], data[:, 1], data[:, 0]))]
+    keys, days = data[:, 0].astype(np.int64), data[:, 1].astype(np.int64)
+
+    # (route, day) 가 바뀌는 위치마다 새 그룹. 그룹 경계를 넘는 구간은 이동으로 치지 않음
+    new_group = np.empty(len(data), dtype=bool)
+    new_group[0] = True
+    new_group[1:] = (keys[1:] != keys[:-1]) | (days[1:] != days[:-1])
+    group_ids = np.cumsum(new_group) - 1
+    legs = haversine_km(data[:-1, 3], data[:-1, 4], data[1:, 3], data[1:, 4])
+    legs[new_group[1:]] = 0.0
+    # (장소가 1개뿐이면 legs 가 비어 bincount 가 정수 배열을 반환하므로 실수로 변환)
+    day_km = np.bincount(group_ids[1:], weights=legs, minlength=group_ids[-1] + 1).astype(np.float64)
+
+    # 그룹 → 루트 번호. 속도는 루트마다 한 번만 찾고 합계/반올림도 배열 연산으로 처리
+    route_starts = np.empty(len(data), dtype=bool)
+    route_starts[0] = True
+    route_starts[1:] = keys[1:] != keys[:-1]
+    route_of_group = (np.cumsum(route_starts) - 1)[new_group]
+    route_keys = keys[route_starts].tolist()
+    route_speeds = np.array([speed_kmh(tag_moves.get(key)) for key in route_keys])
+    day_minutes = day_km * DETOUR_FACTOR / route_speeds[route_of_group] * 60
+    total_km = np.bincount(route_of_group, weights=day_km)
+    total_minutes = np.bincount(route_of_group, weights=day_minutes)
+
+    days_by_route: List[List[dict]] = [[] for _ in route_keys]
+    for route, day, km, minutes in zip(
+        route_of_group.tolist(), days[new_group].tolist(),
+        np.round(day_km, 2).tolist(), np.rint(day_minutes).astype(np.int64).tolist(),
+    ):
+        days_by_route[route].append({"day": day, "distance_km": km, "travel_minutes": minutes})
+    return {
+        key: {"total_distance_km": km, "travel_minutes": minutes, "days": route_days}
+        for key, km, minutes, route_days in zip(
+            route_keys, np.round(total_km, 2).tolist(), np.rint(total_minutes).astype(np.int64).tolist(), days_by_route,
+        )
+    }
+
+
+def route_metrics(stops: Iterable[Tuple[int, int, float, float]], tag_move: Optional[str]) -> Optional[dict]:
+    """루트 1건의 장소 (day, order, latitude, longitude) 목록으로 이동 지표를 계산합니다. 장소가 없으면 None."""
+    rows: List[StopRow] = [(0, day, order, lat, lng) for day, order, lat, lng in stops]
+    return compute_route_metrics(rows, {0: tag_move}).get(0)
@@ -0,0 +1,135 @@
+# app/services/route_optimizer.py
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.schemas.route import RoutePlaceCreate
+from app.services.route_metrics import haversine_km
+
+# 하루에 최적화할 수 있는 최대 장소 수 (2-opt 는 반복마다 O(n^2))
+MAX_STOPS_PER_DAY = 50
+
+# nearest-neighbour 를 시작할 (출발점 다음) 장소 수 상한과, 그중 2-opt 까지 적용할 상위 경로 수
+MAX_NN_STARTS = 50
+TWO_OPT_CANDIDATES = 3
+
+
+def distance_matrix(coords: np.ndarray) -> np.ndarray:
+    """(n, 2) 위경도 배열의 모든 쌍 사이 대권 거리(km) 행렬"""
+    lat, lng = coords[:, 0], coords[:, 1]
+    return haversine_km(lat[:, None], lng[:, None], lat[None, :], lng[None, :])
+
+
+def path_length(dist: np.ndarray, order: Sequence[int]) -> float:
+    order = np.asarray(order)
+    return float(dist[order[:-1], order[1:]].sum()) if len(order) > 1 else 0.0
+
+
+def _nearest_neighbour(dist: np.ndarray, start: int, end: int, first: Optional[int] = None) -> np.ndarray:
+    """start 에서 출발해 (first 를 먼저 들른 뒤) 가장 가까운 미방문 장소를 차례로 방문하고 end 에서 끝나는 경로"""
+    n = len(dist)
+    visited = np.zeros(n, dtype=bool)
+    visited[[start, end]] = True
+    order = [start]
+    current = start
+    for _ in range(n - 2):
+        if first is not None and current == start:
+            current = first
+        else:
+            current = int(np.where(visited, np.inf, dist[current]).argmin())
+        visited[current] = True
+        order.append(current)
+    order.append(end)
+    return np.array(order)
+
+
+def _two_opt(dist: np.ndarray, order: np.ndarray) -> np.ndarray:
+    """
+    양 끝을 고정한 경로에 2-opt 를 적용합니다.
+    매 반복마다 모든 구간 뒤집기 (i..j, 1 <= i < j <= n-2) 의 거리 변화를 행렬 한 번으로 계산해
+    가장 많이 줄어드는 뒤집기를 적용하고, 더 줄일 수 없으면 멈춥니다.
+    """
+    n = len(order)
+    if n < 4:
+        return order
+    inner = np.arange(1, n - 1)
+    upper = inner[:, None] < inner[None, :]
+    while True:
+        prev, first = order[inner - 1], order[inner]   # 뒤집을 구간의 앞쪽 간선 (prev -> first)
+        last, nxt = order[inner], order[inner + 1]     # 뒤집을 구간의 뒤쪽 간선 (last -> nxt)
+        delta = (
+            dist[prev[:, None], last[None, :]] + dist[first[:, None], nxt[None, :]]
+            - dist[prev, first][:, None] - dist[last, nxt][None, :]
+        )
+        delta = np.where(upper, delta, 0.0)
+        best = delta.argmin()
+        i, j = divmod(int(best), len(inner))
+        if delta[i, j] >= -1e-9:
+            return order
+        i, j = inner[i], inner[j]
+        order[i:j + 1] = order[i:j + 1][::-1].copy()
+
+
+def optimize_order(coords: np.ndarray, fix_start: bool = True, fix_end: bool = False) -> np.ndarray:
+    """
+    장소 좌표 (n, 2) 의 방문 순서를 nearest-neighbour + 2-opt 로 최적화해 인덱스 배열로 반환합니다.
+    fix_start / fix_end 이면 첫 / 마지막 장소를 그 자리에 둡니다.
+    고정되지 않은 끝에는 모든 장소와의 거리가 0 인 가상 장소를 붙여 양 끝이 고정된 경로 문제로 풉니다.
+    """
+    n = len(coords)
+    if n <= 2:
+        return np.arange(n)
+
+    # 노드: 0..n-1 은 장소, 그 뒤로 필요한 만큼 가상 출발점/도착점
+    size = n + (not fix_start) + (not fix_end)
+    dist = np.zeros((size, size))
+    dist[:n, :n] = distance_matrix(coords)
+    start = 0 if fix_start else n
+    end = n - 1 if fix_end else size - 1
+    if not fix_start and not fix_end:
+        dist[start, end] = dist[end, start] = np.inf  # 가상 출발점에서 가상 도착점으로 바로 가지 않도록
+
+    # 출발점 다음에 들를 장소를 바꿔 가며 nearest-neighbour 경로를 만들고, 짧은 몇 개에만 2-opt 적용
+    candidates = sorted(
+        (
+            _nearest_neighbour(dist, start, end, first)
+            for first in range(min(n, MAX_NN_STARTS)) if first not in (start, end)
+        ),
+        key=lambda candidate: path_length(dist, candidate),
+    )
+    improved = (_two_opt(dist, candidate) for candidate in candidates[:TWO_OPT_CANDIDATES])
+    order = min(improved, key=lambda candidate: path_length(dist, candidate))
+    return order[order < n]
+
+
+def optimize_places(
+    places: List[RoutePlaceCreate],
+    coords: Dict[int, Tuple[float, float]],
+    fix_start: bool = True,
+    fix_end: bool = False,
+) -> Tuple[List[RoutePlaceCreate], float, float]:
+    """
+    날마다 장소 방문 순서를 최적화해 order 를 1부터 다시 매긴 목록과 (최적화 전 거리, 후 거리) km 를 반환합니다.
+    좌표가 없는 장소는 그 날의 마지막에 원래 순서대로 둡니다.
+    """
+    by_day: Dict[int, List[RoutePlaceCreate]] = {}
+    for place in sorted(places, key=lambda p: (p.day, p.order)):
+        by_day.setdefault(place.day, []).append(place)
+
+    result: List[RoutePlaceCreate] = []
+    before_km = after_km = 0.0
+    for day, day_places in sorted(by_day.items()):
+        located = [p for p in day_places if p.place_id in coords]
+        unknown = [p for p in day_places if p.place_id not in coords]
+        day_coords = np.array([coords[p.place_id] for p in located], dtype=np.float64).reshape(-1, 2)
+        order = optimize_order(day_coords, fix_start=fix_start, fix_end=fix_end)
+
+        dist = distance_matrix(day_coords)
+        before_km += path_length(dist, np.arange(len(located)))
+        after_km += path_length(dist, order)
+        ordered = [located[k] for k in order.tolist()] + unknown
+        result.extend(
+            RoutePlaceCreate(place_id=p.place_id, day=day, order=index)
+            for index, p in enumerate(ordered, start=1)
+        )
+    return result, before_km, after_km
@@ -3,6 +3,7 @@ import os
 import numpy as np
 from typing import Optional
 from sentence_transformers import SentenceTransformer
+from app.core.metrics import EMBEDDING_DURATION
 
 # 캐시 경로 (huggingface-cli download 위치와 동일)
 HF_HOME = os.environ.get("HF_HOME", "/opt/hf-cache")
@@ -26,5 +27,6 @@ def _get_model() -> SentenceTransformer:
 def text_to_vector(text: str) -> np.ndarray:
     """입력 텍스트를 임베딩 벡터로 변환"""
     model = _get_model()
-    emb = model.encode(text, normalize_embeddings=True)  # L2 정규화
+    with EMBEDDING_DURATION.time():
+        emb = model.encode(text, normalize_embeddings=True)  # L2 정규화
     return np.array(emb, dtype=np.float32)
\ No newline at end of file
@@ -0,0 +1,217 @@
+# app/services/vote_queue.py
+import asyncio
+import fcntl
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.core.database import SessionLocal
+from app.crud.vote import apply_vote_batch
+from app.models.vote_enums import VoteType
+
+logger = logging.getLogger(__name__)
+
+PLACE = "place"
+ROUTE = "route"
+
+LOG_PREFIX = "votes-"
+LOG_SUFFIX = ".log"
+
+# (종류, 사용자, 대상) → 최신 투표
+VoteKey = Tuple[str, int, int]
+Batch = Dict[VoteKey, VoteType]
+
+
+class _Segment:
+    """append-only 로그 파일 하나. 반영이 끝날 때까지 flock 을 잡아 다른 프로세스가 복구 대상으로 가져가지 않게 합니다."""
+    __slots__ = ("path", "file")
+
+    def __init__(self, path: str, file):
+        self.path = path
+        self.file = file
+
+    @classmethod
+    def create(cls, log_dir: str) -> "_Segment":
+        path = os.path.join(log_dir, f"{LOG_PREFIX}{time.time_ns():020d}-{os.getpid()}{LOG_SUFFIX}")
+        file = open(path, "a", encoding="utf-8")
+        fcntl.flock(file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        # 새 파일의 디렉터리 항목까지 디스크에 기록
+        dir_fd = os.open(log_dir, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+        return cls(path, file)
+
+    @classmethod
+    def adopt(cls, path: str) -> Optional["_Segment"]:
+        """소유 프로세스가 종료된 세그먼트면 잠그고 반환, 아직 사용 중이면 None"""
+        try:
+            file = open(path, "r+", encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        try:
+            fcntl.flock(file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            file.close()
+            return None
+        # 잠금을 얻기 직전에 소유 프로세스가 반영을 마치고 삭제한 파일
+        if os.fstat(file.fileno()).st_nlink == 0:
+            file.close()
+            return None
+        return cls(path, file)
+
+    def sync(self) -> None:
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def remove(self) -> None:
+        os.unlink(self.path)
+        self.file.close()
+
+
+def _apply_with_session(batch: Batch) -> int:
+    place_votes = [(user_id, target_id, vote) for (kind, user_id, target_id), vote in batch.items() if kind == PLACE]
+    route_votes = [(user_id, target_id, vote) for (kind, user_id, target_id), vote in batch.items() if kind == ROUTE]
+    db = SessionLocal()
+    try:
+        return apply_vote_batch(db, place_votes, route_votes)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+class VoteQueue:
+    """
+    write-behind 투표 버퍼.
+    submit 은 (종류, 사용자, 대상)별 최신 투표만 메모리에 남기고 로컬 로그에 한 줄 append 한 뒤 바로 반환합니다.
+    flush 는 모인 투표를 한 트랜잭션으로 반영(대상별 집계 재계산 1회)하고, 성공하면 그동안의 로그 세그먼트를 삭제합니다.
+    로그는 매 submit 마다 OS 버퍼까지 기록하므로 프로세스가 죽어도 다음 시작 시 open() 에서 재생됩니다.
+    디스크 fsync 는 flush 마다 한 번 (group commit) 하므로, 호스트 장애/전원 차단 시에는
+    마지막 flush 이후 (최대 flush 주기 동안) 받은 투표를 잃을 수 있습니다.
+    """
+
+    def __init__(self, apply: Callable[[Batch], int] = _apply_with_session):
+        self._apply = apply
+        self._pending: Batch = {}
+        self._lock = threading.Lock()
+        # flush 는 한 번에 하나만 (스케줄러와 종료 시 flush 가 겹치지 않도록)
+        self._flush_lock = threading.Lock()
+        self._active: Optional[_Segment] = None
+        # 아직 DB 반영이 확인되지 않은 이전 세그먼트
+        self._sealed: List[_Segment] = []
+        self.submitted = 0
+        self.applied = 0
+
+    @property
+    def is_open(self) -> bool:
+        return self._active is not None
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def open(self, log_dir: str) -> int:
+        """로그 디렉터리를 열고, 종료된 프로세스가 남긴 세그먼트를 재생한 뒤 복구한 투표 수를 반환합니다."""
+        os.makedirs(log_dir, exist_ok=True)
+        recovered = 0
+        with self._lock:
+            for name in sorted(os.listdir(log_dir)):
+                if not (name.startswith(LOG_PREFIX) and name.endswith(LOG_SUFFIX)):
+                    continue
+                segment = _Segment.adopt(os.path.join(log_dir, name))
+                if segment is None:
+                    continue
+                recovered += self._replay(segment)
+                self._sealed.append(segment)
+            self._active = _Segment.create(log_dir)
+        if recovered:
+            logger.info("투표 로그 복구: %d건", recovered)
+        return recovered
+
+    def _replay(self, segment: _Segment) -> int:
+        count = 0
+        for line in segment.file:
+            parts = line.rstrip("\n").split("\t")
+            # 기록 도중 종료돼 잘린 마지막 줄은 무시
+            if len(parts) != 4 or not line.endswith("\n"):
+                continue
+            kind, user_id, target_id, vote = parts
+            self._pending[(kind, int(user_id), int(target_id))] = VoteType(vote)
+            count += 1
+        return count
+
+    def submit(self, kind: str, user_id: int, target_id: int, vote: VoteType) -> None:
+        vote = VoteType(vote)
+        with self._lock:
+            if self._active is None:
+                raise RuntimeError("vote queue is not open")
+            self._active.file.write(f"{kind}\t{user_id}\t{target_id}\t{vote.value}\n")
+            self._active.file.flush()
+            self._pending[(kind, user_id, target_id)] = vote
+            self.submitted += 1
+
+    def flush(self) -> int:
+        """모인 투표를 반영하고 반영된 투표 수를 반환합니다. 실패하면 배치를 되돌리고 예외를 다시 던집니다."""
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                batch, self._pending = self._pending, {}
+                # 이 배치까지의 기록을 닫고 새 세그먼트로 교체
+                closing = self._active
+                self._sealed.append(closing)
+                self._active = _Segment.create(os.path.dirname(closing.path))
+                sealed = list(self._sealed)
+
+            # 반영에 실패해도 다음 시작 시 재생할 수 있도록 먼저 디스크에 기록 (더 이상 쓰지 않으므로 락 밖에서)
+            closing.sync()
+            started = time.perf_counter()
+            try:
+                applied = self._apply(batch)
+            except Exception:
+                with self._lock:
+                    # 반영 중 들어온 더 최신 투표는 유지
+                    for key, vote in batch.items():
+                        self._pending.setdefault(key, vote)
+                raise
+
+            with self._lock:
+                for segment in sealed:
+                    segment.remove()
+                self._sealed = self._sealed[len(sealed):]
+                self.applied += applied
+            logger.debug("투표 배치 반영: %d건 (%.1fms)", len(batch), (time.perf_counter() - started) * 1000)
+            return applied
+
+    def close(self) -> None:
+        """파일을 닫습니다. 반영되지 않은 투표가 담긴 세그먼트는 다음 시작 시 재생되도록 남겨 둡니다."""
+        with self._lock:
+            if self._active is None:
+                return
+            if self._active.file.tell() == 0:
+                self._active.remove()
+            else:
+                self._active.sync()
+                self._active.file.close()
+            for segment in self._sealed:
+                segment.file.close()
+            self._active = None
+            self._sealed = []
+
+
+vote_queue = VoteQueue()
+
+
+async def vote_flush_scheduler(queue: VoteQueue, interval_ms: int) -> None:
+    """interval_ms 간격으로 모인 투표를 반영합니다. 실패한 배치는 다음 주기에 다시 시도됩니다."""
+    while True:
+        await asyncio.sleep(interval_ms / 1000)
+        try:
+            await asyncio.to_thread(queue.flush)
+        except Exception:
+            logger.exception("투표 배치 반영 실패 (다음 주기에 재시도)")
@@ -0,0 +1,72 @@
+# app/utils/hangul.py
+import unicodedata
+from typing import Optional
+
+
+def decompose_jamo(text: Optional[str]) -> Optional[str]:
+    """
+    한글 음절을 자모(초성/중성/종성)로 분해합니다. (NFD 정규화)
+    PostgreSQL normalize(text, NFD)와 동일한 결과를 내므로 마이그레이션 백필과 일치합니다.
+    예: '경복궁' → '경복궁'
+    """
+    if text is None:
+        return None
+    return unicodedata.normalize("NFD", text)
+
+
+# --- 자동완성용 호환 자모 분해 ---
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ("", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+             "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ")
+
+# 입력 도중(예: '과'를 치기 전의 '고')에도 접두어가 일치하도록 겹모음/겹받침을 풀어서 씁니다.
+COMPOUND_JAMO = {
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+}
+
+
+def to_jamo_key(text: str) -> str:
+    """
+    자동완성 검색 키: 한글 음절을 호환 자모로 풀어 쓰고 나머지 문자는 소문자로 변환합니다.
+    예: '경복궁' → 'ㄱㅕㅇㅂㅗㄱㄱㅜㅇ', '경ㅂ' → 'ㄱㅕㅇㅂ'
+    """
+    out = []
+    for ch in text.lower():
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            offset = code - HANGUL_BASE
+            cho, jung, jong = offset // 588, (offset % 588) // 28, offset % 28
+            out.append(CHOSEONG[cho])
+            out.append(COMPOUND_JAMO.get(JUNGSEONG[jung], JUNGSEONG[jung]))
+            out.append(COMPOUND_JAMO.get(JONGSEONG[jong], JONGSEONG[jong]))
+        else:
+            out.append(COMPOUND_JAMO.get(ch, ch))
+    return "".join(out)
+
+
+def to_choseong_key(text: str) -> str:
+    """
+    초성 검색 키: 한글 음절은 초성만 남기고 나머지 문자는 소문자로 변환합니다. 공백은 무시합니다.
+    예: '경복궁' → 'ㄱㅂㄱ', '서울 숲' → 'ㅅㅇㅅ'
+    """
+    out = []
+    for ch in text.lower():
+        code = ord(ch)
+        if ch.isspace():
+            continue
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            out.append(CHOSEONG[(code - HANGUL_BASE) // 588])
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def is_choseong_query(text: str) -> bool:
+    """입력이 초성(자음)만으로 이루어졌는지 확인합니다. 예: 'ㄱㅂ'"""
+    stripped = text.replace(" ", "")
+    return bool(stripped) and all(ch in CHOSEONG for ch in stripped)
@@ -8,6 +8,8 @@ from app.models import User
 from app.utils.jwt import SECRET_KEY, ALGORITHM
 
 bearer = HTTPBearer(bearerFormat="JWT", scheme_name="Authorization")
+# 토큰이 없어도 403을 내지 않는 선택적 인증용
+optional_bearer = HTTPBearer(bearerFormat="JWT", scheme_name="Authorization", auto_error=False)
 
 def get_current_user(cred: HTTPAuthorizationCredentials = Depends(bearer),
                      db: Session = Depends(get_db)) -> User:
@@ -31,7 +33,7 @@ def get_current_user(cred: HTTPAuthorizationCredentials = Depends(bearer),
 
 
 def get_optional_current_user(
-    cred: HTTPAuthorizationCredentials = Depends(bearer), db: Session = Depends(get_db)
+    cred: HTTPAuthorizationCredentials | None = Depends(optional_bearer), db: Session = Depends(get_db)
 ) -> User | None:
     if not cred:
         return None
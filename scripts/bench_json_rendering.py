@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+JSON 응답 렌더링 벤치마크
+장소/루트 1000개를 직렬화할 때
+  - before: FastAPI 기본 경로 (model_dump → response_model 재검증 → jsonable_encoder → json.dumps)
+  - after : PydanticJSONResponse (재검증 없이 pydantic-core 직렬화)
+의 시간을 비교합니다. DB 연결은 필요하지 않습니다.
+
+사용 예: python scripts/bench_json_rendering.py --count 1000
+"""
+import sys
+import os
+import argparse
+import json
+import timeit
+from datetime import datetime
+from typing import List
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.core.responses import PydanticJSONResponse
+from app.schemas.place import PlaceOut
+from app.schemas.route import HashTag, LocoRoute, RoutePlace, Transportation
+
+
+def make_places(count: int) -> List[PlaceOut]:
+    return [
+        PlaceOut(
+            place_id=i, name=f"장소 {i}", type="관광지", is_frequent=False, atmosphere="잔잔하고 조용한",
+            pros="야경이 멋짐", cons="주차 어려움", image_url=f"https://picsum.photos/600/400?random={i}",
+            count_real=i % 50, count_normal=i % 7, count_bad=i % 3, latitude=37.5 + i * 1e-4,
+            longitude=127.0 + i * 1e-4, kakao_place_id=str(100000 + i), intro="소개", phone="02-000-0000",
+            address_name="서울특별시 종로구", link=None, liked=i % 50, user_id=1, city_name="종로구",
+        )
+        for i in range(count)
+    ]
+
+
+def make_routes(count: int, stops: int = 12) -> List[LocoRoute]:
+    tags = HashTag(**{
+        "period": "2", "env": "sea", "with": "friend", "move": "car", "atmosphere": "", "place_count": "3",
+    })
+    return [
+        LocoRoute(
+            user_id=1, id=i, name=f"루트 {i}", image_url=None, location="부산", intro="소개", liked=i % 30,
+            tags=tags,
+            places=[RoutePlace(id=j, name=f"장소 {j}", category="관광지", day=j // 6 + 1, order=j % 6 + 1) for j in range(stops)],
+            transportations=[Transportation(id=j + 1, name="버스", day=j // 6 + 1, order=j % 6 + 1) for j in range(stops)],
+            count_real=i % 30, count_soso=1, count_bad=0, created_at=datetime.now(),
+        )
+        for i in range(count)
+    ]
+
+
+def fastapi_default(models, adapter: TypeAdapter) -> bytes:
+    dumped = [m.model_dump(by_alias=True) for m in models]
+    validated = adapter.validate_python(dumped)
+    return json.dumps(jsonable_encoder(validated, by_alias=True), ensure_ascii=False).encode("utf-8")
+
+
+def prevalidated(models, adapter: TypeAdapter) -> bytes:
+    return PydanticJSONResponse(models).body
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    datasets = {
+        "places": (make_places(args.count), TypeAdapter(List[PlaceOut])),
+        "routes": (make_routes(args.count), TypeAdapter(List[LocoRoute])),
+    }
+    strategies = {"before": fastapi_default, "after": prevalidated}
+
+    print(f"{'dataset':>8} " + " ".join(f"{name + '(ms)':>12}" for name in strategies))
+    for dataset, (models, adapter) in datasets.items():
+        timings = [
+            min(timeit.repeat(lambda: fn(models, adapter), number=1, repeat=args.repeat)) * 1000
+            for fn in strategies.values()
+        ]
+        print(f"{dataset:>8} " + " ".join(f"{t:>12.2f}" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
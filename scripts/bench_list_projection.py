@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+목록 조회: ORM 엔티티 vs 컬럼 projection 벤치마크
+탐색/목록 카드를 만들 때 기존 방식(Place/Route 엔티티 + creator/city joinedload)과
+필요한 컬럼만 Row 로 읽는 방식(crud.place.get_new_places, crud.route.get_new_routes)의
+페이지당 지연 시간(조회 + 스키마 변환)과 tracemalloc 최대 메모리를 비교합니다.
+
+기본은 DATABASE_URL 의 데이터(generate_synthetic_data.py)를 사용하고,
+--sqlite 를 주면 메모리 SQLite 에 장소 데이터를 만들어 장소 목록만 측정합니다. (routes 는 JSONB 컬럼 때문에 Postgres 필요)
+
+사용 예:
+    python scripts/bench_list_projection.py --page 1000 --repeat 20
+    python scripts/bench_list_projection.py --sqlite --rows 5000
+"""
+import sys
+import os
+import argparse
+import statistics
+import time
+import tracemalloc
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+if "--sqlite" in sys.argv:
+    os.environ["DATABASE_URL"] = "sqlite://"
+    os.environ.setdefault("SECRET_KEY", "bench")
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+from app.api.v1.endpoints.places import to_place_search_result
+from app.api.v1.endpoints.routes import to_loco_route
+from app.core.database import Base
+from app.crud import place as crud_place, route as crud_route
+from app.models import Place, RegionCity, RegionProvince, Route, User
+
+
+def orm_places(db: Session, page: int):
+    stmt = select(Place).options(*crud_place.eager_loading_options).order_by(Place.created_at.desc()).limit(page)
+    return [to_place_search_result(p) for p in db.scalars(stmt)]
+
+
+def projected_places(db: Session, page: int):
+    return [to_place_search_result(p) for p in crud_place.get_new_places(db, limit=page)]
+
+
+def orm_routes(db: Session, page: int):
+    stmt = select(Route).options(*crud_route.eager_loading_options).order_by(Route.created_at.desc()).limit(page)
+    return [to_loco_route(r) for r in db.scalars(stmt)]
+
+
+def projected_routes(db: Session, page: int):
+    return [to_loco_route(r) for r in crud_route.get_new_routes(db, limit=page)]
+
+
+def sqlite_engine(rows: int):
+    bind = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind, tables=[t.__table__ for t in (RegionProvince, RegionCity, User, Place)])
+    with bind.begin() as conn:
+        conn.execute(insert(RegionProvince), [{"province_id": "11", "kor_name": "서울"}])
+        conn.execute(insert(RegionCity), [
+            {"region_id": f"11{i:03d}", "province_id": "11", "kor_name": f"구{i}"} for i in range(25)
+        ])
+        conn.execute(insert(User), [
+            {"id": i, "email": f"user{i}@bench", "hashed_password": "x", "nickname": f"user{i}",
+             "city_id": f"11{i % 25:03d}", "token_version": 0}
+            for i in range(1, 501)
+        ])
+        conn.execute(insert(Place), [
+            {"place_id": i, "name": f"장소 {i}", "type": "카페", "created_by": i % 500 + 1,
+             "image_url": f"https://picsum.photos/seed/{i}/400/300", "count_real": i % 97,
+             "count_normal": 0, "count_bad": i % 7, "short_location": "서울 종로구",
+             "intro": "골목 안쪽의 조용한 공간" * 3, "pros": "분위기" * 20, "cons": "주차" * 20,
+             "atmosphere": "조용한", "address_name": "서울 종로구 어딘가 123",
+             "latitude": 37.5 + i * 1e-5, "longitude": 127.0 + i * 1e-5}
+            for i in range(1, rows + 1)
+        ])
+    return bind
+
+
+def measure(bind, fn, page: int, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        with Session(bind) as db:
+            started = time.perf_counter()
+            result = fn(db, page)
+            timings.append((time.perf_counter() - started) * 1000)
+    with Session(bind) as db:
+        tracemalloc.start()
+        result = fn(db, page)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return len(result), statistics.median(timings), peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--page", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--sqlite", action="store_true", help="메모리 SQLite 로 장소 목록만 측정")
+    parser.add_argument("--rows", type=int, default=5000, help="--sqlite 에서 만들 장소 수")
+    args = parser.parse_args()
+
+    if args.sqlite:
+        bind = sqlite_engine(args.rows)
+        cases = [("places", orm_places, projected_places)]
+    else:
+        from app.core.database import engine as bind
+        cases = [("places", orm_places, projected_places), ("routes", orm_routes, projected_routes)]
+
+    print(f"page={args.page}")
+    print(f"{'list':<8} {'variant':<11} {'rows':>6} {'p50(ms)':>9} {'peak(KiB)':>10}")
+    for name, orm_fn, projected_fn in cases:
+        for variant, fn in (("orm", orm_fn), ("projection", projected_fn)):
+            rows, p50, peak = measure(bind, fn, args.page, args.repeat)
+            print(f"{name:<8} {variant:<11} {rows:>6} {p50:>9.2f} {peak:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+로컬 검색 벤치마크
+crud.place.search_local / crud.route.search_local 의 지연 시간을
+정확 일치·부분 일치·오타 검색어별로 측정합니다.
+DATABASE_URL 의 데이터베이스에 대량 데이터가 적재되어 있어야 의미가 있습니다.
+
+사용 예: python scripts/bench_local_search.py --repeat 20
+"""
+import sys
+import os
+import argparse
+import statistics
+import time
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy.orm import Session
+from app.core.database import engine
+from app.crud import place as crud_place, route as crud_route
+
+QUERIES = {
+    "exact": "경복궁",
+    "partial": "해운대",
+    "typo(jamo)": "경북궁",
+    "address": "종로구",
+    "latin": "cafe",
+}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'query':<12} {'target':<7} {'hits':>5} {'p50(ms)':>9} {'p95(ms)':>9}")
+    for name, q in QUERIES.items():
+        for target, search in (("places", crud_place.search_local), ("routes", crud_route.search_local)):
+            timings, hits = [], 0
+            for _ in range(args.repeat):
+                with Session(engine) as db:
+                    started = time.perf_counter()
+                    hits = len(search(db, q, limit=20))
+                    timings.append((time.perf_counter() - started) * 1000)
+            timings.sort()
+            p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+            print(f"{name:<12} {target:<7} {hits:>5} {statistics.median(timings):>9.2f} {p95:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+메트릭 미들웨어 오버헤드 벤치마크
+아무 일도 하지 않는 ASGI 앱을 MetricsMiddleware(및 QueryStatsMiddleware)로 감싸
+요청당 추가 시간을 측정합니다. 네트워크/DB 연결은 필요하지 않습니다.
+
+사용 예: python scripts/bench_metrics_overhead.py --requests 200000
+"""
+import sys
+import os
+import argparse
+import asyncio
+import time
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.metrics import MetricsMiddleware, render_latest
+from app.core.query_stats import QueryStatsMiddleware
+
+
+class FakeRoute:
+    def __init__(self, path: str):
+        self.path = path
+
+
+ROUTES = [FakeRoute(p) for p in ("/api/v1/places/{place_id}", "/api/v1/routes/search", "/api/v1/users/me")]
+
+
+async def endpoint(scope, receive, send):
+    scope["route"] = ROUTES[hash(scope["path"]) % len(ROUTES)]
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def send(message):
+    pass
+
+
+async def run(app, count: int) -> float:
+    scope_base = {"type": "http", "method": "GET"}
+    started = time.perf_counter()
+    for i in range(count):
+        await app({**scope_base, "path": f"/p{i % 3}"}, None, send)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200_000)
+    args = parser.parse_args()
+
+    variants = {
+        "bare": endpoint,
+        "metrics": MetricsMiddleware(endpoint),
+        "metrics+query_stats": MetricsMiddleware(QueryStatsMiddleware(endpoint)),
+    }
+    baseline = None
+    print(f"{'variant':<22} {'µs/req':>8} {'overhead':>9}")
+    for name, app in variants.items():
+        asyncio.run(run(app, 1000))  # 워밍업
+        per_request = asyncio.run(run(app, args.requests)) / args.requests * 1e6
+        baseline = per_request if baseline is None else baseline
+        print(f"{name:<22} {per_request:>8.2f} {per_request - baseline:>9.2f}")
+
+    started = time.perf_counter()
+    body, _ = render_latest()
+    print(f"\n/metrics render: {(time.perf_counter() - started) * 1000:.2f} ms, {len(body):,} bytes")
+
+
+if __name__ == "__main__":
+    main()
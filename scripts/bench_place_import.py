@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+장소 일괄 등록 벤치마크
+crud.place.import_kakao_places 로 합성 카카오 문서를 호출당 --batch 건씩 등록하고
+신규 삽입과 중복(재등록) 처리량을 측정합니다.
+DATABASE_URL 의 데이터베이스에 --user-id 사용자가 있어야 합니다. 생성한 장소는 마지막에 삭제합니다.
+
+사용 예: python scripts/bench_place_import.py --batch 10000 --calls 5
+"""
+import sys
+import os
+import argparse
+import time
+import uuid
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy.orm import Session
+from app.core.database import engine
+from app.crud import place as crud_place
+from app.models import Place
+from app.schemas.place import KakaoPlaceDocument
+
+
+def synthetic_documents(prefix: str, count: int):
+    return [
+        KakaoPlaceDocument(
+            id=f"{prefix}-{i}",
+            place_name=f"벤치 장소 {i}",
+            category_name="음식점 > 카페",
+            category_group_name="카페",
+            phone="02-000-0000",
+            address_name="서울 종로구 세종로 1",
+            road_address_name="서울 종로구 사직로 161",
+            x=126.97 + (i % 1000) * 1e-5,
+            y=37.57 + (i % 1000) * 1e-5,
+            place_url=f"http://place.map.kakao.com/{i}",
+        )
+        for i in range(count)
+    ]
+
+
+def run(docs_per_call, user_id: int) -> tuple:
+    inserted = existing = 0
+    started = time.perf_counter()
+    for docs in docs_per_call:
+        with Session(engine) as db:
+            ins, ext = crud_place.import_kakao_places(db, user_id=user_id, docs=docs)
+            inserted += len(ins)
+            existing += len(ext)
+    return time.perf_counter() - started, inserted, existing
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batch", type=int, default=10_000)
+    parser.add_argument("--calls", type=int, default=5)
+    parser.add_argument("--user-id", type=int, default=1)
+    args = parser.parse_args()
+
+    prefix = f"bench-{uuid.uuid4().hex[:8]}"
+    calls = [synthetic_documents(f"{prefix}-{c}", args.batch) for c in range(args.calls)]
+    total = args.batch * args.calls
+
+    try:
+        for label in ("insert", "re-import"):
+            elapsed, inserted, existing = run(calls, args.user_id)
+            print(f"{label:<10} {total:>8,} docs  {elapsed:>7.2f}s  {total / elapsed:>9,.0f} docs/s  "
+                  f"inserted={inserted:,} existing={existing:,}")
+    finally:
+        with Session(engine) as db:
+            db.query(Place).filter(Place.kakao_place_id.like(f"{prefix}-%")).delete(synchronize_session=False)
+            db.commit()
+
+
+if __name__ == "__main__":
+    main()
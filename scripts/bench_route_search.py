@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+태그 기반 루트 검색 벤치마크
+crud.route.search_by_tags 가 만드는 쿼리를 필터 조합별로 EXPLAIN (ANALYZE) 하여
+실행 계획의 스캔 방식과 실행 시간을 표로 출력합니다.
+DATABASE_URL 의 데이터베이스에 대량 데이터가 적재되어 있어야 의미가 있습니다.
+
+사용 예: python scripts/bench_route_search.py --repeat 5
+"""
+import sys
+import os
+import argparse
+import itertools
+import json
+import statistics
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from app.core.database import engine
+
+# 필터별 대표값 (데이터 분포에 맞게 조정)
+SAMPLE_FILTERS = {
+    "tag_period": 2,
+    "tag_env": "sea",
+    "tag_with": "friend",
+    "tag_move": "car",
+    "tag_atmosphere": "잔잔하고 조용한",
+    "tag_place_count": 3,
+}
+
+
+def build_sql(columns) -> str:
+    where = " AND ".join(f"{c} = :{c}" for c in columns) or "TRUE"
+    return f"SELECT route_id FROM routes WHERE {where} ORDER BY route_id DESC LIMIT 50"
+
+
+def scan_nodes(plan: dict) -> list:
+    nodes = [plan["Node Type"] + (f" ({plan['Index Name']})" if "Index Name" in plan else "")]
+    for child in plan.get("Plans", []):
+        nodes.extend(scan_nodes(child))
+    return [n for n in nodes if "Scan" in n or "Bitmap" in n]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-filters", type=int, default=3, help="조합할 최대 필터 수")
+    args = parser.parse_args()
+
+    with Session(engine) as db:
+        total = db.execute(text("SELECT COUNT(*) FROM routes")).scalar()
+        print(f"routes: {total:,}행\n")
+        print(f"{'filters':<48} {'median(ms)':>10}  plan")
+        for size in range(1, args.max_filters + 1):
+            for columns in itertools.combinations(SAMPLE_FILTERS, size):
+                params = {c: SAMPLE_FILTERS[c] for c in columns}
+                sql = build_sql(columns)
+                timings, plan = [], None
+                for _ in range(args.repeat):
+                    row = db.execute(text(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}"), params).scalar()
+                    result = row[0] if isinstance(row, list) else json.loads(row)[0]
+                    timings.append(result["Execution Time"])
+                    plan = result["Plan"]
+                print(f"{'+'.join(columns):<48} {statistics.median(timings):>10.2f}  {', '.join(scan_nodes(plan))}")
+
+
+if __name__ == "__main__":
+    main()
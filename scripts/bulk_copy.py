@@ -0,0 +1,81 @@
+"""
+COPY FROM STDIN 기반 대량 적재 헬퍼
+행 이터레이터를 텍스트 형식(탭 구분)으로 스트리밍해 ORM/INSERT 없이 적재합니다.
+generate_synthetic_data.py, seed_dummy_data.py 에서 사용합니다.
+"""
+import enum
+import io
+import json
+from typing import Any, Iterable, Sequence
+
+from sqlalchemy.engine import Connection
+
+# 버퍼가 이 크기를 넘을 때마다 서버로 보냄 (메모리 사용량 상한)
+FLUSH_BYTES = 8 * 1024 * 1024
+
+_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _format(value: Any) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, enum.Enum):
+        return str(value.value).translate(_ESCAPES)
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False).translate(_ESCAPES)
+    return str(value).translate(_ESCAPES)
+
+
+class _RowStream(io.RawIOBase):
+    """행 이터레이터를 COPY 텍스트 형식의 바이트 스트림으로 변환하는 읽기 전용 파일 객체"""
+
+    def __init__(self, rows: Iterable[Sequence[Any]]):
+        self._rows = iter(rows)
+        self._buffer = b""
+        self.count = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, target) -> int:
+        while len(self._buffer) < len(target):
+            chunk = []
+            size = 0
+            for row in self._rows:
+                line = "\t".join(_format(v) for v in row) + "\n"
+                chunk.append(line)
+                size += len(line)
+                self.count += 1
+                if size >= FLUSH_BYTES:
+                    break
+            if not chunk:
+                break
+            self._buffer += "".join(chunk).encode("utf-8")
+        n = min(len(target), len(self._buffer))
+        target[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+
+def copy_rows(conn: Connection, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> int:
+    """rows를 COPY table (columns) FROM STDIN 으로 적재하고 적재한 행 수를 반환합니다. (psycopg2 필요)"""
+    stream = _RowStream(rows)
+    column_list = ", ".join(f'"{c}"' for c in columns)
+    raw = conn.connection.dbapi_connection
+    with raw.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {table} ({column_list}) FROM STDIN WITH (FORMAT text)",
+            io.BufferedReader(stream, buffer_size=FLUSH_BYTES),
+            size=FLUSH_BYTES,
+        )
+    return stream.count
+
+
+def reset_sequence(conn: Connection, table: str, column: str) -> None:
+    """id를 직접 지정해 적재한 뒤 시퀀스를 최댓값 다음으로 맞춥니다."""
+    conn.exec_driver_sql(
+        f"SELECT setval(pg_get_serial_sequence('{table}', '{column}'), "
+        f"COALESCE((SELECT MAX({column}) FROM {table}), 0) + 1, false)"
+    )
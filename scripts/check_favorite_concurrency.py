@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+찜 추가/삭제 동시성 점검
+여러 스레드가 같은 (사용자, 장소) 찜을 동시에 추가·삭제·일괄 동기화하면서
+중복 키 등 DB 오류가 발생하지 않는지, 최종 상태가 한 행 이하인지 확인합니다.
+DATABASE_URL 의 데이터베이스에 --user-id 사용자와 --place-id 장소가 있어야 합니다.
+
+사용 예: python scripts/check_favorite_concurrency.py --threads 16 --rounds 50
+"""
+import sys
+import os
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy.orm import Session
+from app.core.database import engine
+from app.crud import favorite as crud_fav
+from app.models import FavoritePlace
+
+
+def worker(index: int, barrier: Barrier, user_id: int, place_id: int, rounds: int) -> list:
+    errors = []
+    for r in range(rounds):
+        barrier.wait()  # 모든 스레드가 같은 순간에 요청하도록 맞춤
+        try:
+            with Session(engine) as db:
+                op = (index + r) % 3
+                if op == 0:
+                    crud_fav.add_favorite_place(db, user_id, place_id)
+                elif op == 1:
+                    crud_fav.remove_favorite_place(db, user_id, place_id)
+                else:
+                    crud_fav.sync_favorites(db, user_id, add_place_ids=[place_id])
+        except Exception as e:  # 어떤 예외든 실패로 기록
+            errors.append(f"thread {index} round {r}: {e!r}")
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--user-id", type=int, default=1)
+    parser.add_argument("--place-id", type=int, default=1)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    barrier = Barrier(args.threads)
+    with ThreadPoolExecutor(max_workers=args.threads) as pool:
+        futures = [
+            pool.submit(worker, i, barrier, args.user_id, args.place_id, args.rounds)
+            for i in range(args.threads)
+        ]
+        errors = [e for f in futures for e in f.result()]
+
+    with Session(engine) as db:
+        rows = db.query(FavoritePlace).filter_by(user_id=args.user_id, place_id=args.place_id).count()
+        crud_fav.remove_favorite_place(db, args.user_id, args.place_id)
+
+    for e in errors[:20]:
+        print(e)
+    print(f"operations={args.threads * args.rounds} errors={len(errors)} final_rows={rows}")
+    sys.exit(1 if errors or rows > 1 else 0)
+
+
+if __name__ == "__main__":
+    main()
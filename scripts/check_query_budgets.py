@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+엔드포인트별 SQL 문 예산 점검
+찜 목록 엔드포인트를 호출하면서 실행된 SQL 문 수를 세고, 예산을 넘으면 실패합니다.
+(N+1 / 지연 로딩 회귀 방지용) DATABASE_URL 의 데이터베이스에 --user-id 사용자가 있어야 하며,
+찜이 여러 개 있어야 N+1 여부가 드러납니다. 200 이 아닌 응답은 실패로 처리합니다.
+
+사용 예: python scripts/check_query_budgets.py --user-id 1
+"""
+import sys
+import os
+import argparse
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from app.core.database import engine
+from app.core.query_budget import statement_budget, StatementBudgetExceeded
+from app.main import app
+from app.models import User
+from app.utils.jwt import create_access_token
+
+# (경로, 인증 필요 여부, 허용 SQL 문 수) — 인증이 필요한 경우 사용자 조회 1개 포함
+BUDGETS = [
+    ("/api/v1/favorites/places/{user_id}", False, 1),
+    ("/api/v1/favorites/routes/{user_id}", False, 1),
+    ("/api/v1/favorites/places", True, 2),
+    ("/api/v1/map/{user_id}/favorites", False, 1),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--user-id", type=int, default=1)
+    args = parser.parse_args()
+
+    with Session(engine) as db:
+        user = db.get(User, args.user_id)
+        if user is None:
+            sys.exit(f"user {args.user_id} not found")
+        token = create_access_token({"sub": str(user.id), "ver": user.token_version})
+
+    # lifespan(인덱스 빌드 등)을 실행하지 않도록 컨텍스트 매니저 없이 사용
+    client = TestClient(app)
+    failed = False
+    for path, needs_auth, budget in BUDGETS:
+        url = path.format(user_id=args.user_id)
+        headers = {"Authorization": f"Bearer {token}"} if needs_auth else {}
+        try:
+            # primary 와 replica(REPLICA_DATABASE_URLS) 엔진의 문장을 모두 집계
+            with statement_budget(budget) as stats:
+                resp = client.get(url, headers=headers)
+        except StatementBudgetExceeded as e:
+            failed = True
+            print(f"FAIL  {url:<40} {e}")
+            continue
+        # 401/404/500 응답은 문장을 덜 실행하므로 예산 통과로 보면 안 됨
+        if resp.status_code != 200:
+            failed = True
+            print(f"FAIL  {url:<40} status={resp.status_code} {resp.text[:200]}")
+            continue
+        print(f"ok    {url:<40} status={resp.status_code} statements={stats.count}/{budget}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+읽기 replica 라우팅 점검
+임시 SQLite 파일 3개(primary, replica 2개)로 get_read_db 의 라운드 로빈, 연결 실패 replica 제외/복귀,
+쓰기 이후 read-your-writes(쿠키, Authorization 헤더) 동작을 확인합니다. Postgres 는 필요하지 않습니다.
+
+사용 예: python scripts/check_read_replicas.py
+"""
+import sys
+import os
+import json
+import sqlite3
+import tempfile
+import time
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+TMP = tempfile.mkdtemp(prefix="replicas_")
+NAMES = ["primary", "replica-0", "replica-1"]
+for name in NAMES:
+    with sqlite3.connect(os.path.join(TMP, f"{name}.db")) as conn:
+        conn.execute("CREATE TABLE whoami (name TEXT)")
+        conn.execute("INSERT INTO whoami VALUES (?)", (name,))
+
+
+def sqlite_url(name: str) -> str:
+    # mode=rw: 파일이 없으면 새로 만들지 않고 연결 실패
+    return f"sqlite:///file:{os.path.join(TMP, name)}.db?mode=rw&uri=true"
+
+
+EJECT_SECONDS = 1
+os.environ["DATABASE_URL"] = sqlite_url("primary")
+os.environ["REPLICA_DATABASE_URLS"] = json.dumps([sqlite_url("replica-0"), sqlite_url("replica-1")])
+os.environ["REPLICA_EJECT_SECONDS"] = str(EJECT_SECONDS)
+os.environ.setdefault("SECRET_KEY", "check")
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from app.core.database import get_db
+from app.core.read_replicas import ReadYourWritesMiddleware, get_read_db, replica_pool
+
+app = FastAPI()
+app.add_middleware(ReadYourWritesMiddleware, window_seconds=2)
+
+
+@app.get("/who")
+def who(db: Session = Depends(get_read_db)):
+    return db.execute(text("SELECT name FROM whoami")).scalar()
+
+
+@app.post("/write")
+def write(db: Session = Depends(get_db)):
+    return "ok"
+
+
+failed = False
+
+
+def check(label: str, actual, expected) -> None:
+    global failed
+    ok = actual == expected
+    failed |= not ok
+    print(f"{'OK  ' if ok else 'FAIL'} {label}: {actual}" + ("" if ok else f" (expected {expected})"))
+
+
+def reads(client: TestClient, count: int, headers=None):
+    return [client.get("/who", headers=headers).json() for _ in range(count)]
+
+
+def main():
+    anonymous = TestClient(app)
+    check("round robin", sorted(reads(anonymous, 4)), ["replica-0", "replica-0", "replica-1", "replica-1"])
+
+    # 쓰기 후 쿠키를 가진 클라이언트는 primary 로
+    writer = TestClient(app)
+    writer.post("/write")
+    check("after write (cookie)", set(reads(writer, 3)), {"primary"})
+    # 쿠키를 보내지 않아도 같은 Authorization 헤더면 primary 로
+    token = {"Authorization": "Bearer writer-token"}
+    TestClient(app).post("/write", headers=token)
+    check("after write (authorization)", set(reads(TestClient(app), 3, token)), {"primary"})
+    check("other clients", set(reads(anonymous, 4)) <= {"replica-0", "replica-1"}, True)
+    time.sleep(2.1)
+    check("stickiness expires", set(reads(writer, 4)), {"replica-0", "replica-1"})
+
+    # replica-1 이 죽으면 제외되고 replica-0 만 사용
+    down = os.path.join(TMP, "replica-1.db")
+    os.rename(down, down + ".down")
+    replica_pool.engines[1].dispose()
+    check("replica down", set(reads(anonymous, 6)), {"replica-0"})
+    check("ejected", replica_pool.is_healthy(1), False)
+
+    # 모든 replica 가 죽으면 primary
+    os.rename(os.path.join(TMP, "replica-0.db"), os.path.join(TMP, "replica-0.db.down"))
+    replica_pool.engines[0].dispose()
+    check("all replicas down", set(reads(anonymous, 3)), {"primary"})
+
+    # 복구 후 제외 기간이 지나면 다시 사용
+    for name in ("replica-0", "replica-1"):
+        os.rename(os.path.join(TMP, f"{name}.db.down"), os.path.join(TMP, f"{name}.db"))
+    time.sleep(EJECT_SECONDS + 0.1)
+    check("re-admitted", sorted(set(reads(anonymous, 4))), ["replica-0", "replica-1"])
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+시드 DB 스냅샷/복원
+시드가 끝난 DB를 템플릿 DB({DB}_seed)로 복제해 두고, 테스트/벤치마크 전에
+DROP + CREATE DATABASE ... TEMPLATE 로 파일 단위 복사해 수 초 걸리던 재시드를 밀리초~초 단위로 줄입니다.
+(PostgreSQL 13 이상, CREATEDB 권한 필요)
+
+사용 예:
+    python scripts/seed_dummy_data.py --snapshot     # 시드 후 스냅샷
+    python scripts/db_snapshot.py snapshot           # 현재 DB를 스냅샷
+    python scripts/db_snapshot.py restore            # 스냅샷으로 되돌리기
+"""
+import sys
+import os
+import argparse
+import time
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import URL, make_url
+
+SNAPSHOT_SUFFIX = "_seed"
+
+
+def _admin_engine(url: URL):
+    """대상 DB가 아닌 maintenance DB(postgres)에 AUTOCOMMIT으로 연결 (CREATE/DROP DATABASE는 트랜잭션 밖에서만 가능)"""
+    return create_engine(url.set(database="postgres"), isolation_level="AUTOCOMMIT", future=True)
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _terminate_connections(conn, database: str) -> None:
+    conn.execute(
+        text("SELECT pg_terminate_backend(pid) FROM pg_stat_activity WHERE datname = :db AND pid <> pg_backend_pid()"),
+        {"db": database},
+    )
+
+
+def snapshot_database(url, snapshot_name: str = None) -> str:
+    """현재 DB를 템플릿으로 복제해 스냅샷 DB를 만들고 그 이름을 반환합니다. (기존 스냅샷은 교체)"""
+    url = make_url(url)
+    source = url.database
+    snapshot_name = snapshot_name or source + SNAPSHOT_SUFFIX
+    admin = _admin_engine(url)
+    try:
+        with admin.connect() as conn:
+            conn.execute(text(f"DROP DATABASE IF EXISTS {_quote(snapshot_name)} WITH (FORCE)"))
+            # 템플릿 원본에 다른 연결이 있으면 복제가 실패하므로 먼저 끊음
+            _terminate_connections(conn, source)
+            conn.execute(text(f"CREATE DATABASE {_quote(snapshot_name)} TEMPLATE {_quote(source)}"))
+    finally:
+        admin.dispose()
+    return snapshot_name
+
+
+def restore_database(url, snapshot_name: str = None) -> None:
+    """DB를 지우고 스냅샷 DB를 템플릿으로 다시 만듭니다."""
+    url = make_url(url)
+    target = url.database
+    snapshot_name = snapshot_name or target + SNAPSHOT_SUFFIX
+    admin = _admin_engine(url)
+    try:
+        with admin.connect() as conn:
+            exists = conn.execute(text("SELECT 1 FROM pg_database WHERE datname = :db"), {"db": snapshot_name}).first()
+            if not exists:
+                raise RuntimeError(f"스냅샷 DB가 없습니다: {snapshot_name} (먼저 snapshot 을 실행하세요)")
+            _terminate_connections(conn, snapshot_name)
+            conn.execute(text(f"DROP DATABASE IF EXISTS {_quote(target)} WITH (FORCE)"))
+            conn.execute(text(f"CREATE DATABASE {_quote(target)} TEMPLATE {_quote(snapshot_name)}"))
+    finally:
+        admin.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("command", choices=["snapshot", "restore"])
+    parser.add_argument("--name", help=f"스냅샷 DB 이름 (기본: <DB 이름>{SNAPSHOT_SUFFIX})")
+    args = parser.parse_args()
+
+    from app.core.database import DATABASE_URL
+
+    started = time.perf_counter()
+    if args.command == "snapshot":
+        name = snapshot_database(DATABASE_URL, args.name)
+        print(f"✓ 스냅샷 저장: {name} ({time.perf_counter() - started:.2f}s)")
+    else:
+        restore_database(DATABASE_URL, args.name)
+        print(f"✓ 스냅샷에서 복원 완료 ({time.perf_counter() - started:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
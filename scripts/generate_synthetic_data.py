@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+대규모 합성 데이터 생성 스크립트
+사용자/장소/루트/투표/찜 데이터를 COPY FROM STDIN 으로 대량 적재합니다.
+- 좌표: 실제 주요 관광 도시 중심에서 정규분포로 흩어진 한국 내 좌표
+- 인기도: 파레토 분포 가중치로 일부 장소/루트에 투표·찜이 몰리도록 치우침
+- 투표 집계(count_*)는 적재 후 SQL로 한 번에 반영하고, 일정 스냅샷(itinerary)도 함께 생성
+기존 데이터 뒤에 id를 이어서 추가하므로 빈 DB와 기존 DB 모두에 사용할 수 있습니다.
+
+사용 예: python scripts/generate_synthetic_data.py --users 100000 --places 1000000 --routes 200000 --votes 5000000 --favorites 2000000
+"""
+import sys
+import os
+import argparse
+import itertools
+import random
+import time
+from bisect import bisect
+from datetime import datetime, timedelta, timezone
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import text
+from app.core.database import engine
+from app.core.security import get_password_hash
+from app.services.itinerary import build_itinerary
+from app.utils.hangul import decompose_jamo
+from bulk_copy import copy_rows, reset_sequence
+
+# (지역명, 위도, 경도, 표준편차(도)) — 관광 수요가 큰 도시일수록 앞쪽에 두고 가중치를 크게 줌
+REGIONS = [
+    ("서울", 37.5665, 126.9780, 0.08),
+    ("부산", 35.1796, 129.0756, 0.07),
+    ("제주", 33.4996, 126.5312, 0.20),
+    ("강릉", 37.7519, 128.8761, 0.05),
+    ("경주", 35.8562, 129.2247, 0.05),
+    ("수원", 37.2636, 127.0286, 0.04),
+    ("전주", 35.8242, 127.1480, 0.04),
+    ("여수", 34.7604, 127.6622, 0.05),
+    ("속초", 38.2070, 128.5918, 0.04),
+    ("대구", 35.8714, 128.6014, 0.06),
+    ("인천", 37.4563, 126.7052, 0.07),
+    ("통영", 34.8544, 128.4331, 0.04),
+]
+REGION_WEIGHTS = [30, 15, 15, 6, 6, 5, 5, 4, 4, 4, 4, 2]
+
+PLACE_TYPES = ["카페", "음식점", "관광지", "공원", "해변", "박물관", "시장", "숙소", "전시", "산책로"]
+NAME_PREFIXES = ["푸른", "작은", "오래된", "달빛", "바다", "숲속", "골목", "햇살", "노을", "한옥", "별빛", "구름"]
+NAME_STEMS = ["정원", "마당", "언덕", "다방", "식탁", "쉼터", "책방", "공방", "포구", "마을", "길", "뜰"]
+ATMOSPHERES = ["잔잔하고 조용한", "신나는 액티비티", "다채로운 경험", "맛있는 여행", "아늑하고 로맨틱한"]
+TAG_ENV = ["sea", "mountain", "city", "country", "all"]
+TAG_WITH = ["alone", "friend", "family", "pet", "love", "all"]
+TAG_MOVE = ["walk", "bicycle", "car", "public", "train", "all"]
+TRANSPORTS = ["도보", "버스", "지하철", "택시", "자전거"]
+VOTE_TYPES = ["real", "normal", "bad"]
+VOTE_TYPE_WEIGHTS = [6, 3, 1]
+
+NOW = datetime.now(timezone.utc)
+
+
+def skewed_weights(rng: random.Random, count: int, alpha: float = 1.16):
+    """파레토 분포 누적 가중치 (alpha≈1.16이면 상위 20%가 약 80%를 차지)"""
+    return list(itertools.accumulate(rng.paretovariate(alpha) for _ in range(count)))
+
+
+def weighted_sample(rng: random.Random, cum_weights, k: int, offset: int = 0) -> set:
+    """누적 가중치에서 중복 없이 최대 k개 index(+offset)를 뽑습니다."""
+    total = cum_weights[-1]
+    picked = set()
+    for _ in range(k * 2):
+        if len(picked) >= k:
+            break
+        picked.add(offset + bisect(cum_weights, rng.random() * total))
+    return picked
+
+
+def random_created_at(rng: random.Random) -> datetime:
+    return NOW - timedelta(seconds=rng.randint(0, 365 * 24 * 3600))
+
+
+def max_id(conn, table: str, column: str) -> int:
+    return conn.execute(text(f"SELECT COALESCE(MAX({column}), 0) FROM {table}")).scalar()
+
+
+def generate_users(rng, start: int, count: int, city_ids, password_hash: str):
+    for uid in range(start + 1, start + count + 1):
+        yield (
+            uid, f"user{uid}@synthetic.loco", password_hash, f"u{uid}", None,
+            rng.choice(city_ids) if city_ids else None, rng.random() < 0.3, 0, "C", 0,
+            random_created_at(rng),
+        )
+
+
+def generate_places(rng, start: int, count: int, user_start: int, user_count: int, place_meta: list):
+    for pid in range(start + 1, start + count + 1):
+        region_index = rng.choices(range(len(REGIONS)), weights=REGION_WEIGHTS)[0]
+        region, lat, lng, spread = REGIONS[region_index]
+        place_type = rng.choice(PLACE_TYPES)
+        name = f"{region} {rng.choice(NAME_PREFIXES)}{rng.choice(NAME_STEMS)} {place_type} {pid}"
+        place_meta.append((region_index, name, place_type))
+        yield (
+            pid, name, decompose_jamo(name), place_type, False,
+            user_start + rng.randint(1, user_count),
+            rng.choice(ATMOSPHERES), None, None, None, 0, 0, 0, random_created_at(rng),
+            round(rng.gauss(lat, spread), 6), round(rng.gauss(lng, spread), 6),
+            f"{region}의 {place_type}", None, f"{region} 어딘가 {pid}", region, None,
+        )
+
+
+def generate_routes(rng, start: int, count: int, user_start: int, user_count: int,
+                    place_start: int, place_meta: list, places_by_region: dict, place_weights: dict,
+                    map_rows: list, with_embeddings: bool):
+    map_id = itertools.count(1)
+    for rid in range(start + 1, start + count + 1):
+        region_index = rng.choices(range(len(REGIONS)), weights=REGION_WEIGHTS)[0]
+        region = REGIONS[region_index][0]
+        candidates = places_by_region.get(region_index)
+        stop_count = rng.randint(2, 6)
+        days = 1 if stop_count <= 3 else rng.randint(1, 2)
+        picked = sorted(weighted_sample(rng, place_weights[region_index], stop_count)) if candidates else []
+
+        stops, transports = [], []
+        for order, local_index in enumerate(picked, start=1):
+            place_id = place_start + candidates[local_index] + 1
+            _, name, place_type = place_meta[candidates[local_index]]
+            day = 1 if days == 1 else (1 if order <= len(picked) // 2 else 2)
+            stops.append((place_id, name, place_type, day, order))
+            map_rows.append((next(map_id), rid, place_id, day, order, False, None, None))
+            if order < len(picked):
+                transport = rng.choice(TRANSPORTS)
+                transports.append((transport, day, order))
+                map_rows.append((next(map_id), rid, None, day, order, True, None, transport))
+
+        name = f"{region} {rng.choice(NAME_PREFIXES)} {rng.choice(ATMOSPHERES).split()[0]} 코스 {rid}"
+        embedding = None
+        if with_embeddings:
+            vector = [rng.gauss(0, 1) for _ in range(768)]
+            norm = sum(v * v for v in vector) ** 0.5
+            embedding = "[" + ",".join(f"{v / norm:.5f}" for v in vector) + "]"
+        yield (
+            rid, name, decompose_jamo(name), f"{region} 여행 코스", region, rng.random() < 0.1,
+            user_start + rng.randint(1, user_count), None, 0, 0, 0, random_created_at(rng),
+            days, rng.choice(TAG_ENV), rng.choice(TAG_WITH), rng.choice(TAG_MOVE),
+            rng.choice(ATMOSPHERES), min(stop_count, 6),
+            build_itinerary(stops, transports), embedding,
+        )
+
+
+def generate_pairs(rng, user_start: int, user_count: int, target_start: int, cum_weights,
+                   total: int, with_vote_type: bool, with_created_at: bool):
+    """사용자별로 치우친 분포에서 대상을 뽑아 (user_id, target_id[, ...]) 행을 만듭니다. (사용자당 중복 없음)"""
+    per_user = total / user_count
+    row_id = itertools.count(1)
+    for uid in range(user_start + 1, user_start + user_count + 1):
+        k = min(int(rng.expovariate(1 / per_user)) if per_user > 0 else 0, len(cum_weights))
+        for target in weighted_sample(rng, cum_weights, k, offset=target_start + 1):
+            row = [next(row_id), uid, target]
+            if with_vote_type:
+                row.append(rng.choices(VOTE_TYPES, weights=VOTE_TYPE_WEIGHTS)[0])
+            if with_created_at:
+                row.append(random_created_at(rng))
+            yield row
+
+
+COUNT_SQL = {
+    "places": """
+        UPDATE places p SET count_real = v.real, count_normal = v.normal, count_bad = v.bad
+        FROM (
+            SELECT place_id,
+                   count(*) FILTER (WHERE vote_type = 'real') AS real,
+                   count(*) FILTER (WHERE vote_type = 'normal') AS normal,
+                   count(*) FILTER (WHERE vote_type = 'bad') AS bad
+            FROM place_votes GROUP BY place_id
+        ) v
+        WHERE p.place_id = v.place_id
+    """,
+    "routes": """
+        UPDATE routes r SET count_real = v.real, count_soso = v.normal, count_bad = v.bad
+        FROM (
+            SELECT route_id,
+                   count(*) FILTER (WHERE vote_type = 'real') AS real,
+                   count(*) FILTER (WHERE vote_type = 'normal') AS normal,
+                   count(*) FILTER (WHERE vote_type = 'bad') AS bad
+            FROM route_votes GROUP BY route_id
+        ) v
+        WHERE r.route_id = v.route_id
+    """,
+}
+
+
+def timed(label: str, fn):
+    started = time.perf_counter()
+    result = fn()
+    print(f"  {label:<20} {result:>12,} rows  {time.perf_counter() - started:>7.1f}s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--places", type=int, default=100_000)
+    parser.add_argument("--routes", type=int, default=20_000)
+    parser.add_argument("--votes", type=int, default=500_000, help="장소/루트 투표 각각의 대략적인 총 개수")
+    parser.add_argument("--favorites", type=int, default=200_000, help="장소/루트 찜 각각의 대략적인 총 개수")
+    parser.add_argument("--embeddings", action="store_true", help="루트 임베딩을 임의의 단위 벡터로 채움 (추천 API 부하 테스트용)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    started = time.perf_counter()
+    # 비밀번호는 모두 password123 (bcrypt는 느리므로 한 번만 계산)
+    password_hash = get_password_hash("password123")
+
+    with engine.begin() as conn:
+        city_ids = conn.execute(text("SELECT region_id FROM region_cities")).scalars().all()
+        user_start = max_id(conn, "users", "id")
+        place_start = max_id(conn, "places", "place_id")
+        route_start = max_id(conn, "routes", "route_id")
+        offsets = {
+            table: max_id(conn, table, column)
+            for table, column in (("route_place_maps", "id"), ("place_votes", "place_vote_id"),
+                                  ("route_votes", "route_vote_id"), ("favorite_places", "id"),
+                                  ("favorite_routes", "id"))
+        }
+
+        def shifted(rows, table):
+            for row in rows:
+                row = list(row)
+                row[0] += offsets[table]
+                yield row
+
+        print("적재 중...")
+        timed("users", lambda: copy_rows(
+            conn, "users",
+            ["id", "email", "hashed_password", "nickname", "intro", "city_id", "is_local", "points", "grade",
+             "token_version", "created_at"],
+            generate_users(rng, user_start, args.users, city_ids, password_hash),
+        ))
+
+        place_meta = []
+        timed("places", lambda: copy_rows(
+            conn, "places",
+            ["place_id", "name", "name_jamo", "type", "is_frequent", "created_by", "atmosphere", "pros", "cons",
+             "image_url", "count_real", "count_normal", "count_bad", "created_at", "latitude", "longitude",
+             "intro", "phone", "address_name", "short_location", "link"],
+            generate_places(rng, place_start, args.places, user_start, args.users, place_meta),
+        ))
+
+        # 같은 지역 장소끼리 루트를 구성하고, 인기 장소가 루트에 자주 등장하도록 지역별 가중치 생성
+        places_by_region = {}
+        for index, (region_index, _, _) in enumerate(place_meta):
+            places_by_region.setdefault(region_index, []).append(index)
+        place_weights = {r: skewed_weights(rng, len(ids)) for r, ids in places_by_region.items()}
+
+        map_rows = []
+        timed("routes", lambda: copy_rows(
+            conn, "routes",
+            ["route_id", "name", "name_jamo", "intro", "location", "is_recommend", "created_by", "image_url",
+             "count_real", "count_soso", "count_bad", "created_at", "tag_period", "tag_env", "tag_with",
+             "tag_move", "tag_atmosphere", "tag_place_count", "itinerary", "embedding"],
+            generate_routes(rng, route_start, args.routes, user_start, args.users, place_start, place_meta,
+                            places_by_region, place_weights, map_rows, args.embeddings),
+        ))
+        timed("route_place_maps", lambda: copy_rows(
+            conn, "route_place_maps",
+            ["id", "route_id", "place_id", "day", "order", "is_transportation", "memo", "transportation"],
+            shifted(map_rows, "route_place_maps"),
+        ))
+        del map_rows
+
+        place_popularity = skewed_weights(rng, args.places)
+        route_popularity = skewed_weights(rng, args.routes)
+        timed("place_votes", lambda: copy_rows(
+            conn, "place_votes", ["place_vote_id", "user_id", "place_id", "vote_type"],
+            shifted(generate_pairs(rng, user_start, args.users, place_start, place_popularity, args.votes, True, False), "place_votes"),
+        ))
+        timed("route_votes", lambda: copy_rows(
+            conn, "route_votes", ["route_vote_id", "user_id", "route_id", "vote_type"],
+            shifted(generate_pairs(rng, user_start, args.users, route_start, route_popularity, args.votes, True, False), "route_votes"),
+        ))
+        timed("favorite_places", lambda: copy_rows(
+            conn, "favorite_places", ["id", "user_id", "place_id", "created_at"],
+            shifted(generate_pairs(rng, user_start, args.users, place_start, place_popularity, args.favorites, False, True), "favorite_places"),
+        ))
+        timed("favorite_routes", lambda: copy_rows(
+            conn, "favorite_routes", ["id", "user_id", "route_id", "created_at"],
+            shifted(generate_pairs(rng, user_start, args.users, route_start, route_popularity, args.favorites, False, True), "favorite_routes"),
+        ))
+
+        print("투표 집계/시퀀스 갱신 중...")
+        for sql in COUNT_SQL.values():
+            conn.execute(text(sql))
+        for table, column in (("users", "id"), ("places", "place_id"), ("routes", "route_id"),
+                              ("route_place_maps", "id"), ("place_votes", "place_vote_id"),
+                              ("route_votes", "route_vote_id"), ("favorite_places", "id"),
+                              ("favorite_routes", "id")):
+            reset_sequence(conn, table, column)
+
+    # ANALYZE는 트랜잭션 밖에서 실행해야 통계가 바로 반영됨
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("ANALYZE"))
+
+    print(f"완료: {time.perf_counter() - started:.1f}s (랭킹은 scripts/recompute_rankings.py 로 갱신)")
+
+
+if __name__ == "__main__":
+    main()
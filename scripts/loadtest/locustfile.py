@@ -0,0 +1,44 @@
+"""
+Locust 부하 테스트 시나리오 (scenarios.py 의 가중치를 그대로 사용)
+
+사용 예:
+    locust -f scripts/loadtest/locustfile.py --host http://localhost:8000 \
+        --headless -u 200 -r 20 -t 5m --csv reports/locust
+환경 변수 LOADTEST_MAX_USER_ID / LOADTEST_MAX_PLACE_ID / LOADTEST_MAX_ROUTE_ID 로 id 범위를 지정합니다.
+"""
+import os
+import random
+import sys
+
+from locust import HttpUser, between
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from scenarios import API, SCENARIOS, login_form
+
+CONTEXT = {
+    "max_user_id": int(os.getenv("LOADTEST_MAX_USER_ID", "10000")),
+    "max_place_id": int(os.getenv("LOADTEST_MAX_PLACE_ID", "100000")),
+    "max_route_id": int(os.getenv("LOADTEST_MAX_ROUTE_ID", "20000")),
+}
+
+
+def _make_task(scenario):
+    def run(user):
+        path, params, body = scenario.build(user.rng, CONTEXT)
+        headers = user.auth_headers if scenario.requires_auth else None
+        user.client.request(scenario.method, path, params=params, json=body, headers=headers, name=scenario.name)
+    run.__name__ = scenario.name
+    return run
+
+
+class LocoUser(HttpUser):
+    wait_time = between(0.5, 2.0)
+    tasks = {_make_task(scenario): scenario.weight for scenario in SCENARIOS}
+
+    def on_start(self):
+        self.rng = random.Random()
+        resp = self.client.post(
+            f"{API}/auth/login", data=login_form(self.rng.randint(1, CONTEXT["max_user_id"])), name="auth.login",
+        )
+        token = resp.json().get("access_token") if resp.ok else None
+        self.auth_headers = {"Authorization": f"Bearer {token}"} if token else {}
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+엔드포인트 벤치마크 (JSON 리포트)
+scenarios.py 의 시나리오별로 고정 개수의 요청을 동시 실행해 지연 시간 분포와 처리량을 측정하고,
+비교 가능한 JSON 리포트로 저장합니다. --compare 로 이전 리포트 대비 변화량을 출력합니다.
+
+사용 예:
+    python scripts/loadtest/run_benchmark.py --host http://localhost:8000 --requests 500 --concurrency 16 \
+        --output reports/after.json --compare reports/before.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from scenarios import API, SCENARIOS, login_form
+
+
+def percentile(sorted_values, q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def login(host: str, user_id: int) -> dict:
+    resp = requests.post(f"{host}{API}/auth/login", data=login_form(user_id), timeout=10)
+    resp.raise_for_status()
+    return {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+def run_scenario(host: str, scenario, context: dict, total: int, concurrency: int, headers: dict, seed: int) -> dict:
+    def worker(worker_index: int):
+        rng = random.Random(seed * 1000 + worker_index)
+        session = requests.Session()
+        timings, errors, db_ms = [], 0, []
+        for _ in range(total // concurrency):
+            path, params, body = scenario.build(rng, context)
+            started = time.perf_counter()
+            try:
+                resp = session.request(
+                    scenario.method, f"{host}{path}", params=params, json=body,
+                    headers=headers if scenario.requires_auth else None, timeout=30,
+                )
+                if resp.status_code >= 500:
+                    errors += 1
+                # QueryStatsMiddleware 의 Server-Timing 헤더에서 DB 시간 추출
+                timing = resp.headers.get("server-timing", "")
+                if "dur=" in timing:
+                    db_ms.append(float(timing.split("dur=")[1].split(";")[0]))
+            except requests.RequestException:
+                errors += 1
+            timings.append((time.perf_counter() - started) * 1000)
+        return timings, errors, db_ms
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(worker, range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    timings = sorted(t for r in results for t in r[0])
+    db_ms = [d for r in results for d in r[2]]
+    return {
+        "requests": len(timings),
+        "errors": sum(r[1] for r in results),
+        "rps": round(len(timings) / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": round(statistics.fmean(timings), 2) if timings else 0.0,
+        "p50_ms": round(percentile(timings, 0.50), 2),
+        "p95_ms": round(percentile(timings, 0.95), 2),
+        "p99_ms": round(percentile(timings, 0.99), 2),
+        "db_mean_ms": round(statistics.fmean(db_ms), 2) if db_ms else None,
+    }
+
+
+def print_comparison(current: dict, baseline: dict) -> None:
+    print(f"\n{'scenario':<20} {'p50 before':>11} {'p50 after':>10} {'Δ%':>7} {'p95 before':>11} {'p95 after':>10} {'Δ%':>7}")
+    for name, after in current["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if not before:
+            continue
+        def delta(key):
+            return (after[key] - before[key]) / before[key] * 100 if before[key] else 0.0
+        print(f"{name:<20} {before['p50_ms']:>11.2f} {after['p50_ms']:>10.2f} {delta('p50_ms'):>+7.1f} "
+              f"{before['p95_ms']:>11.2f} {after['p95_ms']:>10.2f} {delta('p95_ms'):>+7.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="http://localhost:8000")
+    parser.add_argument("--requests", type=int, default=500, help="시나리오당 요청 수")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--only", nargs="*", help="실행할 시나리오 이름 (기본: 전체)")
+    parser.add_argument("--max-user-id", type=int, default=10_000)
+    parser.add_argument("--max-place-id", type=int, default=100_000)
+    parser.add_argument("--max-route-id", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", help="JSON 리포트 저장 경로")
+    parser.add_argument("--compare", help="비교할 이전 JSON 리포트")
+    args = parser.parse_args()
+
+    context = {"max_user_id": args.max_user_id, "max_place_id": args.max_place_id, "max_route_id": args.max_route_id}
+    headers = login(args.host, random.Random(args.seed).randint(1, args.max_user_id))
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_revision": git_revision(),
+            "host": args.host,
+            "requests_per_scenario": args.requests,
+            "concurrency": args.concurrency,
+            "python": platform.python_version(),
+        },
+        "scenarios": {},
+    }
+
+    print(f"{'scenario':<20} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'db':>8} {'err':>5}")
+    for scenario in SCENARIOS:
+        if args.only and scenario.name not in args.only:
+            continue
+        result = run_scenario(args.host, scenario, context, args.requests, args.concurrency, headers, args.seed)
+        report["scenarios"][scenario.name] = result
+        db = f"{result['db_mean_ms']:.2f}" if result["db_mean_ms"] is not None else "-"
+        print(f"{scenario.name:<20} {result['rps']:>8.1f} {result['p50_ms']:>8.2f} {result['p95_ms']:>8.2f} "
+              f"{result['p99_ms']:>8.2f} {db:>8} {result['errors']:>5}")
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n리포트 저장: {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            print_comparison(report, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
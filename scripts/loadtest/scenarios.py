@@ -0,0 +1,65 @@
+"""
+부하 테스트/벤치마크 공용 시나리오
+locustfile.py 와 run_benchmark.py 가 같은 요청 구성과 가중치를 사용해 결과를 비교할 수 있게 합니다.
+합성 데이터(scripts/generate_synthetic_data.py)의 사용자 user{id}@synthetic.loco / password123 을 가정합니다.
+"""
+import random
+from typing import Callable, NamedTuple, Optional
+
+API = "/api/v1"
+
+SEARCH_TERMS = ["서울", "부산 바다", "제주 카페", "경북궁", "한옥", "ㅈㅈ", "ㄱㅂ", "노을 포구", "시장"]
+SUGGEST_TERMS = ["서", "서울 ", "ㅂㅅ", "제주 달", "ㅎㅇ", "강릉 바"]
+TAG_QUERIES = [
+    {"tag_env": "sea"},
+    {"tag_env": "city", "tag_with": "friend"},
+    {"tag_move": "walk", "tag_place_count": 3},
+    {"tag_period": 1, "tag_with": "family", "tag_atmosphere": "맛있는 여행"},
+]
+SURVEYS = [
+    {"period": "당일치기", "env": "바다", "with_whom": "친구", "move": "걸어서", "atmosphere": "맛있는 여행", "place_count": 3},
+    {"period": "1박2일", "env": "도시", "with_whom": "연인", "move": "자동차", "atmosphere": "아늑하고 로맨틱한", "place_count": 4},
+]
+
+
+class Scenario(NamedTuple):
+    name: str
+    method: str
+    weight: int
+    requires_auth: bool
+    # (rng, ctx) -> (path, params, json body)
+    build: Callable[[random.Random, dict], tuple]
+
+
+def _get(path: str, params: Optional[dict] = None):
+    return lambda rng, ctx: (path, params, None)
+
+
+SCENARIOS = [
+    Scenario("places.explore", "GET", 10, False, _get(f"{API}/places/explore")),
+    Scenario("routes.explore", "GET", 10, False, _get(f"{API}/routes/explore")),
+    Scenario("places.detail", "GET", 8, False,
+             lambda rng, ctx: (f"{API}/places/{rng.randint(1, ctx['max_place_id'])}", None, None)),
+    Scenario("routes.detail", "GET", 8, False,
+             lambda rng, ctx: (f"{API}/routes/{rng.randint(1, ctx['max_route_id'])}", None, None)),
+    Scenario("routes.search", "GET", 6, False,
+             lambda rng, ctx: (f"{API}/routes/search", rng.choice(TAG_QUERIES), None)),
+    Scenario("search.local", "GET", 6, False,
+             lambda rng, ctx: (f"{API}/search/local", {"q": rng.choice(SEARCH_TERMS)}, None)),
+    Scenario("search.suggest", "GET", 12, False,
+             lambda rng, ctx: (f"{API}/search/suggest", {"q": rng.choice(SUGGEST_TERMS)}, None)),
+    Scenario("map.places", "GET", 4, False, _get(f"{API}/map/places")),
+    Scenario("map.favorites", "GET", 4, False,
+             lambda rng, ctx: (f"{API}/map/{rng.randint(1, ctx['max_user_id'])}/favorites", None, None)),
+    Scenario("favorites.ids", "GET", 6, True, _get(f"{API}/favorites/places/ids")),
+    Scenario("votes.place", "POST", 3, True,
+             lambda rng, ctx: (f"{API}/votes/places", None,
+                               {"place_id": rng.randint(1, ctx["max_place_id"]),
+                                "vote_type": rng.choice(["real", "normal", "bad"])})),
+    Scenario("recommend.routes", "POST", 1, False,
+             lambda rng, ctx: (f"{API}/recommendations/routes", None, rng.choice(SURVEYS))),
+]
+
+
+def login_form(user_id: int) -> dict:
+    return {"username": f"user{user_id}@synthetic.loco", "password": "password123"}
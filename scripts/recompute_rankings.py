@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+사용자 랭킹/포인트/등급 재계산 스크립트
+cron 등 외부 스케줄러에서 실행할 때 사용합니다.
+(앱 내 스케줄러를 끄려면 RANKING_REFRESH_INTERVAL_SECONDS=0)
+"""
+import sys
+import os
+import time
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services.ranking import run_ranking_job
+
+
+def main():
+    started = time.perf_counter()
+    ranked_count = run_ranking_job()
+    elapsed = time.perf_counter() - started
+
+    if ranked_count is None:
+        print("다른 프로세스가 랭킹을 재계산 중이거나 오류가 발생했습니다.")
+        sys.exit(1)
+    print(f"✓ 랭킹 재계산 완료: 랭킹 대상 {ranked_count}명 ({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,15 +2,20 @@
 """
 더미 데이터 생성 스크립트
 test.db에 테스트용 더미 데이터를 삽입합니다.
+ORM 객체로 정의한 데이터를 COPY FROM STDIN 으로 적재하고, 초기화는 TRUNCATE 한 번으로 처리합니다.
+--snapshot 을 주면 적재 후 템플릿 DB로 스냅샷을 떠 두어 scripts/db_snapshot.py restore 로 즉시 복원할 수 있습니다.
 """
 import sys
 import os
+import argparse
 from datetime import datetime, timedelta
 import random
 
 # 프로젝트 루트를 sys.path에 추가
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from sqlalchemy import Column, inspect as sa_inspect, text, update
 from sqlalchemy.orm import Session
 from app.core.database import engine, Base
 from app.models.user import User, UserGrade
@@ -23,26 +28,56 @@ from app.models.votes import PlaceVote, RouteVote
 from app.models.vote_enums import VoteType
 from app.models.qna import Question, Answer
 from app.core.security import get_password_hash
+from app.services.itinerary import build_itinerary
+from app.services.route_metrics import compute_route_metrics
+from app.utils.hangul import decompose_jamo
+from bulk_copy import copy_rows, reset_sequence
+
+# 외래키 순서와 무관하게 한 번에 비울 테이블 (TRUNCATE ... CASCADE)
+SEED_MODELS = [
+    Answer, Question, PlaceVote, RouteVote, FavoritePlace, FavoriteRoute,
+    RoutePlaceMap, Route, Place, User, RegionCity, RegionProvince,
+]
+
+
+def copy_models(db: Session, objects) -> int:
+    """
+    같은 모델의 ORM 객체 목록을 INSERT 대신 COPY로 적재합니다.
+    객체에 지정한 컬럼과 파이썬 스칼라 기본값이 있는 컬럼만 적재하고,
+    나머지(created_at 등)는 DB 기본값을 따릅니다.
+    """
+    if not objects:
+        return 0
+    model = type(objects[0])
+    columns = []
+    for attr in sa_inspect(model).column_attrs:
+        column = attr.columns[0]
+        if not isinstance(column, Column) or column.table is not model.__table__:
+            continue  # query_expression 등 실제 컬럼이 아닌 속성
+        default = column.default.arg if column.default is not None and column.default.is_scalar else None
+        if default is not None or any(attr.key in obj.__dict__ for obj in objects):
+            columns.append((attr.key, column.name, default))
+
+    rows = ([obj.__dict__.get(key, default) for key, _, default in columns] for obj in objects)
+    return copy_rows(db.connection(), model.__tablename__, [name for _, name, _ in columns], rows)
+
+
+def reset_sequences(db: Session) -> None:
+    """id를 직접 지정해 적재했으므로 정수 PK 시퀀스를 최댓값 다음으로 맞춥니다."""
+    conn = db.connection()
+    for model in SEED_MODELS:
+        pk = model.__table__.primary_key.columns.values()[0]
+        if pk.autoincrement is True or (pk.autoincrement == "auto" and pk.type.python_type is int):
+            reset_sequence(conn, model.__tablename__, pk.name)
 
 
 def clear_data(db: Session):
-    """기존 데이터를 모두 삭제합니다."""
+    """기존 데이터를 모두 삭제합니다. (TRUNCATE 한 번으로 비우고 id 시퀀스도 1부터 다시 시작)"""
     print("기존 데이터를 삭제하는 중...")
-    
-    # 순서대로 삭제 (외래키 제약 고려)
-    db.query(Answer).delete()
-    db.query(Question).delete()
-    db.query(PlaceVote).delete()
-    db.query(RouteVote).delete()
-    db.query(FavoritePlace).delete()
-    db.query(FavoriteRoute).delete()
-    db.query(RoutePlaceMap).delete()
-    db.query(Route).delete()
-    db.query(Place).delete()
-    db.query(User).delete()
-    db.query(RegionCity).delete()
-    db.query(RegionProvince).delete()
-    
+
+    tables = ", ".join(model.__tablename__ for model in SEED_MODELS)
+    db.execute(text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))
+
     db.commit()
     print("✓ 기존 데이터 삭제 완료")
 
@@ -86,8 +121,8 @@ def create_regions(db: Session):
         RegionCity(region_id="502000", province_id="50", kor_name="서귀포시", eng_name="Seogwipo-si"),
     ]
     
-    db.add_all(provinces)
-    db.add_all(cities)
+    copy_models(db, provinces)
+    copy_models(db, cities)
     db.commit()
     print(f"✓ 지역 데이터 생성 완료: 시/도 {len(provinces)}개, 시/군/구 {len(cities)}개")
 
@@ -186,7 +221,7 @@ def create_users(db: Session):
         ),
     ]
     
-    db.add_all(users)
+    copy_models(db, users)
     db.commit()
     print(f"✓ 사용자 데이터 생성 완료: {len(users)}명")
     return users
@@ -470,7 +505,9 @@ def create_places(db: Session, users):
         ),
     ]
     
-    db.add_all(places)
+    for place in places:
+        place.name_jamo = decompose_jamo(place.name)
+    copy_models(db, places)
     db.commit()
     print(f"✓ 장소 데이터 생성 완료: {len(places)}개")
     return places
@@ -599,7 +636,9 @@ def create_routes(db: Session, users):
         ),
     ]
     
-    db.add_all(routes)
+    for route in routes:
+        route.name_jamo = decompose_jamo(route.name)
+    copy_models(db, routes)
     db.commit()
     print(f"✓ 여행 루트 데이터 생성 완료: {len(routes)}개")
     return routes
@@ -639,7 +678,32 @@ def create_route_place_maps(db: Session, routes, places):
         RoutePlaceMap(route_id=6, place_id=12, order=1, memo="애월 카페거리 투어", transportation=None),
     ]
     
-    db.add_all(mappings)
+    copy_models(db, mappings)
+
+    # 루트 일정 스냅샷과 이동 지표 (crud.route.create 와 동일한 형식)
+    metrics = compute_route_metrics(
+        [
+            (m.route_id, 1, m.order, place_dict[m.place_id].latitude, place_dict[m.place_id].longitude)
+            for m in mappings if m.place_id in place_dict
+        ],
+        {route.route_id: route.tag_move for route in routes},
+    )
+    for route in routes:
+        route_maps = [m for m in mappings if m.route_id == route.route_id]
+        itinerary = build_itinerary(
+            stops=[
+                (m.place_id, place_dict[m.place_id].name, place_dict[m.place_id].type, 1, m.order)
+                for m in route_maps if m.place_id in place_dict
+            ],
+            transports=[(m.transportation, 1, m.order) for m in route_maps],
+        )
+        route_metrics = metrics.get(route.route_id)
+        db.execute(update(Route).where(Route.route_id == route.route_id).values(
+            itinerary=itinerary,
+            total_distance_km=route_metrics["total_distance_km"] if route_metrics else None,
+            travel_minutes=route_metrics["travel_minutes"] if route_metrics else None,
+            day_metrics=route_metrics["days"] if route_metrics else None,
+        ))
     db.commit()
     print(f"✓ 루트-장소 매핑 데이터 생성 완료: {len(mappings)}개")
 
@@ -673,8 +737,8 @@ def create_favorites(db: Session, users, places, routes):
         FavoriteRoute(user_id=4, route_id=3),
     ]
     
-    db.add_all(favorite_places)
-    db.add_all(favorite_routes)
+    copy_models(db, favorite_places)
+    copy_models(db, favorite_routes)
     db.commit()
     print(f"✓ 즐겨찾기 데이터 생성 완료: 장소 {len(favorite_places)}개, 루트 {len(favorite_routes)}개")
 
@@ -720,8 +784,8 @@ def create_votes(db: Session, users, places, routes):
         for user_id, vote_type in user_votes.items():
             route_votes.append(RouteVote(user_id=user_id, route_id=route_id, vote_type=vote_type))
     
-    db.add_all(place_votes)
-    db.add_all(route_votes)
+    copy_models(db, place_votes)
+    copy_models(db, route_votes)
     db.commit()
     print(f"✓ 투표 데이터 생성 완료: 장소 {len(place_votes)}개, 루트 {len(route_votes)}개")
 
@@ -843,14 +907,18 @@ def create_qna(db: Session, users):
         ),
     ]
     
-    db.add_all(questions)
-    db.add_all(answers)
+    copy_models(db, questions)
+    copy_models(db, answers)
     db.commit()
     print(f"✓ Q&A 데이터 생성 완료: 질문 {len(questions)}개, 답변 {len(answers)}개")
 
 
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--snapshot", action="store_true", help="적재 후 템플릿 DB로 스냅샷 저장 (scripts/db_snapshot.py)")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("Loco-BE 더미 데이터 생성 스크립트")
     print("=" * 60)
@@ -878,6 +946,8 @@ def main():
         create_favorites(db, users, places, routes)
         create_votes(db, users, places, routes)
         create_qna(db, users)
+        reset_sequences(db)
+        db.commit()
         
         print("\n" + "=" * 60)
         print("✓ 모든 더미 데이터 생성 완료!")
@@ -895,6 +965,12 @@ def main():
     finally:
         db.close()
 
+    if args.snapshot:
+        from db_snapshot import snapshot_database
+        engine.dispose()  # 템플릿 원본에 남은 연결이 없어야 CREATE DATABASE ... TEMPLATE 가능
+        name = snapshot_database(engine.url)
+        print(f"✓ 스냅샷 저장: {name} (복원: python scripts/db_snapshot.py restore)")
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,28 @@
+# tests/conftest.py
+import pytest
+
+from app.core.query_budget import statement_budget
+
+
+@pytest.fixture
+def query_budget():
+    """
+    엔드포인트별 SQL 문 예산 점검 (app.core.query_budget.statement_budget).
+    블록 안에서 실행된 SQL 문이 예산을 넘으면 가장 느린 문장과 실행 순서를 나열하며 실패합니다.
+
+    사용 예:
+        def test_favorite_routes(client, query_budget):
+            with query_budget(1):
+                resp = client.get("/api/v1/favorites/routes/1")
+            assert resp.status_code == 200
+    """
+    return statement_budget
+
+
+@pytest.fixture(scope="session")
+def client():
+    """lifespan(인덱스 빌드 등) 없이 앱을 호출하는 TestClient. .env 의 DATABASE_URL 데이터베이스를 사용합니다."""
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    return TestClient(app)
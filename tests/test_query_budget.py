@@ -0,0 +1,55 @@
+# tests/test_query_budget.py
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from app.core.query_budget import StatementBudgetExceeded
+
+
+@pytest.fixture
+def sqlite_engine():
+    # TestClient 는 요청을 다른 스레드에서 실행하므로 스레드 간에 같은 메모리 DB 연결을 공유
+    bind = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    yield bind
+    bind.dispose()
+
+
+@pytest.fixture
+def sqlite_client(sqlite_engine):
+    app = FastAPI()
+
+    @app.get("/items/{count}")
+    def run_statements(count: int):
+        with sqlite_engine.connect() as conn:
+            for i in range(count):
+                conn.execute(text(f"SELECT {i}"))
+        return {"count": count}
+
+    return TestClient(app)
+
+
+def test_counts_statements_run_by_test_client(sqlite_client, sqlite_engine, query_budget):
+    with query_budget(3, binds=[sqlite_engine]) as stats:
+        resp = sqlite_client.get("/items/3")
+    assert resp.status_code == 200
+    assert stats.count == 3
+    assert stats.statements == ["SELECT 0", "SELECT 1", "SELECT 2"]
+
+
+def test_fails_with_statements_listed_when_over_budget(sqlite_client, sqlite_engine, query_budget):
+    with pytest.raises(StatementBudgetExceeded) as excinfo:
+        with query_budget(1, binds=[sqlite_engine]):
+            sqlite_client.get("/items/2")
+    message = str(excinfo.value)
+    assert "SQL 문 2개 실행 (예산 1개" in message
+    assert "가장 느린 문장" in message
+    assert "2. SELECT 1" in message
+
+
+def test_statements_outside_block_are_not_counted(sqlite_client, sqlite_engine, query_budget):
+    sqlite_client.get("/items/5")
+    with query_budget(0, binds=[sqlite_engine]) as stats:
+        pass
+    assert stats.count == 0